@@ -18,10 +18,11 @@ from app.models import (
     ProposalVote,
     User,
     UserBadge,
-    RegionalReport
+    RegionalReport,
+    PlatformCounter,
 )
 from app.models.facility import FacilityDemand
-from app.models.budget import SportsbudgetSupport, PerformanceReward
+from app.models.budget import SportsbudgetSupport, PerformanceReward, BudgetPerformance
 from app.models.proposal import ProposalComment
 from app.models.report import ReportRating
 
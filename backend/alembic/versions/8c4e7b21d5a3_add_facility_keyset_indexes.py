@@ -0,0 +1,36 @@
+"""add sportsfacility keyset pagination indexes
+
+Revision ID: 8c4e7b21d5a3
+Revises: 3f1c2a9d4b10
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8c4e7b21d5a3'
+down_revision = '3f1c2a9d4b10'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # 유형 필터(+지역) 목록: (facility_type, region_code, id) 순서 그대로 인덱스 스캔
+    op.create_index(
+        'ix_sportsfacility_type_region_id',
+        'sportsfacility',
+        ['facility_type', 'region_code', 'id'],
+    )
+    # 지역만 필터: region_code 등치 후 (facility_type, id) 순서 스캔
+    op.create_index(
+        'ix_sportsfacility_region_type_id',
+        'sportsfacility',
+        ['region_code', 'facility_type', 'id'],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_sportsfacility_region_type_id', table_name='sportsfacility')
+    op.drop_index('ix_sportsfacility_type_region_id', table_name='sportsfacility')
@@ -0,0 +1,35 @@
+"""add pg_trgm indexes for facility name/address search
+
+Revision ID: a3e7c1d5f9b2
+Revises: f2c6d9a0b4e7
+Create Date: 2026-10-18 19:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a3e7c1d5f9b2'
+down_revision = 'f2c6d9a0b4e7'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # /facilities/search 의 ILIKE '%단어%' 후보 필터. 한글 trigram 은 DB ctype 이
+    # UTF-8 로캘(예: C.UTF-8, ko_KR.UTF-8)이어야 생성된다.
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_sportsfacility_name_trgm "
+        "ON sportsfacility USING GIN (name gin_trgm_ops)"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_sportsfacility_address_trgm "
+        "ON sportsfacility USING GIN (address gin_trgm_ops)"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_sportsfacility_address_trgm")
+    op.execute("DROP INDEX IF EXISTS ix_sportsfacility_name_trgm")
@@ -0,0 +1,30 @@
+"""ensure sportsfacility.location GiST index
+
+Revision ID: b1d93f6e0a27
+Revises: 8c4e7b21d5a3
+Create Date: 2026-10-18 11:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b1d93f6e0a27'
+down_revision = '8c4e7b21d5a3'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # create_all 로 만든 테이블에는 GeoAlchemy2가 같은 이름으로 이미 생성해 둔다.
+    # /facilities/nearby 의 ST_DWithin 과 <-> KNN 정렬이 이 인덱스에 의존한다.
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_sportsfacility_location "
+        "ON sportsfacility USING GIST (location)"
+    )
+
+
+def downgrade() -> None:
+    # 테이블 생성 시점부터 있던 인덱스일 수 있으므로 제거하지 않는다.
+    pass
@@ -0,0 +1,45 @@
+"""add budgetperformance summary table
+
+Revision ID: b7d2f4a8c1e5
+Revises: c4b8e2f6a1d3
+Create Date: 2026-10-18 21:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b7d2f4a8c1e5'
+down_revision = 'c4b8e2f6a1d3'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # 점수 계산이 애플리케이션 쪽이므로 초기 집계는 python -m app.commands.refresh_budget_performance
+    op.create_table(
+        'budgetperformance',
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.Column('year', sa.Integer(), nullable=False),
+        sa.Column('region_code', sa.String(length=10), nullable=False),
+        sa.Column('sport_type', sa.String(length=100), nullable=False),
+        sa.Column('budget_amount', sa.BigInteger(), nullable=False),
+        sa.Column('reward_amount', sa.BigInteger(), nullable=False),
+        sa.Column('budget_rows', sa.Integer(), nullable=False),
+        sa.Column('reward_rows', sa.Integer(), nullable=False),
+        sa.Column('performance_score', sa.Float(), nullable=False),
+        sa.Column('efficiency_ratio', sa.Float(), nullable=True),
+        sa.Column('source_updated_at', sa.DateTime(), nullable=True),
+        sa.UniqueConstraint('year', 'sport_type', 'region_code', name='uq_budgetperformance_key'),
+    )
+    op.create_index('ix_budgetperformance_id', 'budgetperformance', ['id'])
+    op.create_index('ix_budgetperformance_region', 'budgetperformance', ['year', 'region_code'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_budgetperformance_region', table_name='budgetperformance')
+    op.drop_index('ix_budgetperformance_id', table_name='budgetperformance')
+    op.drop_table('budgetperformance')
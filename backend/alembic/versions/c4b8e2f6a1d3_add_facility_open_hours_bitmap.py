@@ -0,0 +1,25 @@
+"""add sportsfacility open_hours_bitmap
+
+Revision ID: c4b8e2f6a1d3
+Revises: a3e7c1d5f9b2
+Create Date: 2026-10-18 20:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c4b8e2f6a1d3'
+down_revision = 'a3e7c1d5f9b2'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # 기존 행은 python -m app.commands.build_open_hours 로 채운다.
+    op.add_column('sportsfacility', sa.Column('open_hours_bitmap', sa.LargeBinary(length=84), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('sportsfacility', 'open_hours_bitmap')
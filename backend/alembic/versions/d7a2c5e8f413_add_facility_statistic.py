@@ -0,0 +1,59 @@
+"""add facilitystatistic summary table
+
+Revision ID: d7a2c5e8f413
+Revises: b1d93f6e0a27
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd7a2c5e8f413'
+down_revision = 'b1d93f6e0a27'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'facilitystatistic',
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.Column('region_code', sa.String(length=10), sa.ForeignKey('region.code'), nullable=False),
+        sa.Column('level', sa.String(length=10), nullable=False),
+        sa.Column('facility_type', sa.String(length=100), nullable=False),
+        sa.Column('is_public', sa.Boolean(), nullable=False),
+        sa.Column('facility_count', sa.Integer(), nullable=False),
+        # (level, region_code) 접두 조회와 갱신 시 행 교체 모두 이 제약의 인덱스를 사용
+        sa.UniqueConstraint('level', 'region_code', 'facility_type', 'is_public', name='uq_facilitystatistic_key'),
+    )
+    op.create_index('ix_facilitystatistic_id', 'facilitystatistic', ['id'])
+
+    # 기존 시설 데이터로 초기 집계
+    op.execute(
+        """
+        INSERT INTO facilitystatistic (region_code, level, facility_type, is_public, facility_count, created_at, updated_at)
+        SELECT f.region_code, 'sigungu', f.facility_type, COALESCE(f.is_public, true), count(*), now(), now()
+        FROM sportsfacility AS f JOIN region AS r ON r.code = f.region_code
+        WHERE r.level = 'sigungu'
+        GROUP BY f.region_code, f.facility_type, COALESCE(f.is_public, true)
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO facilitystatistic (region_code, level, facility_type, is_public, facility_count, created_at, updated_at)
+        SELECT CASE WHEN r.level = 'sido' THEN r.code ELSE r.parent_code END,
+               'sido', f.facility_type, COALESCE(f.is_public, true), count(*), now(), now()
+        FROM sportsfacility AS f JOIN region AS r ON r.code = f.region_code
+        WHERE r.level = 'sido' OR r.parent_code IS NOT NULL
+        GROUP BY 1, f.facility_type, COALESCE(f.is_public, true)
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_facilitystatistic_id', table_name='facilitystatistic')
+    op.drop_table('facilitystatistic')
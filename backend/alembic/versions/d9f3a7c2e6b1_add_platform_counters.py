@@ -0,0 +1,106 @@
+"""add platformcounter table and counting triggers
+
+Revision ID: d9f3a7c2e6b1
+Revises: b7d2f4a8c1e5
+Create Date: 2026-10-18 22:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd9f3a7c2e6b1'
+down_revision = 'b7d2f4a8c1e5'
+branch_labels = None
+depends_on = None
+
+
+# (카운터 이름, 테이블, 갱신 트리거 필요 여부 - is_deleted 로 소프트 삭제하는 테이블)
+COUNTED_TABLES = (
+    ('total_facilities', 'sportsfacility', True),
+    ('total_regions', 'region', False),
+    ('total_proposals', 'proposal', False),
+)
+
+
+def upgrade() -> None:
+    op.create_table(
+        'platformcounter',
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.Column('name', sa.String(length=50), nullable=False, unique=True),
+        sa.Column('value', sa.BigInteger(), nullable=False),
+    )
+    op.create_index('ix_platformcounter_id', 'platformcounter', ['id'])
+
+    # 문장 단위 트리거: 행마다가 아니라 INSERT/UPDATE/DELETE 문 하나당 카운터 행을 한 번만 갱신
+    # (is_deleted = true 인 행은 세지 않음, is_deleted 컬럼이 없는 테이블은 모든 행)
+    op.execute(
+        """
+        CREATE FUNCTION platformcounter_live(rows_json jsonb) RETURNS boolean
+        LANGUAGE sql IMMUTABLE AS $$
+            SELECT NOT COALESCE((rows_json ->> 'is_deleted')::boolean, false)
+        $$;
+
+        CREATE FUNCTION platformcounter_apply() RETURNS trigger
+        LANGUAGE plpgsql AS $$
+        DECLARE
+            delta bigint := 0;
+        BEGIN
+            IF TG_OP IN ('INSERT', 'UPDATE') THEN
+                SELECT delta + count(*) INTO delta FROM new_rows AS r WHERE platformcounter_live(to_jsonb(r));
+            END IF;
+            IF TG_OP IN ('DELETE', 'UPDATE') THEN
+                SELECT delta - count(*) INTO delta FROM old_rows AS r WHERE platformcounter_live(to_jsonb(r));
+            END IF;
+            IF delta <> 0 THEN
+                UPDATE platformcounter SET value = value + delta, updated_at = now() WHERE name = TG_ARGV[0];
+            END IF;
+            RETURN NULL;
+        END
+        $$;
+        """
+    )
+    for name, table, soft_delete in COUNTED_TABLES:
+        op.execute(
+            f"""
+            CREATE TRIGGER {table}_count_insert AFTER INSERT ON "{table}"
+                REFERENCING NEW TABLE AS new_rows
+                FOR EACH STATEMENT EXECUTE FUNCTION platformcounter_apply('{name}');
+            CREATE TRIGGER {table}_count_delete AFTER DELETE ON "{table}"
+                REFERENCING OLD TABLE AS old_rows
+                FOR EACH STATEMENT EXECUTE FUNCTION platformcounter_apply('{name}');
+            """
+        )
+        if soft_delete:
+            op.execute(
+                f"""
+                CREATE TRIGGER {table}_count_update AFTER UPDATE ON "{table}"
+                    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+                    FOR EACH STATEMENT EXECUTE FUNCTION platformcounter_apply('{name}');
+                """
+            )
+
+    # 현재 행 수로 초기화
+    op.execute(
+        """
+        INSERT INTO platformcounter (name, value, created_at, updated_at)
+        SELECT 'total_facilities', count(*), now(), now() FROM sportsfacility WHERE NOT is_deleted
+        UNION ALL SELECT 'total_regions', count(*), now(), now() FROM region
+        UNION ALL SELECT 'total_proposals', count(*), now(), now() FROM proposal
+        """
+    )
+
+
+def downgrade() -> None:
+    for _, table, soft_delete in COUNTED_TABLES:
+        op.execute(f'DROP TRIGGER IF EXISTS {table}_count_insert ON "{table}"')
+        op.execute(f'DROP TRIGGER IF EXISTS {table}_count_delete ON "{table}"')
+        if soft_delete:
+            op.execute(f'DROP TRIGGER IF EXISTS {table}_count_update ON "{table}"')
+    op.execute("DROP FUNCTION IF EXISTS platformcounter_apply()")
+    op.execute("DROP FUNCTION IF EXISTS platformcounter_live(jsonb)")
+    op.drop_index('ix_platformcounter_id', table_name='platformcounter')
+    op.drop_table('platformcounter')
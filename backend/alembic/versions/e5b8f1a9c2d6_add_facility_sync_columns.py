@@ -0,0 +1,29 @@
+"""add sportsfacility content_hash and is_deleted
+
+Revision ID: e5b8f1a9c2d6
+Revises: d7a2c5e8f413
+Create Date: 2026-10-18 13:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e5b8f1a9c2d6'
+down_revision = 'd7a2c5e8f413'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('sportsfacility', sa.Column('content_hash', sa.String(length=32), nullable=True))
+    op.add_column(
+        'sportsfacility',
+        sa.Column('is_deleted', sa.Boolean(), server_default=sa.false(), nullable=False),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('sportsfacility', 'is_deleted')
+    op.drop_column('sportsfacility', 'content_hash')
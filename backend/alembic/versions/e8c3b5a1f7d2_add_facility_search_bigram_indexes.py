@@ -0,0 +1,45 @@
+"""add bigram expression indexes for 2-character facility search terms
+
+Revision ID: e8c3b5a1f7d2
+Revises: d9f3a7c2e6b1
+Create Date: 2026-10-18 23:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e8c3b5a1f7d2'
+down_revision = 'd9f3a7c2e6b1'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # pg_trgm 은 2글자 단어(대부분의 한글 지명/종목명)에서 trigram 을 만들지 못해
+    # ILIKE '%잠실%' 이 GIN 인덱스 전체를 훑는다. 소문자화한 연속 2글자 배열을 GIN 으로
+    # 색인해 /facilities/search 의 2글자 단어를 `text_bigrams(col) @> ARRAY[단어]` 로 거른다.
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION text_bigrams(value text) RETURNS text[]
+        LANGUAGE sql IMMUTABLE PARALLEL SAFE AS $$
+            SELECT coalesce(array_agg(DISTINCT substr(lower(value), i, 2)), '{}')
+            FROM generate_series(1, char_length(value) - 1) AS i
+        $$
+        """
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_sportsfacility_name_bigram "
+        "ON sportsfacility USING GIN (text_bigrams(name))"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_sportsfacility_address_bigram "
+        "ON sportsfacility USING GIN (text_bigrams(address))"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_sportsfacility_address_bigram")
+    op.execute("DROP INDEX IF EXISTS ix_sportsfacility_name_bigram")
+    op.execute("DROP FUNCTION IF EXISTS text_bigrams(text)")
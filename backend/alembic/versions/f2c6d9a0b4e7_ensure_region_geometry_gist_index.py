@@ -0,0 +1,29 @@
+"""ensure region.geometry GiST index
+
+Revision ID: f2c6d9a0b4e7
+Revises: e5b8f1a9c2d6
+Create Date: 2026-10-18 18:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f2c6d9a0b4e7'
+down_revision = 'e5b8f1a9c2d6'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # 좌표 → 행정구역 지정(ST_Covers)이 경계 폴리곤의 이 인덱스에 의존한다.
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_region_geometry "
+        "ON region USING GIST (geometry)"
+    )
+
+
+def downgrade() -> None:
+    # 테이블 생성 시점부터 있던 인덱스일 수 있으므로 제거하지 않는다.
+    pass
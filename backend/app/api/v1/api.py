@@ -1,6 +1,20 @@
 from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
 
 from app.api.v1.endpoints import facilities, reports, proposals, dashboard, auth
+from app.core.cache import principal_cache
+from app.core.hashing import hash_pool
+from app.core.metrics import registry
+from app.services.autocomplete import autocomplete_index
+from app.services.clusters import cluster_index
+from app.services.demand_cube import demand_cube
+from app.services.export import facility_exporter
+from app.services.platform_stats import platform_stats
+from app.services.supply_demand import supply_demand_analyzer
+from app.services.tiles import tile_cache
+from app.core.security import token_cache, used_refresh_tokens
+from app.core.throttle import login_throttle
+from app.db import get_pool_stats
 
 
 api_router = APIRouter()
@@ -34,4 +48,61 @@ api_router.include_router(
 @api_router.get("/health")
 async def health_check():
     """Health check endpoint"""
-    return {"status": "healthy", "message": "스포츠 데이터랩 API 서버가 정상 작동 중입니다."}
\ No newline at end of file
+    return {"status": "healthy", "message": "스포츠 데이터랩 API 서버가 정상 작동 중입니다."}
+
+
+@api_router.get("/health/stats")
+async def health_stats():
+    """내부 캐시/풀 상태 조회 (모니터링용)"""
+    return _component_stats()
+
+
+@api_router.get("/metrics", response_class=PlainTextResponse)
+async def metrics():
+    """Prometheus 텍스트 포맷 메트릭"""
+    return PlainTextResponse(
+        registry.render(), media_type="text/plain; version=0.0.4"
+    )
+
+
+def _component_stats() -> dict:
+    return {
+        "principal_cache": principal_cache.stats(),
+        "token_cache": token_cache.stats(),
+        "refresh_tokens": used_refresh_tokens.stats(),
+        "password_hash_pool": hash_pool.stats(),
+        "login_throttle": login_throttle.stats(),
+        "db_pool": get_pool_stats(),
+        "tile_cache": tile_cache.stats(),
+        "cluster_index": cluster_index.stats(),
+        "autocomplete_index": autocomplete_index.stats(),
+        "demand_cube": demand_cube.stats(),
+        "export_cache": facility_exporter.stats(),
+        "supply_demand": supply_demand_analyzer.stats(),
+        "platform_stats": platform_stats.stats(),
+    }
+
+
+def _collect_component_metrics():
+    """/health/stats의 수치를 Prometheus 게이지로 변환"""
+    for component, stats in _component_stats().items():
+        for key, value in _flatten(stats):
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                yield (
+                    "app_component_stat",
+                    "gauge",
+                    "내부 캐시/풀/요청 제한 상태 (/health/stats)",
+                    {"component": component, "stat": key},
+                    value,
+                )
+
+
+def _flatten(stats: dict, prefix: str = ""):
+    for key, value in stats.items():
+        if isinstance(value, dict):
+            yield from _flatten(value, f"{prefix}{key}_")
+        else:
+            yield f"{prefix}{key}", value
+
+
+registry.add_collector(_collect_component_metrics)
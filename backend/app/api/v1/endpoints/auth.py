@@ -1,15 +1,16 @@
 from datetime import timedelta
 from typing import Any
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.orm import Session
 
-from app.core.deps import get_db, get_current_active_user
-from app.core.security import create_access_token
+from app.core.deps import get_db, get_current_active_user, get_current_principal
+from app.core.security import create_access_token, create_refresh_token, used_refresh_tokens, verify_token
 from app.core.config import settings
+from app.core.throttle import login_throttle
 from app.crud.user import user as user_crud
-from app.schemas.token import Token
+from app.schemas.token import Token, TokenPayload, RefreshTokenRequest
 from app.schemas.user import User, UserCreate, UserUpdate
 from app.models.user import User as UserModel
 
@@ -17,6 +18,33 @@ from app.models.user import User as UserModel
 router = APIRouter()
 
 
+def _issue_tokens(user: UserModel) -> dict:
+    """액세스/리프레시 토큰 발급 (sub는 변경되지 않는 사용자 ID)"""
+    scopes = ["read", "write"]
+    if user.is_verified:
+        scopes.append("verified")
+
+    access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+    access_token = create_access_token(
+        subject=user.id,
+        expires_delta=access_token_expires,
+        claims={
+            "act": bool(user.is_active),
+            "ver": user.token_version or 0,
+            "scopes": scopes,
+        },
+    )
+    refresh_token = create_refresh_token(
+        subject=user.id, token_version=user.token_version or 0
+    )
+
+    return {
+        "access_token": access_token,
+        "token_type": "bearer",
+        "refresh_token": refresh_token,
+    }
+
+
 @router.post("/register", response_model=User, status_code=status.HTTP_201_CREATED)
 def register(
     *,
@@ -49,12 +77,23 @@ def register(
 
 @router.post("/login", response_model=Token)
 def login(
+    request: Request,
     db: Session = Depends(get_db),
     form_data: OAuth2PasswordRequestForm = Depends()
 ) -> Any:
     """
     사용자 로그인 (OAuth2 호환)
     """
+    # DB 조회/비밀번호 검증 전에 시도 횟수 제한
+    client_ip = request.client.host if request.client else None
+    retry_after = login_throttle.hit(client_ip, form_data.username)
+    if retry_after:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="로그인 시도가 너무 많습니다. 잠시 후 다시 시도해주세요",
+            headers={"Retry-After": str(retry_after)},
+        )
+
     user = user_crud.authenticate(
         db, email=form_data.username, password=form_data.password
     )
@@ -70,15 +109,66 @@ def login(
             detail="비활성화된 사용자입니다"
         )
     
-    access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
-    access_token = create_access_token(
-        subject=user.email, expires_delta=access_token_expires
+    login_throttle.reset_account(form_data.username)
+    return _issue_tokens(user)
+
+
+@router.post("/refresh", response_model=Token)
+def refresh_access_token(
+    *,
+    db: Session = Depends(get_db),
+    token_in: RefreshTokenRequest,
+) -> Any:
+    """
+    리프레시 토큰으로 토큰 재발급 (비밀번호 검증 없음)
+
+    제시한 리프레시 토큰은 사용 처리되어 다시 쓸 수 없다. 이미 사용된 토큰이
+    다시 오면 탈취로 보고 해당 사용자의 모든 토큰을 폐기한다.
+    """
+    credentials_exception = HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="리프레시 토큰이 유효하지 않습니다",
+        headers={"WWW-Authenticate": "Bearer"},
     )
-    
-    return {
-        "access_token": access_token,
-        "token_type": "bearer",
-    }
+
+    payload = verify_token(token_in.refresh_token, token_type="refresh")
+    if payload is None or not payload.sub.isdigit() or payload.jti is None:
+        raise credentials_exception
+
+    user = user_crud.get_by_id_cached(db, user_id=payload.user_id)
+    if user is None or user.token_version != payload.ver:
+        raise credentials_exception
+    if not used_refresh_tokens.consume(payload.jti, payload.exp):
+        user_crud.revoke_tokens(db, user_id=user.id)
+        raise credentials_exception
+    if not user_crud.is_active(user):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="비활성화된 사용자입니다"
+        )
+
+    return _issue_tokens(user)
+
+
+@router.post("/logout", status_code=status.HTTP_204_NO_CONTENT)
+def logout(
+    db: Session = Depends(get_db),
+    current_user: UserModel = Depends(get_current_active_user),
+) -> None:
+    """
+    발급된 모든 토큰 폐기 (모든 기기에서 로그아웃)
+    """
+    user_crud.revoke_tokens(db, user_id=current_user.id)
+
+
+@router.get("/session", response_model=TokenPayload)
+def read_session(
+    principal: TokenPayload = Depends(get_current_principal),
+) -> Any:
+    """
+    현재 토큰의 클레임 조회 (DB 조회 없음)
+    """
+    return principal
 
 
 @router.get("/me", response_model=User)
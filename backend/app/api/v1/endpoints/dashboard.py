@@ -1,78 +1,69 @@
 from typing import List, Optional
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, Query, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
 from pydantic import BaseModel
 
+from app.crud.budget_performance import ALL_YEARS, budget_performance as budget_performance_crud
+from app.db import get_async_db
+from app.services.platform_stats import platform_stats
+from app.services.supply_demand import supply_demand_analyzer
+
 
 router = APIRouter()
 
 
 class SupplyDemandData(BaseModel):
-    """수요-공급 분석 데이터 모델"""
+    """수요-공급 분석 데이터 모델 (supply_demand_ratio 1 미만이면 수요 대비 공급 부족, 인구 미상이면 null)"""
     region_code: str
     region_name: str
     facility_type: str
     supply_count: int
     demand_percentage: float
-    supply_demand_ratio: float
-    coordinates: List[float]
+    supply_demand_ratio: Optional[float]
+    coordinates: List[float]  # [경도, 위도], 지역 중심 좌표가 없으면 빈 목록
 
 
 class BudgetPerformanceData(BaseModel):
-    """예산-성과 분석 데이터 모델"""
+    """예산-성과 분석 데이터 모델 (efficiency_ratio 1 초과면 예산 점유율보다 성과 점유율이 큼, 예산 없으면 null)"""
+    year: Optional[int]  # null 이면 전체 연도 합계
     region_code: str
     region_name: str
     sport_type: str
     budget_amount: int
+    reward_amount: int
     performance_score: float
-    efficiency_ratio: float
+    efficiency_ratio: Optional[float]
 
 
 @router.get("/supply-demand", response_model=List[SupplyDemandData])
 async def get_supply_demand_analysis(
     facility_type: Optional[str] = Query(None, description="시설 유형 필터"),
-    region_code: Optional[str] = Query(None, description="지역 코드 필터"),
+    region_code: Optional[str] = Query(None, description="지역 코드 필터 (시/도이면 하위 시/군/구 포함)"),
+    db: AsyncSession = Depends(get_async_db)
 ):
-    """수요-공급 분석 데이터 조회"""
-    # TODO: 실제 데이터베이스에서 조회
-    return [
-        SupplyDemandData(
-            region_code="11140",
-            region_name="서울특별시 중구",
-            facility_type="수영장",
-            supply_count=5,
-            demand_percentage=68.5,
-            supply_demand_ratio=0.7,
-            coordinates=[126.9966, 37.5633]
-        )
-    ]
+    """수요-공급 분석 데이터 조회 (최신 조사 연도 기준, 백그라운드로 갱신되는 워커 메모리 행렬에서 필터)"""
+    rows = await supply_demand_analyzer.get(db, facility_type=facility_type, region_code=region_code)
+    return [SupplyDemandData(**row) for row in rows]
 
 
 @router.get("/budget-performance", response_model=List[BudgetPerformanceData])
 async def get_budget_performance_analysis(
-    sport_type: Optional[str] = Query(None, description="종목 필터"),
-    region_code: Optional[str] = Query(None, description="지역 코드 필터"),
+    sport_type: Optional[str] = Query(None, description="종목 필터 ('전체' 이면 종목 합계)"),
+    region_code: Optional[str] = Query(None, description="지역 코드 필터 ('00' 이면 전국)"),
+    year: Optional[int] = Query(None, description="연도 (생략 시 전체 연도 합계)"),
+    db: AsyncSession = Depends(get_async_db)
 ):
-    """예산-성과 분석 데이터 조회"""
-    # TODO: 실제 데이터베이스에서 조회
+    """예산-성과 분석 데이터 조회 (budgetperformance 집계 테이블 조회)"""
+    rows = await budget_performance_crud.get_rows(
+        db, year=year or ALL_YEARS, sport_type=sport_type, region_code=region_code
+    )
     return [
-        BudgetPerformanceData(
-            region_code="11140",
-            region_name="서울특별시 중구",
-            sport_type="양궁",
-            budget_amount=100000000,
-            performance_score=85.2,
-            efficiency_ratio=1.2
-        )
+        BudgetPerformanceData(**{**row._asdict(), "year": row.year or None})
+        for row in rows
     ]
 
 
 @router.get("/stats")
-async def get_dashboard_stats():
-    """대시보드 통계 데이터 조회"""
-    # TODO: 실제 통계 계산
-    return {
-        "total_facilities": 12543,
-        "total_regions": 229,
-        "total_proposals": 1847,
-        "active_users": 3521
-    }
\ No newline at end of file
+async def get_dashboard_stats(db: AsyncSession = Depends(get_async_db)):
+    """대시보드 통계 데이터 조회 (트리거로 유지되는 카운터 + 최근 활성 사용자 근사치)"""
+    return await platform_stats.get(db)
\ No newline at end of file
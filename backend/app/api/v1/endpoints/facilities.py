@@ -1,13 +1,27 @@
+from datetime import datetime
 from typing import List, Optional
-from fastapi import APIRouter, Query, Depends
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Query, Path, Depends, HTTPException, Request, Response, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 from pydantic import BaseModel
 
-from app.db import get_db
+from app.crud.facility import InvalidCursor, facility as facility_crud
+from app.crud.statistics import facility_statistic as facility_statistic_crud
+from app.core.config import settings
+from app.db import AsyncSessionLocal, get_async_db
+from app.services.autocomplete import autocomplete_index
+from app.services.clusters import cluster_index
+from app.services.demand_cube import DEMOGRAPHICS, DIMENSIONS, OVERALL, demand_cube
+from app.services.export import GZIP_FORMATS, MEDIA_TYPES, accepts_gzip, facility_exporter, format_available
+from app.core.opening_hours import current_week_slot, week_slot
+from app.services.tiles import tile_cache
 
 
 router = APIRouter()
 
+MVT_MEDIA_TYPE = "application/vnd.mapbox-vector-tile"
+
 
 class FacilityResponse(BaseModel):
     """체육시설 응답 모델"""
@@ -23,62 +37,346 @@ class FacilityResponse(BaseModel):
     is_public: bool
 
 
-class FacilityDemandResponse(BaseModel):
-    """시설 수요 응답 모델"""
-    region_code: str
-    region_name: str
+class NearbyFacilityResponse(FacilityResponse):
+    """주변 체육시설 응답 모델"""
+    distance_m: float
+
+
+class SearchFacilityResponse(FacilityResponse):
+    """시설 검색 응답 모델"""
+    score: float
+
+
+class AutocompleteResponse(BaseModel):
+    """시설명 자동완성 응답 모델"""
+    id: int
+    name: str
     facility_type: str
+    region_code: str
+
+
+class ClusterResponse(BaseModel):
+    """시설 클러스터 응답 모델 (count == 1 이면 개별 시설)"""
+    lat: float
+    lng: float
+    count: int
+    facility_id: Optional[int]
+
+
+class FacilityDemandResponse(BaseModel):
+    """시설 수요 응답 모델 (group_by 로 고른 차원만 포함, 수요 비율은 그룹 평균)"""
+    region_code: Optional[str] = None
+    region_name: Optional[str] = None
+    facility_type: Optional[str] = None
+    survey_year: Optional[int] = None
+    age_group: Optional[str] = None
+    gender: Optional[str] = None
+    occupation: Optional[str] = None
+    income_level: Optional[str] = None
     demand_percentage: float
-    survey_year: int
+    min_percentage: float
+    max_percentage: float
+    rows: int
+
+
+def _open_slot(open_now: bool, open_at: Optional[datetime]) -> Optional[int]:
+    """운영시간 필터 → 주간 비트 번호 (필터 없으면 None)"""
+    if open_at is not None:
+        return week_slot(open_at)
+    if open_now:
+        return current_week_slot()
+    return None
 
 
 @router.get("/", response_model=List[FacilityResponse])
 async def get_facilities(
+    response: Response,
     facility_type: Optional[str] = Query(None, description="시설 유형 필터"),
     region_code: Optional[str] = Query(None, description="지역 코드 필터"),
-    limit: int = Query(100, le=1000, description="결과 개수 제한"),
-    offset: int = Query(0, ge=0, description="결과 시작 위치"),
-    db: Session = Depends(get_db)
+    limit: int = Query(100, ge=1, le=1000, description="결과 개수 제한"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 X-Next-Cursor 값"),
+    open_now: bool = Query(False, description="지금 운영 중인 시설만"),
+    open_at: Optional[datetime] = Query(None, description="이 시각에 운영 중인 시설만 (예: 2026-10-17T19:00, 시각대 생략 시 한국 시각)"),
+    db: AsyncSession = Depends(get_async_db)
 ):
-    """체육시설 목록 조회"""
-    # TODO: 실제 데이터베이스 쿼리 구현
-    return [
-        FacilityResponse(
-            facility_code="FAC001",
-            name="서울시민수영장",
-            facility_type="수영장",
-            address="서울특별시 중구 세종대로 110",
-            latitude=37.5665,
-            longitude=126.9780,
-            region_code="11140",
-            region_name="서울특별시 중구",
-            operator="서울특별시",
-            is_public=True
+    """체육시설 목록 조회 (키셋 페이지네이션)
+
+    (facility_type, region_code, id) 순으로 정렬하며, 다음 페이지가 있으면
+    `X-Next-Cursor` 헤더로 커서를 돌려준다.
+    """
+    try:
+        rows, next_cursor = await facility_crud.get_page(
+            db,
+            facility_type=facility_type,
+            region_code=region_code,
+            limit=limit,
+            cursor=cursor,
+            open_slot=_open_slot(open_now, open_at),
+        )
+    except InvalidCursor:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="유효하지 않은 커서입니다"
+        )
+
+    if next_cursor is not None:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return [FacilityResponse.model_validate(row, from_attributes=True) for row in rows]
+
+
+@router.get("/export", response_class=StreamingResponse)
+async def export_facilities(
+    request: Request,
+    export_format: str = Query("csv", alias="format", pattern="^(csv|geojson|parquet)$", description="csv, geojson, parquet"),
+    facility_type: Optional[str] = Query(None, description="시설 유형 필터"),
+    region_code: Optional[str] = Query(None, description="지역 코드 필터"),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """전체 체육시설 내보내기 (스트리밍, 같은 필터/데이터 버전의 결과는 파일 캐시)
+
+    CSV/GeoJSON 은 Accept-Encoding 에 gzip 이 있으면 gzip 으로 보낸다.
+    """
+    if not format_available(export_format):
+        raise HTTPException(
+            status_code=status.HTTP_501_NOT_IMPLEMENTED,
+            detail="parquet 내보내기에는 서버에 pyarrow 설치가 필요합니다"
+        )
+
+    filters = {"facility_type": facility_type, "region_code": region_code}
+    data_version = await facility_crud.get_data_version(db)
+    await db.close()  # 스트리밍은 별도 세션으로 하므로 커넥션을 먼저 반납
+    key = facility_exporter.artifact_key(export_format, filters, data_version)
+
+    gzip_response = export_format in GZIP_FORMATS and accepts_gzip(request.headers.get("accept-encoding"))
+    etag = f'"{key}-gzip"' if gzip_response else f'"{key}"'
+    headers = {
+        "Content-Disposition": f'attachment; filename="facilities.{export_format}"',
+        "ETag": etag,
+        "Vary": "Accept-Encoding",
+    }
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    if gzip_response:
+        headers["Content-Encoding"] = "gzip"
+
+    path = facility_exporter.cached_path(export_format, key)
+    if path is not None:
+        decompress = export_format in GZIP_FORMATS and not gzip_response
+        return StreamingResponse(
+            facility_exporter.read_cached(path, decompress),
+            media_type=MEDIA_TYPES[export_format],
+            headers=headers,
+        )
+
+    async def batches():
+        async with AsyncSessionLocal() as session:
+            async for rows in facility_crud.iter_export(
+                session, batch_size=settings.EXPORT_BATCH_SIZE, **filters
+            ):
+                yield rows
+
+    return StreamingResponse(
+        facility_exporter.stream(export_format, key, batches(), gzip_response),
+        media_type=MEDIA_TYPES[export_format],
+        headers=headers,
+    )
+
+
+@router.get("/nearby", response_model=List[NearbyFacilityResponse])
+async def get_nearby_facilities(
+    lat: float = Query(..., ge=-90, le=90, description="기준 위도"),
+    lng: float = Query(..., ge=-180, le=180, description="기준 경도"),
+    radius: float = Query(5000, gt=0, le=50000, description="검색 반경(m)"),
+    facility_type: Optional[str] = Query(None, description="시설 유형 필터"),
+    k: int = Query(10, ge=1, le=100, description="최대 결과 수"),
+    open_now: bool = Query(False, description="지금 운영 중인 시설만"),
+    open_at: Optional[datetime] = Query(None, description="이 시각에 운영 중인 시설만 (시각대 생략 시 한국 시각)"),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """가까운 체육시설 조회 (거리 오름차순, distance_m 단위 미터)"""
+    rows = await facility_crud.get_nearby(
+        db, lat=lat, lng=lng, radius_m=radius, k=k, facility_type=facility_type,
+        open_slot=_open_slot(open_now, open_at),
+    )
+    return [NearbyFacilityResponse.model_validate(row, from_attributes=True) for row in rows]
+
+
+@router.get("/search", response_model=List[SearchFacilityResponse])
+async def search_facilities(
+    q: str = Query(..., min_length=1, max_length=100, description="검색어 (예: 잠실 수영장)"),
+    facility_type: Optional[str] = Query(None, description="시설 유형 필터"),
+    region_code: Optional[str] = Query(None, description="지역 코드 필터"),
+    limit: int = Query(20, ge=1, le=100, description="결과 개수 제한"),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """시설 이름/주소 검색 (모든 단어 포함, 관련도 내림차순)"""
+    if not q.split():
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="검색어를 입력해주세요"
         )
+    rows = await facility_crud.search(
+        db, q=q, facility_type=facility_type, region_code=region_code, limit=limit
+    )
+    return [SearchFacilityResponse.model_validate(row, from_attributes=True) for row in rows]
+
+
+@router.get("/autocomplete", response_model=List[AutocompleteResponse])
+async def autocomplete_facilities(
+    q: str = Query(..., min_length=1, max_length=50, description="입력 중인 시설명"),
+    facility_type: Optional[str] = Query(None, description="시설 유형 필터"),
+    limit: int = Query(10, ge=1, le=20, description="결과 개수 제한"),
+):
+    """시설명 자동완성 (워커 메모리 인덱스, DB 조회 없음)"""
+    if not autocomplete_index.ready:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="자동완성 인덱스를 준비 중입니다",
+            headers={"Retry-After": "5"},
+        )
+    return [
+        AutocompleteResponse(id=facility_id, name=name, facility_type=suggestion_type, region_code=region_code)
+        for facility_id, name, suggestion_type, region_code in autocomplete_index.query(q, limit, facility_type)
     ]
 
 
-@router.get("/demand", response_model=List[FacilityDemandResponse])
+@router.get(
+    "/tiles/{z}/{x}/{y}.mvt",
+    response_class=Response,
+    responses={200: {"content": {MVT_MEDIA_TYPE: {}}}},
+)
+async def get_facility_tile(
+    z: int = Path(..., ge=0, description="줌 레벨"),
+    x: int = Path(..., ge=0),
+    y: int = Path(..., ge=0),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """체육시설 벡터 타일 (레이어 'facilities', 속성 id/facility_type/is_public)"""
+    if z > tile_cache.max_zoom or x >= 2 ** z or y >= 2 ** z:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="존재하지 않는 타일입니다"
+        )
+
+    key = (z, x, y)
+    data = tile_cache.get_memory(key)
+    if data is None:
+        data = await run_in_threadpool(tile_cache.get_disk, key)
+    if data is None:
+        generation = tile_cache.generation
+        data = await facility_crud.get_tile(db, z, x, y)
+        await run_in_threadpool(tile_cache.store, key, data, generation)
+
+    return Response(
+        content=data,
+        media_type=MVT_MEDIA_TYPE,
+        headers={"Cache-Control": "public, max-age=60"},
+    )
+
+
+@router.get("/clusters", response_model=List[ClusterResponse])
+async def get_facility_clusters(
+    bbox: str = Query(..., description="min_lng,min_lat,max_lng,max_lat"),
+    zoom: int = Query(..., ge=0, le=22, description="지도 줌 레벨"),
+    facility_type: Optional[str] = Query(None, description="시설 유형 필터"),
+):
+    """지도 영역의 시설 클러스터 조회 (워커 메모리 인덱스, DB 조회 없음)"""
+    try:
+        min_lng, min_lat, max_lng, max_lat = (float(value) for value in bbox.split(","))
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="bbox 형식은 min_lng,min_lat,max_lng,max_lat 입니다"
+        )
+    if not cluster_index.ready:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="클러스터 인덱스를 준비 중입니다",
+            headers={"Retry-After": "5"},
+        )
+    return cluster_index.query((min_lng, min_lat, max_lng, max_lat), zoom, facility_type)
+
+
+def _demand_filters(**values) -> dict:
+    """생략한 필터는 빼고, 인구통계 차원의 '전체'는 NULL(전체 응답 행)로"""
+    return {
+        dim: None if dim in DEMOGRAPHICS and value == OVERALL else value
+        for dim, value in values.items()
+        if value is not None
+    }
+
+
+def _dimensions(value: str) -> List[str]:
+    dims = [dim.strip() for dim in value.split(",") if dim.strip()]
+    unknown = [dim for dim in dims if dim not in DIMENSIONS]
+    if unknown or len(set(dims)) != len(dims):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"사용할 수 있는 차원: {', '.join(DIMENSIONS)}"
+        )
+    return dims
+
+
+def _require_demand_cube() -> None:
+    if not demand_cube.ready:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="수요 데이터를 준비 중입니다",
+            headers={"Retry-After": "5"},
+        )
+
+
+@router.get(
+    "/demand",
+    response_model=List[FacilityDemandResponse],
+    response_model_exclude_unset=True,
+)
 async def get_facility_demand(
+    group_by: str = Query("region_code,facility_type,survey_year", description="묶을 차원 (쉼표 구분)"),
     facility_type: Optional[str] = Query(None, description="시설 유형 필터"),
     region_code: Optional[str] = Query(None, description="지역 코드 필터"),
-    db: Session = Depends(get_db)
+    survey_year: Optional[int] = Query(None, description="조사 연도 필터"),
+    age_group: Optional[str] = Query(None, description="연령대 필터 ('전체': 전체 응답 행)"),
+    gender: Optional[str] = Query(None, description="성별 필터 ('전체': 전체 응답 행)"),
+    occupation: Optional[str] = Query(None, description="직업군 필터 ('전체': 전체 응답 행)"),
+    income_level: Optional[str] = Query(None, description="소득수준 필터 ('전체': 전체 응답 행)"),
 ):
-    """시설 수요 데이터 조회"""
-    # TODO: 실제 데이터베이스 쿼리 구현
-    return [
-        FacilityDemandResponse(
-            region_code="11140",
-            region_name="서울특별시 중구",
-            facility_type="수영장",
-            demand_percentage=68.5,
-            survey_year=2023
+    """시설 수요 데이터 조회 (워커 메모리 큐브, 차원별 평균 수요 비율)"""
+    dims = _dimensions(group_by)
+    _require_demand_cube()
+    filters = _demand_filters(
+        facility_type=facility_type, region_code=region_code, survey_year=survey_year,
+        age_group=age_group, gender=gender, occupation=occupation, income_level=income_level,
+    )
+    return [FacilityDemandResponse(**row) for row in demand_cube.group_by(dims, filters)]
+
+
+@router.get("/demand/pivot")
+async def get_facility_demand_pivot(
+    rows: str = Query("region_code", description="행 차원 (쉼표 구분)"),
+    columns: str = Query("age_group", description="열 차원"),
+    facility_type: Optional[str] = Query(None, description="시설 유형 필터"),
+    region_code: Optional[str] = Query(None, description="지역 코드 필터"),
+    survey_year: Optional[int] = Query(None, description="조사 연도 필터"),
+    gender: Optional[str] = Query(None, description="성별 필터 ('전체': 전체 응답 행)"),
+):
+    """시설 수요 피벗 표 (행 차원 × 열 차원 평균 수요 비율, 없는 조합은 null)"""
+    row_dims = _dimensions(rows)
+    column_dims = _dimensions(columns)
+    if len(column_dims) != 1 or column_dims[0] in row_dims:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="열 차원은 행 차원과 다른 하나의 차원이어야 합니다"
         )
-    ]
+    _require_demand_cube()
+    filters = _demand_filters(
+        facility_type=facility_type, region_code=region_code, survey_year=survey_year, gender=gender,
+    )
+    return demand_cube.pivot(row_dims, column_dims[0], filters)
 
 
 @router.get("/types")
-async def get_facility_types(db: Session = Depends(get_db)):
+async def get_facility_types(db: AsyncSession = Depends(get_async_db)):
     """사용 가능한 시설 유형 목록 조회"""
     # TODO: 실제 데이터베이스에서 시설 유형 목록 조회
     return {
@@ -91,24 +389,14 @@ async def get_facility_types(db: Session = Depends(get_db)):
 
 @router.get("/statistics")
 async def get_facility_statistics(
-    region_code: Optional[str] = Query(None, description="지역 코드 필터"),
-    db: Session = Depends(get_db)
+    region_code: Optional[str] = Query(None, description="지역 코드 필터 (시/도 또는 시/군/구)"),
+    db: AsyncSession = Depends(get_async_db)
 ):
-    """시설 통계 조회"""
-    # TODO: 실제 통계 계산
-    return {
-        "total_facilities": 12543,
-        "public_facilities": 8765,
-        "private_facilities": 3778,
-        "by_type": {
-            "체육관": 2341,
-            "수영장": 876,
-            "테니스장": 1456,
-            "축구장": 987
-        },
-        "by_region_top5": [
-            {"region_name": "서울특별시", "count": 2341},
-            {"region_name": "부산광역시", "count": 1876},
-            {"region_name": "대구광역시", "count": 1234}
-        ]
-    }
\ No newline at end of file
+    """시설 통계 조회 (facilitystatistic 집계 테이블 조회)"""
+    summary = await facility_statistic_crud.get_summary(db, region_code)
+    if summary is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="존재하지 않는 지역 코드입니다"
+        )
+    return summary
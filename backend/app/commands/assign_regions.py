@@ -0,0 +1,52 @@
+"""시설 region_code 를 좌표가 속한 행정구역 경계로 일괄 재지정
+
+region.geometry 경계가 바뀌었거나 원천 행정구역 코드가 잘못된 시설을 바로잡는다.
+바뀐 지역의 시설 집계(facilitystatistic)를 갱신하고 REDIS_URL 이 있으면 변경 내역을
+API 워커에 전파한다.
+
+    python -m app.commands.assign_regions --dry-run   # 불일치만 보고
+    python -m app.commands.assign_regions
+"""
+import argparse
+import asyncio
+import time
+
+from app.crud.statistics import facility_statistic as facility_statistic_crud
+from app.db.database import AsyncSessionLocal, async_engine
+from app.services.facility_changes import publish_changeset
+from app.services.region_assign import RegionAssignReport, assign_facility_regions
+
+
+async def run(args) -> RegionAssignReport:
+    try:
+        async with AsyncSessionLocal() as db:
+            report = await assign_facility_regions(db, dry_run=args.dry_run, sample_size=args.samples)
+            if report.changeset.regions:
+                await facility_statistic_crud.refresh(db, report.changeset.regions)
+            await db.commit()
+        publish_changeset(report.changeset)
+    finally:
+        await async_engine.dispose()
+    return report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="좌표 기반 행정구역 일괄 지정")
+    parser.add_argument("--dry-run", action="store_true", help="갱신하지 않고 불일치만 보고")
+    parser.add_argument("--samples", type=int, default=20, help="출력할 불일치 예시 수")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    report = asyncio.run(run(args))
+
+    print(f"facilities     : {report.total}")
+    print(f"mismatched     : {report.mismatched}")
+    print(f"unlocated      : {report.unlocated}")
+    print(f"updated        : {report.updated}")
+    print(f"elapsed        : {time.perf_counter() - started:.2f}s")
+    for facility_code, old_code, new_code in report.samples:
+        print(f"  {facility_code}: {old_code} -> {new_code or '(경계 밖)'}")
+
+
+if __name__ == "__main__":
+    main()
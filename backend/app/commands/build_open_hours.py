@@ -0,0 +1,59 @@
+"""sportsfacility.opening_hours → open_hours_bitmap 일괄 계산
+
+ORM 으로 opening_hours 를 저장하면 비트맵이 함께 갱신되므로, 이 명령은 컬럼 추가 직후
+기존 행을 채우거나 해석 규칙(app.core.opening_hours)을 바꾼 뒤 다시 계산할 때 쓴다.
+
+    python -m app.commands.build_open_hours --batch-size 5000
+"""
+import argparse
+import asyncio
+import time
+
+from sqlalchemy import bindparam, select, update
+
+from app.db.database import AsyncSessionLocal, async_engine
+from app.models.facility import SportsFacility
+from app.core.opening_hours import build_bitmap
+
+
+async def run(batch_size: int) -> None:
+    started = time.perf_counter()
+    total = parsed = 0
+    last_id = 0
+    statement = (
+        update(SportsFacility.__table__)
+        .where(SportsFacility.__table__.c.id == bindparam("facility_id"))
+        .values(open_hours_bitmap=bindparam("bitmap"))
+    )
+    async with AsyncSessionLocal() as db:
+        while True:
+            rows = (await db.execute(
+                select(SportsFacility.id, SportsFacility.opening_hours)
+                .where(SportsFacility.id > last_id)
+                .order_by(SportsFacility.id)
+                .limit(batch_size)
+            )).all()
+            if not rows:
+                break
+            params = [{"facility_id": row.id, "bitmap": build_bitmap(row.opening_hours)} for row in rows]
+            await db.execute(statement, params)
+            await db.commit()
+            total += len(params)
+            parsed += sum(1 for item in params if item["bitmap"] is not None)
+            last_id = rows[-1].id
+    await async_engine.dispose()
+    print(f"facilities : {total}")
+    print(f"parsed     : {parsed}")
+    print(f"unknown    : {total - parsed}")
+    print(f"elapsed    : {time.perf_counter() - started:.2f}s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="운영시간 비트맵 일괄 계산")
+    parser.add_argument("--batch-size", type=int, default=5000)
+    args = parser.parse_args()
+    asyncio.run(run(args.batch_size))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,181 @@
+"""사용자 일괄 등록 명령
+
+CSV 또는 JSONL 파일의 UserCreate 행을 배치 단위로 검증하고, 비밀번호를 프로세스
+풀에서 병렬 해시한 뒤 COPY(PostgreSQL) 또는 multi-row INSERT로 적재한다.
+
+    python -m app.commands.import_users users.csv --batch-size 1000 --workers 8
+
+CSV의 목록 컬럼(interested_regions 등)은 `|` 로 구분한다.
+"""
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Iterator, List, Optional, Set, Tuple
+
+from pydantic import ValidationError
+from sqlalchemy.exc import IntegrityError
+
+from app.core.security import hash_passwords
+from app.crud.user import user as user_crud
+from app.db.database import SessionLocal
+from app.schemas.user import UserCreate
+
+
+LIST_FIELDS = ("interested_regions", "interested_sports", "interested_facility_types")
+
+
+@dataclass
+class ImportReport:
+    """일괄 등록 결과"""
+    total: int = 0
+    inserted: int = 0
+    errors: List[Tuple[int, str]] = field(default_factory=list)  # (행 번호, 사유)
+    elapsed: float = 0.0
+
+    @property
+    def rows_per_sec(self) -> float:
+        return self.inserted / self.elapsed if self.elapsed else 0.0
+
+
+def _read_rows(path: str) -> Iterator[Tuple[int, dict]]:
+    """(행 번호, 원본 dict) 스트리밍"""
+    if path.endswith(".jsonl"):
+        with open(path, encoding="utf-8") as fp:
+            for line_no, line in enumerate(fp, start=1):
+                if line.strip():
+                    yield line_no, json.loads(line)
+        return
+
+    with open(path, encoding="utf-8-sig", newline="") as fp:
+        # 헤더가 1행이므로 데이터는 2행부터
+        for line_no, row in enumerate(csv.DictReader(fp), start=2):
+            for name in LIST_FIELDS:
+                if row.get(name):
+                    row[name] = [item.strip() for item in row[name].split("|") if item.strip()]
+                else:
+                    row.pop(name, None)
+            yield line_no, {key: value for key, value in row.items() if value != ""}
+
+
+def _batches(rows: Iterator[Tuple[int, dict]], size: int) -> Iterator[List[Tuple[int, dict]]]:
+    batch: List[Tuple[int, dict]] = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _insert(db, report: ImportReport, accepted: List[Tuple[int, UserCreate]], hashed: List[str]) -> None:
+    """일괄 적재. 제약 위반이면 반으로 나눠 다시 시도해 위반한 행만 오류로 남김"""
+    try:
+        report.inserted += user_crud.bulk_create(db, [user_in for _, user_in in accepted], hashed)
+        return
+    except IntegrityError as exc:
+        db.rollback()
+        if len(accepted) == 1:
+            report.errors.append((accepted[0][0], f"적재 실패: {exc.orig}"))
+            return
+    middle = len(accepted) // 2
+    _insert(db, report, accepted[:middle], hashed[:middle])
+    _insert(db, report, accepted[middle:], hashed[middle:])
+
+
+def import_users(
+    path: str,
+    batch_size: int = 1000,
+    workers: Optional[int] = None,
+    dry_run: bool = False,
+) -> ImportReport:
+    """파일의 사용자 행을 일괄 등록"""
+    report = ImportReport()
+    seen_emails: Set[str] = set()
+    seen_usernames: Set[str] = set()
+    started = time.perf_counter()
+
+    db = SessionLocal()
+    executor = ProcessPoolExecutor(max_workers=workers or os.cpu_count())
+    try:
+        for batch in _batches(_read_rows(path), batch_size):
+            report.total += len(batch)
+
+            # 1) 스키마 검증 + 파일 내 중복 제거
+            valid: List[Tuple[int, UserCreate]] = []
+            for line_no, raw in batch:
+                try:
+                    user_in = UserCreate(**raw)
+                except ValidationError as exc:
+                    error = exc.errors()[0]
+                    location = ".".join(str(part) for part in error["loc"])
+                    report.errors.append((line_no, f"{location}: {error['msg']}"))
+                    continue
+                if user_in.email in seen_emails:
+                    report.errors.append((line_no, "파일 내 중복 이메일"))
+                    continue
+                if user_in.username in seen_usernames:
+                    report.errors.append((line_no, "파일 내 중복 사용자명"))
+                    continue
+                seen_emails.add(user_in.email)
+                seen_usernames.add(user_in.username)
+                valid.append((line_no, user_in))
+
+            # 2) DB 중복/지역 코드 확인 (배치당 집합 쿼리 3회)
+            existing_emails = user_crud.get_existing_emails(db, [u.email for _, u in valid])
+            existing_usernames = user_crud.get_existing_usernames(db, [u.username for _, u in valid])
+            known_regions = user_crud.get_existing_region_codes(
+                db, {u.region_code for _, u in valid if u.region_code}
+            )
+            accepted: List[Tuple[int, UserCreate]] = []
+            for line_no, user_in in valid:
+                if user_in.email in existing_emails:
+                    report.errors.append((line_no, "이미 등록된 이메일입니다"))
+                elif user_in.username in existing_usernames:
+                    report.errors.append((line_no, "이미 사용 중인 사용자명입니다"))
+                elif user_in.region_code and user_in.region_code not in known_regions:
+                    report.errors.append((line_no, "존재하지 않는 지역 코드입니다"))
+                else:
+                    accepted.append((line_no, user_in))
+
+            if not accepted or dry_run:
+                continue
+
+            # 3) 비밀번호 병렬 해시 후 일괄 적재
+            chunksize = max(1, len(accepted) // ((workers or os.cpu_count() or 1) * 4))
+            hashed = hash_passwords([u.password for _, u in accepted], executor, chunksize)
+            # 검증 이후 다른 경로로 등록된 행 등과 충돌하면 해당 행만 실패 처리
+            _insert(db, report, accepted, hashed)
+    finally:
+        executor.shutdown()
+        db.close()
+
+    report.elapsed = time.perf_counter() - started
+    return report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="사용자 일괄 등록 (CSV/JSONL)")
+    parser.add_argument("path", help="UserCreate 필드를 가진 .csv 또는 .jsonl 파일")
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--workers", type=int, default=None, help="해시 프로세스 수 (기본: CPU 수)")
+    parser.add_argument("--dry-run", action="store_true", help="검증과 중복 확인만 수행")
+    args = parser.parse_args()
+
+    report = import_users(args.path, args.batch_size, args.workers, args.dry_run)
+
+    for line_no, reason in report.errors:
+        print(f"line {line_no}: {reason}", file=sys.stderr)
+    print(f"total    : {report.total}")
+    print(f"inserted : {report.inserted}")
+    print(f"errors   : {len(report.errors)}")
+    print(f"elapsed  : {report.elapsed:.2f}s ({report.rows_per_sec:.0f} rows/sec)")
+
+
+if __name__ == "__main__":
+    main()
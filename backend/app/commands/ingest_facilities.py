@@ -0,0 +1,104 @@
+"""전국공공체육시설 API 동기화 명령
+
+API 전 페이지를 동시에 받아 바뀐 시설만 sportsfacility 에 반영하고, 사라진 시설은
+is_deleted 로 표시한다. 변경 내역(changeset)으로 변경 지역의 시설 집계
+(facilitystatistic)와 변경 좌표의 벡터 타일 캐시를 갱신하고, REDIS_URL 이 있으면
+API 워커에도 전파한다.
+
+    python -m app.commands.ingest_facilities --concurrency 8 --page-size 1000 --batch-size 5000
+    python -m app.commands.ingest_facilities --url http://127.0.0.1:9000/facilities  # 스텁 서버
+    python -m app.commands.ingest_facilities --changeset-out changes.json
+"""
+import argparse
+import asyncio
+import json
+
+import httpx
+
+from app.core.config import settings
+from app.crud.statistics import facility_statistic as facility_statistic_crud
+from app.db.database import AsyncSessionLocal, async_engine
+from app.services.facility_changes import publish_changeset
+from app.services.facility_ingest import (
+    FacilityApiClient,
+    IngestReport,
+    default_api_url,
+    ingest_facilities,
+)
+from app.services.tiles import tile_cache
+
+
+async def run(args) -> IngestReport:
+    timeout = httpx.Timeout(args.timeout, connect=5.0)
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    try:
+        async with httpx.AsyncClient(timeout=timeout, limits=limits) as client:
+            api = FacilityApiClient(
+                client,
+                url=args.url or default_api_url(),
+                api_key=settings.DATA_GO_KR_API_KEY,
+                page_size=args.page_size,
+                concurrency=args.concurrency,
+                max_retries=args.max_retries,
+            )
+            report = await ingest_facilities(
+                async_engine,
+                api,
+                batch_size=args.batch_size,
+                max_pages=args.max_pages,
+                sync_deletes=not args.no_deletes,
+                max_delete_ratio=args.max_delete_ratio,
+            )
+
+        changeset = report.changeset
+        if changeset.regions:
+            async with AsyncSessionLocal() as db:
+                await facility_statistic_crud.refresh(db, changeset.regions)
+                await db.commit()
+        if changeset.points:
+            await asyncio.to_thread(tile_cache.invalidate_points, changeset.points)
+        publish_changeset(changeset)
+        if args.changeset_out:
+            with open(args.changeset_out, "w", encoding="utf-8") as fp:
+                json.dump(changeset.to_dict(), fp)
+    finally:
+        await async_engine.dispose()
+    return report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="전국공공체육시설 API 적재")
+    parser.add_argument("--url", default=None, help="API URL (기본: DATA_GO_KR_BASE_URL + FACILITY_API_PATH)")
+    parser.add_argument("--page-size", type=int, default=settings.FACILITY_INGEST_PAGE_SIZE)
+    parser.add_argument("--concurrency", type=int, default=settings.FACILITY_INGEST_CONCURRENCY)
+    parser.add_argument("--batch-size", type=int, default=settings.FACILITY_INGEST_BATCH_SIZE)
+    parser.add_argument("--max-retries", type=int, default=settings.FACILITY_INGEST_MAX_RETRIES)
+    parser.add_argument("--max-pages", type=int, default=None, help="시험 적재용 페이지 수 제한")
+    parser.add_argument("--timeout", type=float, default=30.0, help="요청 타임아웃(초)")
+    parser.add_argument("--no-deletes", action="store_true", help="사라진 시설 soft-delete 생략")
+    parser.add_argument(
+        "--max-delete-ratio", type=float, default=0.1,
+        help="활성 시설 대비 이 비율을 넘게 사라지면 soft-delete 보류 (원천 장애 대비)",
+    )
+    parser.add_argument("--changeset-out", default=None, help="변경 내역 JSON 저장 경로")
+    args = parser.parse_args()
+
+    report = asyncio.run(run(args))
+
+    print(f"pages          : {report.pages}")
+    print(f"fetched        : {report.fetched}")
+    print(f"added          : {len(report.changeset.added)}")
+    print(f"changed        : {len(report.changeset.changed)}")
+    print(f"removed        : {len(report.changeset.removed)}")
+    print(f"unchanged      : {report.unchanged}")
+    if report.deletes_skipped:
+        print(f"deletes held   : {report.deletes_skipped} (exceeds --max-delete-ratio)")
+    print(f"invalid        : {report.invalid}")
+    print(f"unknown region : {report.skipped_region}")
+    print(f"region fixed   : {report.region_mismatches}")
+    print(f"retries        : {report.retries}")
+    print(f"elapsed        : {report.elapsed:.2f}s ({report.rows_per_sec:.0f} rows/sec)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""워커 기동 시간 프로파일
+
+새 인터프리터에서 `python -X importtime -c "import main"` 을 실행해 누적 import
+시간이 큰 모듈을 출력하고, 프레임워크(FRAMEWORK_MODULES) import 시간과 그 뒤의
+앱 자체 import main + create_application() 소요 시간, 기동 시점에 로드된 지연 대상
+모듈(DEFERRED_MODULES)을 함께 보여준다.
+
+    python -m app.commands.profile_startup --top 25
+"""
+import argparse
+import os
+import subprocess
+import sys
+from typing import List, Tuple
+
+from app.core.config import settings
+from app.core.lazy import DEFERRED_MODULES
+
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# 앱 코드와 무관하게 드는 인터프리터/프레임워크 import (기동 시간 예산에서 제외)
+FRAMEWORK_MODULES = (
+    "pydantic",
+    "fastapi",
+    "sqlalchemy",
+    "sqlalchemy.orm",
+    "sqlalchemy.ext.asyncio",
+    "geoalchemy2",
+    "uvicorn",
+    "asyncpg",
+    "psycopg2",
+)
+
+_MEASURE_SCRIPT = f"""
+import importlib, sys, time
+baseline_started = time.perf_counter()
+for name in {FRAMEWORK_MODULES!r}:
+    importlib.import_module(name)
+started = time.perf_counter()
+import main
+imported = time.perf_counter()
+main.create_application()
+created = time.perf_counter()
+print(round((started - baseline_started) * 1000, 1))
+print(round((imported - started) * 1000, 1))
+print(round((created - imported) * 1000, 1))
+print(",".join(name for name in sys.argv[1:] if name in sys.modules))
+"""
+
+
+def _parse_importtime(stderr: str) -> List[Tuple[int, int, str]]:
+    """(누적 µs, 자체 µs, 모듈명) 목록"""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line.split(":", 1)[1].split("|")
+        rows.append((int(cumulative_us), int(self_us), name.rstrip()))
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="워커 기동 시간 프로파일")
+    parser.add_argument("--top", type=int, default=20, help="출력할 모듈 수")
+    args = parser.parse_args()
+
+    profile = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import main"],
+        cwd=BACKEND_DIR, capture_output=True, text=True,
+    )
+    if profile.returncode != 0:
+        print(profile.stderr, file=sys.stderr)
+        sys.exit(profile.returncode)
+
+    rows = sorted(_parse_importtime(profile.stderr), reverse=True)
+    print(f"{'cumulative':>12} {'self':>10}  module")
+    for cumulative_us, self_us, name in rows[:args.top]:
+        print(f"{cumulative_us / 1000:>10.1f}ms {self_us / 1000:>8.1f}ms {name}")
+
+    measure = subprocess.run(
+        [sys.executable, "-c", _MEASURE_SCRIPT, *DEFERRED_MODULES],
+        cwd=BACKEND_DIR, capture_output=True, text=True, check=True,
+    )
+    baseline_ms, import_ms, create_ms, loaded = measure.stdout.split("\n")[:4]
+    app_ms = float(import_ms) + float(create_ms)
+    print()
+    print(f"framework imports     : {baseline_ms}ms")
+    print(f"import main (app)     : {import_ms}ms")
+    print(f"create_application()  : {create_ms}ms")
+    print(f"app total / budget    : {app_ms:.1f}ms / {settings.STARTUP_TIME_BUDGET_MS}ms")
+    print(f"deferred modules loaded at startup: {loaded or '-'}")
+
+
+if __name__ == "__main__":
+    main()
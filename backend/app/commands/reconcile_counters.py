@@ -0,0 +1,35 @@
+"""플랫폼 카운터(platformcounter)를 실제 COUNT 로 대조/교정
+
+    python -m app.commands.reconcile_counters
+
+API 서버도 COUNTER_RECONCILE_SECONDS 마다 같은 대조를 수행한다. 트리거를 끄고
+대량 적재했거나 TRUNCATE 한 뒤 바로 맞출 때 사용한다.
+"""
+import asyncio
+import time
+
+from app.db.database import AsyncSessionLocal, async_engine
+from app.services.platform_stats import platform_stats
+
+
+async def run() -> None:
+    started = time.perf_counter()
+    async with AsyncSessionLocal() as db:
+        drift = await platform_stats.reconcile(db)
+    await async_engine.dispose()
+    if drift is None:
+        print("skipped: another reconciliation holds the lock")
+    else:
+        for name, (stored, actual) in drift.items():
+            print(f"{name:<16}: {stored} -> {actual}")
+        if not drift:
+            print("counters in sync")
+    print(f"elapsed         : {time.perf_counter() - started:.2f}s")
+
+
+def main() -> None:
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""예산-성과 집계 테이블(budgetperformance) 재계산
+
+    python -m app.commands.refresh_budget_performance              # 원본이 바뀐 연도만
+    python -m app.commands.refresh_budget_performance 2022 2023    # 지정한 연도
+    python -m app.commands.refresh_budget_performance --all        # 전체 연도
+
+예산(sportsbudgetsupport)/성과금(performancereward) 적재 후 실행한다.
+"""
+import argparse
+import asyncio
+import time
+
+from sqlalchemy import select, union
+
+from app.crud.budget_performance import budget_performance as budget_performance_crud
+from app.db.database import AsyncSessionLocal, async_engine
+from app.models.budget import BudgetPerformance, PerformanceReward, SportsbudgetSupport
+
+
+async def run(years, refresh_all: bool) -> None:
+    started = time.perf_counter()
+    async with AsyncSessionLocal() as db:
+        if refresh_all:
+            result = await db.execute(union(
+                select(SportsbudgetSupport.support_year),
+                select(PerformanceReward.award_year),
+                select(BudgetPerformance.year),
+            ))
+            years = list(result.scalars())
+        refreshed = await budget_performance_crud.refresh(db, years or None)
+        await db.commit()
+    await async_engine.dispose()
+    print(f"years     : {', '.join(map(str, refreshed)) or 'up to date'}")
+    print(f"elapsed   : {time.perf_counter() - started:.2f}s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="예산-성과 집계 테이블 재계산")
+    parser.add_argument("years", nargs="*", type=int, help="다시 계산할 연도 (생략 시 변경 감지)")
+    parser.add_argument("--all", action="store_true", help="전체 연도 다시 계산")
+    args = parser.parse_args()
+    asyncio.run(run(args.years, args.all))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,31 @@
+"""시설 집계 테이블(facilitystatistic) 재계산
+
+    python -m app.commands.refresh_statistics                 # 전체
+    python -m app.commands.refresh_statistics 11140 26110     # 해당 지역과 상위 시/도만
+"""
+import argparse
+import asyncio
+import time
+
+from app.crud.statistics import facility_statistic as facility_statistic_crud
+from app.db.database import AsyncSessionLocal, async_engine
+
+
+async def run(region_codes) -> None:
+    started = time.perf_counter()
+    async with AsyncSessionLocal() as db:
+        await facility_statistic_crud.refresh(db, region_codes or None)
+        await db.commit()
+    await async_engine.dispose()
+    print(f"refreshed in {time.perf_counter() - started:.2f}s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="시설 집계 테이블 재계산")
+    parser.add_argument("region_codes", nargs="*", help="변경된 시설의 region_code (생략 시 전체)")
+    args = parser.parse_args()
+    asyncio.run(run(args.region_codes))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+import hashlib
+import logging
+import math
+import threading
+import time
+from typing import Dict, Iterable, Optional, Set
+
+from .cache import get_redis
+from .config import settings
+
+
+logger = logging.getLogger(__name__)
+
+
+class HyperLogLog:
+    """고유 값 수 근사 (레지스터 2^precision 바이트, 표준 오차 약 1.04 / sqrt(2^precision))"""
+
+    def __init__(self, precision: int = 12):
+        self.precision = precision
+        self.registers = bytearray(1 << precision)
+
+    def add(self, value) -> None:
+        digest = int.from_bytes(hashlib.blake2b(str(value).encode("utf-8"), digest_size=8).digest(), "big")
+        index = digest >> (64 - self.precision)
+        rest_bits = 64 - self.precision
+        rest = digest & ((1 << rest_bits) - 1)
+        rank = rest_bits - rest.bit_length() + 1
+        if rank > self.registers[index]:
+            self.registers[index] = rank
+
+    def merge(self, other: "HyperLogLog") -> None:
+        self.registers = bytearray(map(max, self.registers, other.registers))
+
+    def count(self) -> int:
+        size = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / size)
+        estimate = alpha * size * size / sum(2.0 ** -register for register in self.registers)
+        zeros = self.registers.count(0)
+        if estimate <= 2.5 * size and zeros:
+            # 작은 값 구간은 빈 레지스터 비율(linear counting)이 더 정확
+            estimate = size * math.log(size / zeros)
+        return int(round(estimate))
+
+
+class ActiveUserCounter:
+    """최근 window 동안의 활성 사용자 수 (HyperLogLog 근사)
+
+    시간을 bucket 단위로 나눠 버킷마다 HyperLogLog 에 사용자 id 를 넣고, 최근 버킷들을
+    합쳐 센다(구간은 bucket 단위로 밀려남). REDIS_URL 이 설정되면 Redis PFADD/PFCOUNT
+    (워커 간 공유), 아니면 워커 로컬 HyperLogLog 를 쓴다. 같은 버킷에서 이미 기록한
+    사용자는 워커 안에서 걸러 요청마다 Redis 를 호출하지 않는다.
+    """
+
+    key_prefix = "active_users:"
+
+    def __init__(self, window: int, bucket: int, max_seen: int = 100000):
+        self.window = window
+        self.bucket = bucket
+        self.max_seen = max_seen
+        self._lock = threading.Lock()
+        self._seen_bucket: Optional[int] = None
+        self._seen: Set[str] = set()
+        self._local: Dict[int, HyperLogLog] = {}
+        self.recorded = 0
+
+    @property
+    def buckets(self) -> int:
+        return max(1, math.ceil(self.window / self.bucket))
+
+    def _bucket_ids(self, now: float) -> Iterable[int]:
+        current = int(now // self.bucket)
+        return range(current - self.buckets + 1, current + 1)
+
+    def record(self, user_id) -> None:
+        """사용자 활동 기록"""
+        now = time.time()
+        bucket = int(now // self.bucket)
+        member = str(user_id)
+        with self._lock:
+            if bucket != self._seen_bucket or len(self._seen) >= self.max_seen:
+                self._seen_bucket = bucket
+                self._seen = set()
+                oldest = bucket - self.buckets + 1
+                for stale in [key for key in self._local if key < oldest]:
+                    del self._local[stale]
+            if member in self._seen:
+                return
+            self._seen.add(member)
+            self._local.setdefault(bucket, HyperLogLog()).add(member)
+            self.recorded += 1
+
+        client = get_redis()
+        if client is None:
+            return
+        try:
+            key = f"{self.key_prefix}{bucket}"
+            pipe = client.pipeline()
+            pipe.pfadd(key, member)
+            pipe.expire(key, self.window + self.bucket)
+            pipe.execute()
+        except Exception as exc:
+            logger.warning("active user redis pfadd failed: %s", exc)
+
+    def count(self) -> int:
+        """최근 window 동안의 고유 사용자 수 (근사)"""
+        bucket_ids = list(self._bucket_ids(time.time()))
+        client = get_redis()
+        if client is not None:
+            try:
+                return int(client.pfcount(*(f"{self.key_prefix}{bucket}" for bucket in bucket_ids)))
+            except Exception as exc:
+                logger.warning("active user redis pfcount failed, using local count: %s", exc)
+
+        merged = HyperLogLog()
+        with self._lock:
+            for bucket in bucket_ids:
+                if bucket in self._local:
+                    merged.merge(self._local[bucket])
+        return merged.count()
+
+    def stats(self) -> Dict[str, object]:
+        """기록 상태 (모니터링용)"""
+        return {
+            "window_seconds": self.window,
+            "bucket_seconds": self.bucket,
+            "recorded": self.recorded,
+            "local_buckets": len(self._local),
+            "shared": settings.REDIS_URL is not None,
+        }
+
+
+active_users = ActiveUserCounter(
+    window=settings.ACTIVE_USERS_WINDOW_SECONDS,
+    bucket=settings.ACTIVE_USERS_BUCKET_SECONDS,
+)
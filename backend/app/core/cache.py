@@ -0,0 +1,206 @@
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional
+
+from .config import settings
+
+
+logger = logging.getLogger(__name__)
+
+_redis_client = None
+_redis_lock = threading.Lock()
+
+
+def get_redis():
+    """REDIS_URL이 설정된 경우 공유 Redis 클라이언트 반환 (없으면 None)"""
+    global _redis_client
+    if not settings.REDIS_URL:
+        return None
+    if _redis_client is None:
+        with _redis_lock:
+            if _redis_client is None:
+                import redis
+
+                _redis_client = redis.Redis.from_url(
+                    settings.REDIS_URL,
+                    decode_responses=True,
+                    socket_timeout=0.5,
+                    socket_connect_timeout=0.5,
+                )
+    return _redis_client
+
+
+class TTLCache:
+    """크기 제한(LRU)과 만료 시간(TTL)을 가진 스레드 안전 인메모리 캐시"""
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """만료되지 않은 값 반환 (없으면 None)"""
+        now = time.monotonic()
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                self.misses += 1
+                return None
+            value, expires_at = item
+            if expires_at <= now:
+                del self._data[key]
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """값 저장 (ttl 미지정 시 기본 TTL 사용)"""
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._data[key] = (value, expires_at)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key: Hashable) -> None:
+        """항목 제거"""
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """전체 항목 제거"""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def stats(self) -> Dict[str, int]:
+        """적중/미적중 통계"""
+        return {
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+class PrincipalCache:
+    """인증 사용자(principal) 캐시
+
+    워커별 TTLCache를 1차로, REDIS_URL이 설정된 경우 Redis를 공유 2차 캐시로 사용한다.
+    무효화 시 Redis 키를 지우고 pub/sub으로 다른 워커의 로컬 캐시도 함께 비운다.
+    Redis 장애 시에는 로컬 캐시만으로 동작한다.
+    """
+
+    key_prefix = "principal:"
+    channel = "principal:invalidate"
+
+    def __init__(self, maxsize: int, ttl: float, redis_ttl: int):
+        self.local = TTLCache(maxsize=maxsize, ttl=ttl)
+        self.redis_ttl = redis_ttl
+        self.redis_hits = 0
+        self.invalidations = 0
+        self._listener = None
+        self._listener_lock = threading.Lock()
+
+    def _redis(self):
+        client = get_redis()
+        if client is not None and self._listener is None:
+            self._start_listener(client)
+        return client
+
+    def _start_listener(self, client) -> None:
+        with self._listener_lock:
+            if self._listener is not None:
+                return
+            try:
+                pubsub = client.pubsub(ignore_subscribe_messages=True)
+                pubsub.subscribe(**{self.channel: self._on_invalidate})
+                self._listener = pubsub.run_in_thread(sleep_time=1.0, daemon=True)
+            except Exception as exc:  # Redis 미가동 시 로컬 캐시만 사용
+                logger.warning("principal cache listener disabled: %s", exc)
+
+    def _on_invalidate(self, message: dict) -> None:
+        self.local.pop(message["data"])
+
+    def get(self, subject: str) -> Optional[dict]:
+        """subject에 해당하는 principal 데이터 조회"""
+        data = self.local.get(subject)
+        if data is not None:
+            return data
+
+        client = self._redis()
+        if client is None:
+            return None
+        try:
+            raw = client.get(self.key_prefix + subject)
+        except Exception as exc:
+            logger.warning("principal cache redis get failed: %s", exc)
+            return None
+        if raw is None:
+            return None
+
+        data = json.loads(raw)
+        self.redis_hits += 1
+        self.local.set(subject, data)
+        return data
+
+    def set(self, subject: str, data: dict) -> None:
+        """principal 데이터 저장 (JSON 직렬화 가능한 dict)"""
+        self.local.set(subject, data)
+        client = self._redis()
+        if client is None:
+            return
+        try:
+            client.set(self.key_prefix + subject, json.dumps(data), ex=self.redis_ttl)
+        except Exception as exc:
+            logger.warning("principal cache redis set failed: %s", exc)
+
+    def invalidate(self, subject: str) -> None:
+        """subject의 캐시를 모든 워커에서 무효화"""
+        self.invalidations += 1
+        self.local.pop(subject)
+        client = self._redis()
+        if client is None:
+            return
+        try:
+            pipe = client.pipeline()
+            pipe.delete(self.key_prefix + subject)
+            pipe.publish(self.channel, subject)
+            pipe.execute()
+        except Exception as exc:
+            logger.warning("principal cache redis invalidate failed: %s", exc)
+
+    def clear(self) -> None:
+        """로컬 캐시 전체 비우기"""
+        self.local.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """적중/미적중 통계"""
+        local = self.local.stats()
+        return {
+            "size": local["size"],
+            "maxsize": local["maxsize"],
+            "local_hits": local["hits"],
+            "redis_hits": self.redis_hits,
+            # 로컬 미적중 중 Redis에서 찾은 경우를 제외한 실제 DB 조회 수
+            "misses": local["misses"] - self.redis_hits,
+            "invalidations": self.invalidations,
+            "shared": settings.REDIS_URL is not None,
+        }
+
+
+principal_cache = PrincipalCache(
+    maxsize=settings.PRINCIPAL_CACHE_MAXSIZE,
+    ttl=settings.PRINCIPAL_CACHE_TTL_SECONDS,
+    redis_ttl=settings.PRINCIPAL_CACHE_REDIS_TTL_SECONDS,
+)
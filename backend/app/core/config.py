@@ -1,5 +1,5 @@
 from typing import List, Union, Optional
-from pydantic import AnyHttpUrl, BaseSettings, validator
+from pydantic import AnyHttpUrl, validator
 from pydantic_settings import BaseSettings
 import secrets
 
@@ -9,10 +9,24 @@ class Settings(BaseSettings):
     SECRET_KEY: str = secrets.token_urlsafe(32)
     PROJECT_NAME: str = "스포츠 데이터랩 API"
     PROJECT_VERSION: str = "1.0.0"
+    STARTUP_TIME_BUDGET_MS: int = 300  # 프레임워크 import 를 뺀 앱 자체 import main + create_application() 허용 시간
     
     # JWT Authentication
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
+    REFRESH_TOKEN_EXPIRE_DAYS: int = 14
+    TOKEN_CACHE_MAXSIZE: int = 10000  # 검증 완료 토큰 캐시 크기
+
+    # Login throttling (슬라이딩 윈도우)
+    LOGIN_RATE_LIMIT_PER_ACCOUNT: int = 10
+    LOGIN_RATE_LIMIT_PER_IP: int = 50
+    LOGIN_RATE_LIMIT_WINDOW_SECONDS: int = 300
+
+    # Password hashing (bcrypt 전용 프로세스 풀)
+    BCRYPT_ROUNDS: int = 12
+    PASSWORD_HASH_WORKERS: int = 2
+    PASSWORD_HASH_QUEUE_LIMIT: int = 4  # 워커 수를 초과해 대기할 수 있는 요청 수 (대기 중에도 스레드풀 스레드 사용)
+    PASSWORD_HASH_RETRY_AFTER: int = 1  # 대기열 초과 시 Retry-After (초)
 
     # CORS
     BACKEND_CORS_ORIGINS: List[AnyHttpUrl] = [
@@ -41,12 +55,74 @@ class Settings(BaseSettings):
             return v
         return f"postgresql://{values.get('POSTGRES_USER')}:{values.get('POSTGRES_PASSWORD')}@{values.get('POSTGRES_SERVER')}/{values.get('POSTGRES_DB')}"
 
+    # 비동기 엔드포인트용 asyncpg 드라이버 URL (미지정 시 DATABASE_URL에서 유도)
+    ASYNC_DATABASE_URL: Optional[str] = None
+
+    @validator("ASYNC_DATABASE_URL", pre=True)
+    def assemble_async_db_connection(cls, v: Optional[str], values: dict) -> str:
+        if isinstance(v, str):
+            return v
+        sync_url = values.get("DATABASE_URL") or ""
+        scheme, _, rest = sync_url.partition("://")
+        return f"postgresql+asyncpg://{rest}" if scheme.startswith("postgres") else sync_url
+
+    # Connection pool (워커당)
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_TIMEOUT: int = 30
+    DB_PGBOUNCER: bool = False  # PgBouncer transaction 모드 경유 시 True
+
     # External APIs
     DATA_GO_KR_API_KEY: Optional[str] = None
     DATA_GO_KR_BASE_URL: str = "http://apis.data.go.kr/1192000"
+    FACILITY_API_PATH: str = "/PublicSportsFacility/getPublicSportsFacilityList"  # 전국공공체육시설
+
+    # Facility ingestion (python -m app.commands.ingest_facilities)
+    FACILITY_INGEST_PAGE_SIZE: int = 1000
+    FACILITY_INGEST_CONCURRENCY: int = 8
+    FACILITY_INGEST_BATCH_SIZE: int = 5000
+    FACILITY_INGEST_MAX_RETRIES: int = 5
+    # 증분 반영 시 watermark 이전으로 다시 읽는 구간 (watermark 보다 늦게 커밋된 변경 누락 방지)
+    FACILITY_CHANGE_OVERLAP_SECONDS: int = 300
 
     # Cache
     REDIS_URL: Optional[str] = None
+    PRINCIPAL_CACHE_MAXSIZE: int = 10000
+    PRINCIPAL_CACHE_TTL_SECONDS: int = 60  # 워커 로컬 캐시 TTL
+    PRINCIPAL_CACHE_REDIS_TTL_SECONDS: int = 300  # Redis 공유 캐시 TTL
+
+    # Vector tiles (/facilities/tiles/{z}/{x}/{y}.mvt)
+    TILE_CACHE_VERSION: int = 1  # 타일 속성/스타일 변경 시 올려 전체 캐시 무효화
+    TILE_CACHE_DIR: str = ".cache/tiles"  # 빈 값이면 디스크 캐시 사용 안 함
+    TILE_CACHE_MEMORY_TILES: int = 2048
+    TILE_CACHE_TTL_SECONDS: int = 86400  # 메모리/디스크 타일 공통 최대 보관 시간 (변경 알림 밖의 시설 변경 반영 한도)
+    TILE_MAX_ZOOM: int = 20
+
+    # Facility cluster index (/facilities/clusters)
+    CLUSTER_MAX_ZOOM: int = 16  # 초과 줌에서는 개별 시설 반환
+    CLUSTER_INDEX_REFRESH_SECONDS: int = 60  # 변경 시설 증분 반영 주기
+
+    # Facility name autocomplete index (/facilities/autocomplete)
+    AUTOCOMPLETE_REFRESH_SECONDS: int = 60  # 변경 알림 누락 대비 증분 반영 주기
+
+    # Facility opening hours (open_now / open_at 필터)
+    FACILITY_TIMEZONE: str = "Asia/Seoul"
+
+    # Facility export (/facilities/export)
+    EXPORT_CACHE_DIR: str = ".cache/exports"  # 빈 값이면 결과 파일을 캐시하지 않음
+    EXPORT_CACHE_MAX_FILES: int = 50  # 초과 시 오래된 결과부터 삭제
+    EXPORT_BATCH_SIZE: int = 2000  # 서버 측 커서에서 한 번에 가져올 행 수
+
+    # Facility demand cube (/facilities/demand)
+    DEMAND_CUBE_REFRESH_SECONDS: int = 300  # facilitydemand 변경 확인 주기
+
+    # Dashboard supply-demand matrix (/dashboard/supply-demand)
+    SUPPLY_DEMAND_REFRESH_SECONDS: int = 300  # 시설/수요/지역 데이터 버전 확인 주기
+
+    # Dashboard platform stats (/dashboard/stats)
+    COUNTER_RECONCILE_SECONDS: int = 3600  # 트리거 카운터와 실제 COUNT 대조 주기
+    ACTIVE_USERS_WINDOW_SECONDS: int = 86400  # 활성 사용자 집계 구간
+    ACTIVE_USERS_BUCKET_SECONDS: int = 3600  # 구간을 나누는 단위 (구간이 이 단위로 밀려남)
 
     class Config:
         case_sensitive = True
@@ -1,46 +1,62 @@
-from typing import Generator
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.orm import Session
 
-from app.db.database import SessionLocal
+from app.db.database import get_db
+from app.core.activity import active_users
 from app.core.security import verify_token
 from app.crud.user import user as user_crud
 from app.models.user import User
+from app.schemas.token import TokenPayload
 
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl=f"api/v1/auth/login")
 
 
-def get_db() -> Generator:
-    """데이터베이스 세션 의존성"""
-    try:
-        db = SessionLocal()
-        yield db
-    finally:
-        db.close()
+def _credentials_exception() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="인증 정보를 확인할 수 없습니다",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
+
+def get_token_payload(token: str = Depends(oauth2_scheme)) -> TokenPayload:
+    """액세스 토큰 검증 후 클레임 반환"""
+    payload = verify_token(token)
+    if payload is None or not payload.sub.isdigit():
+        raise _credentials_exception()
+    active_users.record(payload.user_id)
+    return payload
+
+
+def get_current_principal(payload: TokenPayload = Depends(get_token_payload)) -> TokenPayload:
+    """토큰 클레임만 신뢰하는 경량 인증 (읽기 전용 엔드포인트용, DB 조회 없음)
+
+    폐기(token_version 증가)는 토큰 만료 시까지 반영되지 않으므로
+    쓰기 작업에는 get_current_active_user를 사용한다.
+    """
+    if not payload.act:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="비활성화된 사용자입니다"
+        )
+    return payload
 
 
 def get_current_user(
     db: Session = Depends(get_db),
-    token: str = Depends(oauth2_scheme)
+    payload: TokenPayload = Depends(get_token_payload)
 ) -> User:
     """현재 사용자 가져오기"""
-    credentials_exception = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="인증 정보를 확인할 수 없습니다",
-        headers={"WWW-Authenticate": "Bearer"},
-    )
-    
-    # 토큰 검증
-    token_data = verify_token(token)
-    if token_data is None:
-        raise credentials_exception
-    
-    # 사용자 조회
-    user = user_crud.get_by_email(db, email=token_data)
+    # 사용자 조회 (principal 캐시 우선)
+    user = user_crud.get_by_id_cached(db, user_id=payload.user_id)
     if user is None:
-        raise credentials_exception
+        raise _credentials_exception()
+
+    # 폐기된 토큰 확인
+    if user.token_version != payload.ver:
+        raise _credentials_exception()
     
     return user
 
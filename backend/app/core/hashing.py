@@ -0,0 +1,109 @@
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Optional
+
+from fastapi import HTTPException, status
+
+from .config import settings
+
+
+# Starlette 가 동기 라우트/의존성을 실행하는 스레드풀 크기 (anyio 기본 limiter)
+THREADPOOL_TOKENS = 40
+# 해시 대기로 붙잡을 수 있는 스레드풀 스레드 비율 상한
+THREADPOOL_SHARE = 0.25
+
+
+class HashingPoolBusy(HTTPException):
+    """해시 대기열이 가득 찼을 때 발생 (503 + Retry-After)"""
+
+    def __init__(self, retry_after: int):
+        super().__init__(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="요청이 많아 잠시 후 다시 시도해주세요",
+            headers={"Retry-After": str(retry_after)},
+        )
+
+
+class PasswordHashPool:
+    """bcrypt 연산 전용 프로세스 풀
+
+    동시에 처리 중이거나 대기 중인 작업 수를 `max_workers + queue_limit` 으로
+    제한하고, 한도를 넘는 요청은 기다리지 않고 즉시 HashingPoolBusy 로 거절한다.
+    호출 스레드는 결과가 나올 때까지 블로킹되므로 동기 라우트에서 사용한다.
+
+    대기 중인 요청도 스레드풀 스레드를 하나씩 붙잡고 있으므로, 로그인이 몰려도
+    다른 동기 라우트가 굶지 않도록 허용 수는 스레드풀의 THREADPOOL_SHARE 이하로 자른다.
+    """
+
+    def __init__(
+        self,
+        max_workers: int,
+        queue_limit: int,
+        retry_after: int = 1,
+        threadpool_tokens: int = THREADPOOL_TOKENS,
+    ):
+        self.max_workers = max_workers
+        self.queue_limit = queue_limit
+        self.retry_after = retry_after
+        self.admission_limit = max(1, min(max_workers + queue_limit, int(threadpool_tokens * THREADPOOL_SHARE)))
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(self.admission_limit)
+        self._in_flight = 0
+        self._completed = 0
+        self._rejected = 0
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    # 멀티스레드 서버 프로세스에서 fork 하지 않도록 spawn 사용
+                    self._executor = ProcessPoolExecutor(
+                        max_workers=self.max_workers,
+                        mp_context=multiprocessing.get_context("spawn"),
+                    )
+        return self._executor
+
+    def run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """풀에서 fn(*args) 실행 후 결과 반환"""
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self._rejected += 1
+            raise HashingPoolBusy(self.retry_after)
+
+        with self._lock:
+            self._in_flight += 1
+        try:
+            return self._get_executor().submit(fn, *args).result()
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+                self._completed += 1
+            self._slots.release()
+
+    def shutdown(self) -> None:
+        """워커 프로세스 종료"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def stats(self) -> dict:
+        """풀 상태 (모니터링용)"""
+        with self._lock:
+            return {
+                "max_workers": self.max_workers,
+                "queue_limit": self.queue_limit,
+                "admission_limit": self.admission_limit,
+                "in_flight": self._in_flight,
+                "completed": self._completed,
+                "rejected": self._rejected,
+            }
+
+
+hash_pool = PasswordHashPool(
+    max_workers=settings.PASSWORD_HASH_WORKERS,
+    queue_limit=settings.PASSWORD_HASH_QUEUE_LIMIT,
+    retry_after=settings.PASSWORD_HASH_RETRY_AFTER,
+)
@@ -0,0 +1,31 @@
+import importlib
+import importlib.util
+import sys
+from types import ModuleType
+
+# 워커 기동(import main) 시점에 로드되면 안 되는 모듈 (tests/test_startup.py에서 확인)
+DEFERRED_MODULES = ("pandas", "numpy", "openpyxl", "pyarrow", "shapely", "httpx")
+
+
+def lazy_import(name: str) -> ModuleType:
+    """첫 속성 접근 시점에 실제로 import 되는 모듈 반환
+
+    pandas/numpy 같은 분석 스택이나 지오메트리 라이브러리처럼 import 비용이 큰
+    모듈을 모듈 최상단에서 참조하되, 워커 기동 시간에는 포함되지 않게 할 때 사용한다.
+
+        np = lazy_import("numpy")
+    """
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        raise ModuleNotFoundError(f"No module named {name!r}", name=name)
+
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
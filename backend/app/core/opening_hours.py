@@ -0,0 +1,187 @@
+"""운영시간(opening_hours JSON) → 주간 비트맵
+
+한 주를 7일 × 96칸(15분)으로 나눠 672비트(84바이트)로 저장한다. 비트 번호는
+요일(월=0) × 96 + 하루 중 15분 칸이며, PostgreSQL get_bit(bytea, n) 과 같은 순서
+(바이트 n // 8 의 하위 n % 8 번째 비트)로 채워 SQL 에서 바로 검사할 수 있다.
+
+운영시간 JSON 은 형식이 제각각이므로 흔한 형태를 받아들인다.
+
+    {"평일": "06:00-22:00", "토": "08:00~18:00", "일": "휴무"}
+    {"mon": ["09:00-12:00", "13:00-18:00"], "weekend": {"open": "10:00", "close": "16:00"}}
+    [{"day": "월-금", "open": "06:00", "close": "22:00"}]
+    "매일 06:00-22:00" / "24시간"
+
+요일 묶음(평일/주말/매일)보다 개별 요일 지정이 우선하고, 자정을 넘는 구간은 다음
+날로 이어진다. 해석할 수 있는 내용이 없으면 None(운영시간 미상)이다.
+"""
+import re
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+from zoneinfo import ZoneInfo
+
+from app.core.config import settings
+
+
+SLOT_MINUTES = 15
+SLOTS_PER_DAY = 24 * 60 // SLOT_MINUTES
+WEEK_SLOTS = 7 * SLOTS_PER_DAY
+BITMAP_BYTES = WEEK_SLOTS // 8
+
+_DAY_NAMES = {
+    "월": 0, "화": 1, "수": 2, "목": 3, "금": 4, "토": 5, "일": 6,
+    "mon": 0, "tue": 1, "wed": 2, "thu": 3, "fri": 4, "sat": 5, "sun": 6,
+}
+_DAY_GROUPS = {
+    "평일": (0, 1, 2, 3, 4), "주중": (0, 1, 2, 3, 4), "weekday": (0, 1, 2, 3, 4), "weekdays": (0, 1, 2, 3, 4),
+    "주말": (5, 6), "weekend": (5, 6), "weekends": (5, 6),
+    "매일": tuple(range(7)), "연중무휴": tuple(range(7)), "daily": tuple(range(7)),
+    "everyday": tuple(range(7)), "all": tuple(range(7)),
+}
+_CLOSED = ("휴무", "휴관", "휴장", "closed", "close", "off")
+_ALL_DAY = ("24시간", "24h", "24hours", "종일")
+
+_RANGE = re.compile(r"(\d{1,2})(?::|시\s*)?(\d{2})?\s*분?\s*[-~–]\s*(\d{1,2})(?::|시\s*)?(\d{2})?")
+_DAY_TOKEN = re.compile(r"[a-z]+|[가-힣]+")
+
+Range = Tuple[int, int]  # (시작 분, 종료 분), 종료 <= 시작이면 다음 날로 이어짐
+
+
+def _minutes(hour: str, minute: Optional[str]) -> Optional[int]:
+    value = int(hour) * 60 + int(minute or 0)
+    return value if 0 <= value <= 24 * 60 else None
+
+
+def _parse_ranges(value) -> Optional[List[Range]]:
+    """값 → 운영 구간 목록 (휴무는 빈 목록, 해석 불가는 None)"""
+    if value is None:
+        return None
+    if isinstance(value, dict):
+        opens, closes = value.get("open"), value.get("close")
+        if opens is not None and closes is not None:
+            return _parse_ranges(f"{opens}-{closes}")
+        return _parse_ranges(value.get("hours"))
+    if isinstance(value, (list, tuple)):
+        parsed = [_parse_ranges(item) for item in value]
+        if all(item is None for item in parsed):
+            return None
+        return [span for item in parsed if item for span in item]
+
+    text = str(value).strip().lower()
+    if any(word in text for word in _ALL_DAY):
+        return [(0, 24 * 60)]
+    spans = []
+    for match in _RANGE.finditer(text):
+        start, end = _minutes(match.group(1), match.group(2)), _minutes(match.group(3), match.group(4))
+        if start is not None and end is not None:
+            spans.append((start, end))
+    if spans:
+        return spans
+    if any(word in text for word in _CLOSED):
+        return []
+    return None
+
+
+def _parse_days(text: str) -> Tuple[Tuple[int, ...], bool]:
+    """요일 표기 → (요일 목록, 묶음 여부). '월-금', '토,일', '평일' 등"""
+    text = text.strip().lower()
+    for name, days in _DAY_GROUPS.items():
+        if text == name:
+            return days, True
+
+    tokens = [token for token in _DAY_TOKEN.findall(text)]
+    days: List[int] = []
+    for token in tokens:
+        if token in _DAY_GROUPS:
+            days.extend(_DAY_GROUPS[token])
+            continue
+        day = _DAY_NAMES.get(token[:3] if token.isascii() else token[:1])
+        if day is not None:
+            days.append(day)
+    # '월-금', '월~금' 처럼 구간으로 적은 경우
+    if len(days) == 2 and re.search(r"[-~–]", text):
+        first, last = days
+        days = [(first + offset) % 7 for offset in range((last - first) % 7 + 1)]
+    return tuple(dict.fromkeys(days)), len(days) > 1
+
+
+def _assignments(value) -> Optional[List[Tuple[Tuple[int, ...], bool, List[Range]]]]:
+    """JSON 값 → (요일들, 묶음 여부, 구간들) 목록"""
+    if isinstance(value, dict) and not {"open", "close"} <= value.keys():
+        result = []
+        for key, hours in value.items():
+            days, grouped = _parse_days(str(key))
+            spans = _parse_ranges(hours)
+            if days and spans is not None:
+                result.append((days, grouped, spans))
+        return result
+
+    if isinstance(value, list) and value and all(isinstance(item, dict) for item in value):
+        result = []
+        for item in value:
+            days, grouped = _parse_days(str(item.get("day") or item.get("days") or "매일"))
+            spans = _parse_ranges(item if "open" in item else item.get("hours"))
+            if days and spans is not None:
+                result.append((days, grouped, spans))
+        return result
+
+    if isinstance(value, str):
+        result = []
+        for part in re.split(r"[,;/\n]", value):
+            match = _RANGE.search(part)
+            prefix = part[:match.start()] if match else part
+            days, grouped = _parse_days(prefix) if prefix.strip() else (tuple(range(7)), True)
+            spans = _parse_ranges(part[match.start():] if match else part)
+            if not days:
+                days, grouped = tuple(range(7)), True
+            if spans is not None:
+                result.append((days, grouped, spans))
+        return result
+
+    spans = _parse_ranges(value)
+    return None if spans is None else [(tuple(range(7)), True, spans)]
+
+
+def build_bitmap(opening_hours) -> Optional[bytes]:
+    """opening_hours JSON → 84바이트 주간 비트맵 (해석 불가 시 None)"""
+    assignments = _assignments(opening_hours)
+    if not assignments:
+        return None
+
+    # 묶음 지정을 먼저, 개별 요일 지정을 나중에 적용해 덮어씀
+    per_day: Dict[int, List[Range]] = {}
+    for days, _, spans in sorted(assignments, key=lambda item: not item[1]):
+        for day in days:
+            per_day[day] = spans
+
+    bits = bytearray(BITMAP_BYTES)
+    for day, spans in per_day.items():
+        for start, end in spans:
+            if end <= start:
+                end += 24 * 60  # 자정 넘김
+            first = start // SLOT_MINUTES
+            last = -(-end // SLOT_MINUTES)  # 걸친 칸 포함
+            for slot in range(first, last):
+                index = (day * SLOTS_PER_DAY + slot) % WEEK_SLOTS
+                bits[index // 8] |= 1 << (index % 8)
+    return bytes(bits)
+
+
+def week_slot(moment: datetime) -> int:
+    """시각 → 주간 비트 번호 (시각대 없는 값은 FACILITY_TIMEZONE 기준으로 봄)"""
+    if moment.tzinfo is not None:
+        moment = moment.astimezone(ZoneInfo(settings.FACILITY_TIMEZONE))
+    return moment.weekday() * SLOTS_PER_DAY + (moment.hour * 60 + moment.minute) // SLOT_MINUTES
+
+
+def current_week_slot() -> int:
+    return week_slot(datetime.now(ZoneInfo(settings.FACILITY_TIMEZONE)))
+
+
+def is_open(bitmap: Optional[bytes], slot: int) -> bool:
+    """비트맵의 slot 운영 여부 (SQL get_bit(bitmap, slot) = 1 과 같음)"""
+    return bitmap is not None and bool(bitmap[slot // 8] >> (slot % 8) & 1)
+
+
+def open_slots(bitmap: Optional[bytes]) -> Iterable[int]:
+    """운영 중인 비트 번호들"""
+    return (slot for slot in range(WEEK_SLOTS) if is_open(bitmap, slot))
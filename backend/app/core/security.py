@@ -1,49 +1,198 @@
+import hashlib
+import logging
+import time
+import uuid
 from datetime import datetime, timedelta, timezone
-from typing import Optional, Union, Any
-from jose import JWTError, jwt
+from concurrent.futures import Executor
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+from jose.exceptions import JWTError
 from passlib.context import CryptContext
+from pydantic import ValidationError
 
 from .config import settings
+from .cache import TTLCache, get_redis
+from .hashing import hash_pool
+from .lazy import lazy_import
+from app.schemas.token import TokenPayload
 
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+logger = logging.getLogger(__name__)
+
+# jose.jwt는 cryptography 백엔드까지 로드하므로 첫 토큰 처리 시점에 import
+jwt = lazy_import("jose.jwt")
+
+# BCRYPT_ROUNDS를 올리면 기존 해시는 needs_update 대상이 되어 로그인 시 재해시된다
+pwd_context = CryptContext(
+    schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=settings.BCRYPT_ROUNDS
+)
+
+
+# 검증이 끝난 토큰 캐시: sha256(token) -> (키 지문, TokenPayload)
+token_cache = TTLCache(
+    maxsize=settings.TOKEN_CACHE_MAXSIZE,
+    ttl=settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60,
+)
+
+
+def _hash_password(password: str) -> str:
+    """해시 풀 워커에서 실행되는 해시 함수"""
+    return pwd_context.hash(password)
+
+
+def _verify_and_update(plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+    """해시 풀 워커에서 실행되는 검증 함수"""
+    return pwd_context.verify_and_update(plain_password, hashed_password)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """평문 비밀번호와 해시된 비밀번호를 비교하여 검증"""
-    return pwd_context.verify(plain_password, hashed_password)
+    valid, _ = verify_password_and_update(plain_password, hashed_password)
+    return valid
+
+
+def verify_password_and_update(
+    plain_password: str, hashed_password: str
+) -> Tuple[bool, Optional[str]]:
+    """비밀번호 검증 후, 해시 정책이 바뀌었으면 새 해시도 함께 반환"""
+    return hash_pool.run(_verify_and_update, plain_password, hashed_password)
 
 
 def get_password_hash(password: str) -> str:
     """비밀번호를 해시화"""
-    return pwd_context.hash(password)
+    return hash_pool.run(_hash_password, password)
+
+
+def hash_passwords(
+    passwords: Sequence[str], executor: Executor, chunksize: int = 1
+) -> List[str]:
+    """여러 비밀번호를 주어진 프로세스 풀에서 일괄 해시 (일괄 등록용)"""
+    return list(executor.map(_hash_password, passwords, chunksize=chunksize))
+
+
+def _create_token(
+    subject: Union[str, Any],
+    token_type: str,
+    expires_delta: timedelta,
+    claims: Optional[Dict[str, Any]] = None,
+) -> str:
+    expire = datetime.now(timezone.utc) + expires_delta
+    to_encode = dict(claims or {})
+    to_encode.update({"exp": expire, "sub": str(subject), "type": token_type})
+    return jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
 
 
 def create_access_token(
-    subject: Union[str, Any], expires_delta: Optional[timedelta] = None
+    subject: Union[str, Any],
+    expires_delta: Optional[timedelta] = None,
+    claims: Optional[Dict[str, Any]] = None,
 ) -> str:
-    """JWT 액세스 토큰 생성"""
-    if expires_delta:
-        expire = datetime.now(timezone.utc) + expires_delta
-    else:
-        expire = datetime.now(timezone.utc) + timedelta(
-            minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES
-        )
-    
-    to_encode = {"exp": expire, "sub": str(subject)}
-    encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
-    return encoded_jwt
+    """JWT 액세스 토큰 생성
+
+    claims에는 uid(사용자 ID), act(활성 여부), ver(토큰 버전), scopes를 담아
+    읽기 전용 엔드포인트가 DB 조회 없이 권한을 판단할 수 있게 한다.
+    """
+    if not expires_delta:
+        expires_delta = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+    return _create_token(subject, "access", expires_delta, claims)
+
+
+def create_refresh_token(
+    subject: Union[str, Any],
+    token_version: int,
+    expires_delta: Optional[timedelta] = None,
+) -> str:
+    """JWT 리프레시 토큰 생성 (ver가 사용자 token_version과 다르면 폐기된 토큰, jti는 1회용 ID)"""
+    if not expires_delta:
+        expires_delta = timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
+    return _create_token(
+        subject, "refresh", expires_delta, {"ver": token_version, "jti": uuid.uuid4().hex}
+    )
+
+
+class UsedRefreshTokens:
+    """사용된 리프레시 토큰 jti 기록 (토큰 교체와 재사용 감지)
+
+    REDIS_URL이 설정되면 Redis SET NX(워커 간 공유)로, 아니면 워커 로컬 캐시에
+    토큰 만료 시각까지 기록한다. Redis 장애 시에는 로컬 기록으로 대체한다.
+    """
+
+    key_prefix = "refresh_used:"
+
+    def __init__(self, maxsize: int):
+        self.local = TTLCache(maxsize=maxsize, ttl=settings.REFRESH_TOKEN_EXPIRE_DAYS * 86400)
+        self.reused = 0
+
+    def consume(self, jti: str, exp: int) -> bool:
+        """jti를 사용 처리. 처음 사용이면 True, 이미 사용된 토큰이면 False"""
+        ttl = max(1, int(exp - time.time()))
+        client = get_redis()
+        if client is not None:
+            try:
+                first = bool(client.set(self.key_prefix + jti, "1", nx=True, ex=ttl))
+            except Exception as exc:
+                logger.warning("refresh token redis set failed, using local record: %s", exc)
+            else:
+                self.reused += not first
+                return first
+
+        if self.local.get(jti) is not None:
+            self.reused += 1
+            return False
+        self.local.set(jti, True, ttl=ttl)
+        return True
+
+    def stats(self) -> Dict[str, object]:
+        """재사용 감지 통계"""
+        return {
+            "local_records": len(self.local),
+            "reused": self.reused,
+            "shared": settings.REDIS_URL is not None,
+        }
 
 
-def verify_token(token: str) -> Optional[str]:
-    """JWT 토큰을 검증하고 subject 반환"""
+used_refresh_tokens = UsedRefreshTokens(maxsize=settings.TOKEN_CACHE_MAXSIZE)
+
+
+def _key_fingerprint() -> str:
+    """서명 키/알고리즘 지문 (키 교체 시 캐시된 검증 결과를 무효로 만들기 위함)"""
+    return hashlib.sha256(
+        f"{settings.ALGORITHM}:{settings.SECRET_KEY}".encode()
+    ).hexdigest()
+
+
+def verify_token(token: str, token_type: str = "access") -> Optional[TokenPayload]:
+    """JWT 토큰을 검증하고 클레임 반환
+
+    검증에 성공한 토큰은 다이제스트를 키로 exp까지 캐시해, 같은 토큰의 반복 요청은
+    서명 검증을 건너뛴다. 캐시 항목은 검증 당시 키 지문과 함께 저장되며, 키가
+    교체되면 지문이 달라져 적중하지 않고 새 키로 다시 검증한다 (fail closed).
+    """
+    digest = hashlib.sha256(token.encode()).hexdigest()
+    fingerprint = _key_fingerprint()
+
+    cached = token_cache.get(digest)
+    if cached is not None:
+        cached_fingerprint, cached_payload = cached
+        if cached_fingerprint == fingerprint:
+            return cached_payload if cached_payload.type == token_type else None
+        # 키 교체: 이전 키로 검증된 항목 전체 폐기
+        token_cache.clear()
+
     try:
         payload = jwt.decode(
             token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]
         )
-        token_subject: str = payload.get("sub")
-        if token_subject is None:
-            return None
-        return token_subject
     except JWTError:
-        return None
\ No newline at end of file
+        return None
+
+    if payload.get("sub") is None or payload.get("type") is None:
+        return None
+    try:
+        token_payload = TokenPayload(**payload)
+    except ValidationError:
+        return None
+
+    remaining = token_payload.exp - time.time()
+    if remaining > 0:
+        token_cache.set(digest, (fingerprint, token_payload), ttl=remaining)
+    return token_payload if token_payload.type == token_type else None
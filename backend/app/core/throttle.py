@@ -0,0 +1,156 @@
+import logging
+import math
+import threading
+import time
+import uuid
+from collections import OrderedDict, deque
+from typing import Dict, Optional
+
+from .cache import get_redis
+from .config import settings
+
+
+logger = logging.getLogger(__name__)
+
+# 오래된 기록 삭제 → 개수 확인 → 한도 미만이면 기록, 초과면 재시도 대기 시간 반환
+_SLIDING_WINDOW_SCRIPT = """
+local key = KEYS[1]
+local now = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local limit = tonumber(ARGV[3])
+redis.call('ZREMRANGEBYSCORE', key, 0, now - window)
+if redis.call('ZCARD', key) >= limit then
+    local oldest = redis.call('ZRANGE', key, 0, 0, 'WITHSCORES')
+    return tostring(tonumber(oldest[2]) + window - now)
+end
+redis.call('ZADD', key, now, ARGV[4])
+redis.call('PEXPIRE', key, math.ceil(window * 1000))
+return '0'
+"""
+
+
+class SlidingWindowLimiter:
+    """슬라이딩 윈도우 요청 제한
+
+    REDIS_URL이 설정되면 Redis sorted set(워커 간 공유)에, 아니면 워커 로컬
+    deque에 시도 시각을 기록한다. Redis 장애 시에는 로컬 기록으로 대체한다.
+    """
+
+    def __init__(self, name: str, limit: int, window: float, max_keys: int = 100000):
+        self.name = name
+        self.limit = limit
+        self.window = window
+        self.max_keys = max_keys
+        self._local: "OrderedDict[str, deque]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._script = None
+        self.allowed = 0
+        self.throttled = 0
+
+    def _redis_key(self, key: str) -> str:
+        return f"throttle:{self.name}:{key}"
+
+    def _hit_redis(self, client, key: str, now: float) -> float:
+        if self._script is None:
+            self._script = client.register_script(_SLIDING_WINDOW_SCRIPT)
+        member = f"{now}:{uuid.uuid4().hex}"
+        result = self._script(
+            keys=[self._redis_key(key)], args=[now, self.window, self.limit, member]
+        )
+        return float(result)
+
+    def _hit_local(self, key: str, now: float) -> float:
+        with self._lock:
+            attempts = self._local.get(key)
+            if attempts is None:
+                attempts = self._local[key] = deque()
+                while len(self._local) > self.max_keys:
+                    self._local.popitem(last=False)
+            self._local.move_to_end(key)
+
+            while attempts and attempts[0] <= now - self.window:
+                attempts.popleft()
+            if len(attempts) >= self.limit:
+                return attempts[0] + self.window - now
+            attempts.append(now)
+            return 0.0
+
+    def hit(self, key: str) -> int:
+        """시도 1회 기록. 허용 시 0, 제한 시 Retry-After(초) 반환"""
+        now = time.time()
+        client = get_redis()
+        wait = None
+        if client is not None:
+            try:
+                wait = self._hit_redis(client, key, now)
+            except Exception as exc:
+                logger.warning("throttle redis hit failed, using local window: %s", exc)
+        if wait is None:
+            wait = self._hit_local(key, now)
+
+        if wait > 0:
+            self.throttled += 1
+            return max(1, math.ceil(wait))
+        self.allowed += 1
+        return 0
+
+    def reset(self, key: str) -> None:
+        """key의 시도 기록 삭제"""
+        with self._lock:
+            self._local.pop(key, None)
+        client = get_redis()
+        if client is None:
+            return
+        try:
+            client.delete(self._redis_key(key))
+        except Exception as exc:
+            logger.warning("throttle redis reset failed: %s", exc)
+
+    def stats(self) -> Dict[str, object]:
+        """제한 상태 (모니터링용)"""
+        return {
+            "limit": self.limit,
+            "window_seconds": self.window,
+            "allowed": self.allowed,
+            "throttled": self.throttled,
+            "local_keys": len(self._local),
+        }
+
+
+class LoginThrottle:
+    """로그인 시도 제한 (계정별 + IP별)
+
+    DB 조회와 bcrypt 검증 이전에 호출해, 제한된 요청이 비용을 발생시키지 않게 한다.
+    로그인에 성공하면 해당 계정의 기록은 초기화된다.
+    """
+
+    def __init__(self, per_account: int, per_ip: int, window: float):
+        self.account = SlidingWindowLimiter("login:account", per_account, window)
+        self.ip = SlidingWindowLimiter("login:ip", per_ip, window)
+
+    def hit(self, client_ip: Optional[str], email: str) -> int:
+        """시도 기록. 허용 시 0, 제한 시 Retry-After(초) 반환"""
+        if client_ip:
+            wait = self.ip.hit(client_ip)
+            if wait:
+                return wait
+        return self.account.hit(email.strip().lower())
+
+    def reset_account(self, email: str) -> None:
+        """로그인 성공 시 계정 기록 초기화"""
+        self.account.reset(email.strip().lower())
+
+    def stats(self) -> Dict[str, object]:
+        """계정/IP별 제한 상태"""
+        return {
+            "backend": "redis" if settings.REDIS_URL else "memory",
+            "per_account": self.account.stats(),
+            "per_ip": self.ip.stats(),
+        }
+
+
+login_throttle = LoginThrottle(
+    per_account=settings.LOGIN_RATE_LIMIT_PER_ACCOUNT,
+    per_ip=settings.LOGIN_RATE_LIMIT_PER_IP,
+    window=settings.LOGIN_RATE_LIMIT_WINDOW_SECONDS,
+)
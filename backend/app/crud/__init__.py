@@ -1,3 +1,7 @@
 from .user import user
+from .facility import facility
+from .statistics import facility_statistic
+from .budget_performance import budget_performance
+from .counters import platform_counter
 
-__all__ = ["user"]
\ No newline at end of file
+__all__ = ["user", "facility", "facility_statistic", "budget_performance", "platform_counter"]
@@ -0,0 +1,252 @@
+from datetime import datetime
+from typing import Iterable, List, Optional, Sequence, Set
+
+from sqlalchemy import BigInteger, case, delete, func, insert, literal, literal_column, or_, select, tuple_, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.budget import BudgetPerformance, PerformanceReward, SportsbudgetSupport
+from app.models.region import Region
+
+
+ALL_YEARS = 0
+ALL_REGIONS = "00"
+ALL_SPORTS = "전체"
+
+SCORE_COLUMNS = (
+    "year", "region_code", "sport_type", "budget_amount", "reward_amount",
+    "budget_rows", "reward_rows", "source_updated_at",
+)
+
+
+def _peer_key(year: int, region_code: str, sport_type: str) -> str:
+    """같은 연도·같은 집계 단위끼리 비교 (지역×종목 행은 같은 종목의 지역끼리)"""
+    detail = region_code != ALL_REGIONS and sport_type != ALL_SPORTS
+    return "\x1f".join((
+        str(year),
+        str(region_code == ALL_REGIONS),
+        str(sport_type == ALL_SPORTS),
+        sport_type if detail else "",
+    ))
+
+
+def score_rows(rows: Sequence[Sequence]) -> List[dict]:
+    """SCORE_COLUMNS 순서 집계 행 → 점수를 붙인 행 dict
+
+    performance_score = 100 × log(1 + 성과금) / log(1 + 비교 집단 최대 성과금)
+    efficiency_ratio  = (비교 집단 내 성과금 점유율) / (비교 집단 내 예산 점유율)
+    """
+    import numpy as np
+
+    if not rows:
+        return []
+    budget = np.fromiter((row[3] for row in rows), dtype=np.float64, count=len(rows))
+    reward = np.fromiter((row[4] for row in rows), dtype=np.float64, count=len(rows))
+    _, group = np.unique(np.array([_peer_key(*row[:3]) for row in rows], dtype=object), return_inverse=True)
+
+    peer_budget = np.bincount(group, weights=budget)[group]
+    peer_reward = np.bincount(group, weights=reward)[group]
+    log_reward = np.log1p(reward)
+    peer_max = np.zeros(group.max() + 1)
+    np.maximum.at(peer_max, group, log_reward)
+    peer_max = peer_max[group]
+
+    score = np.divide(100 * log_reward, peer_max, out=np.zeros(len(rows)), where=peer_max > 0)
+    reward_share = np.divide(reward, peer_reward, out=np.zeros(len(rows)), where=peer_reward > 0)
+    budget_share = np.divide(budget, peer_budget, out=np.zeros(len(rows)), where=budget > 0)
+    ratio = np.divide(reward_share, budget_share, out=np.full(len(rows), np.nan), where=budget > 0)
+
+    return [
+        {
+            **dict(zip(SCORE_COLUMNS, row)),
+            "performance_score": round(float(score[i]), 1),
+            "efficiency_ratio": None if np.isnan(ratio[i]) else round(float(ratio[i]), 3),
+        }
+        for i, row in enumerate(rows)
+    ]
+
+
+class CRUDBudgetPerformance:
+    """예산-성과 집계 테이블 갱신/조회"""
+
+    async def changed_years(self, db: AsyncSession) -> Set[int]:
+        """원본 행 수나 최근 updated_at 이 집계 시점과 다른 연도 (원본에서 사라진 연도 포함)"""
+        per_source = union_all(
+            select(
+                SportsbudgetSupport.support_year.label("year"),
+                func.count().label("budget_rows"),
+                literal_column("0").label("reward_rows"),
+                func.max(SportsbudgetSupport.updated_at).label("updated_at"),
+            ).group_by(SportsbudgetSupport.support_year),
+            select(
+                PerformanceReward.award_year,
+                literal_column("0"),
+                func.count(),
+                func.max(PerformanceReward.updated_at),
+            ).group_by(PerformanceReward.award_year),
+        ).subquery()
+        source = await db.execute(
+            select(
+                per_source.c.year,
+                func.sum(per_source.c.budget_rows),
+                func.sum(per_source.c.reward_rows),
+                func.max(per_source.c.updated_at),
+            ).group_by(per_source.c.year)
+        )
+        summary = await db.execute(
+            select(
+                BudgetPerformance.year,
+                BudgetPerformance.budget_rows,
+                BudgetPerformance.reward_rows,
+                BudgetPerformance.source_updated_at,
+            ).where(
+                BudgetPerformance.year != ALL_YEARS,
+                BudgetPerformance.region_code == ALL_REGIONS,
+                BudgetPerformance.sport_type == ALL_SPORTS,
+            )
+        )
+        stored = {year: (budget_rows, reward_rows, updated_at) for year, budget_rows, reward_rows, updated_at in summary.all()}
+
+        changed = set()
+        for year, budget_rows, reward_rows, updated_at in source.all():
+            previous = stored.pop(year, None)
+            if (
+                previous is None
+                or (budget_rows, reward_rows) != previous[:2]
+                or previous[2] is None
+                or (updated_at is not None and updated_at > previous[2])
+            ):
+                changed.add(year)
+        return changed | set(stored)
+
+    async def refresh(self, db: AsyncSession, years: Optional[Iterable[int]] = None) -> List[int]:
+        """지정한(None 이면 변경 감지된) 연도의 행과 전체 연도 합계 행 다시 계산
+
+        다시 계산한 연도 목록을 돌려준다. commit 은 호출자가 한다.
+        """
+        years = set(years) if years is not None else await self.changed_years(db)
+        years.discard(ALL_YEARS)
+        if not years:
+            return []
+
+        rows = (await db.execute(self._aggregate(years))).all()
+        await self._replace(db, BudgetPerformance.year.in_(years), score_rows(rows))
+
+        # 전체 연도 합계는 연도별 집계 행을 다시 합산 (원본 전체를 다시 읽지 않음)
+        totals = (await db.execute(
+            select(
+                literal(ALL_YEARS),
+                BudgetPerformance.region_code,
+                BudgetPerformance.sport_type,
+                # bigint 의 sum 은 numeric 이므로 다시 bigint 로
+                func.sum(BudgetPerformance.budget_amount).cast(BigInteger),
+                func.sum(BudgetPerformance.reward_amount).cast(BigInteger),
+                func.sum(BudgetPerformance.budget_rows),
+                func.sum(BudgetPerformance.reward_rows),
+                func.max(BudgetPerformance.source_updated_at),
+            )
+            .where(BudgetPerformance.year != ALL_YEARS)
+            .group_by(BudgetPerformance.region_code, BudgetPerformance.sport_type)
+        )).all()
+        await self._replace(db, BudgetPerformance.year == ALL_YEARS, score_rows(totals))
+        return sorted(years)
+
+    def _aggregate(self, years: Set[int]):
+        """대상 연도의 (연도, 지역, 종목) / (연도, 종목) / (연도, 지역) / (연도) GROUPING SETS 집계"""
+        source = union_all(
+            select(
+                SportsbudgetSupport.support_year.label("year"),
+                SportsbudgetSupport.region_code.label("region_code"),
+                func.nullif(func.trim(SportsbudgetSupport.sport_type), "").label("sport_type"),
+                SportsbudgetSupport.support_amount.label("budget"),
+                literal_column("0").label("reward"),
+                literal_column("1").label("budget_row"),
+                literal_column("0").label("reward_row"),
+                SportsbudgetSupport.updated_at.label("updated_at"),
+            ).where(SportsbudgetSupport.support_year.in_(years)),
+            select(
+                PerformanceReward.award_year,
+                PerformanceReward.estimated_region_code,
+                func.nullif(func.trim(PerformanceReward.sport_type), ""),
+                literal_column("0"),
+                PerformanceReward.monthly_amount,
+                literal_column("0"),
+                literal_column("1"),
+                PerformanceReward.updated_at,
+            ).where(PerformanceReward.award_year.in_(years)),
+        ).subquery()
+
+        region_grouped = func.grouping(source.c.region_code) == 1
+        sport_grouped = func.grouping(source.c.sport_type) == 1
+        return (
+            select(
+                source.c.year,
+                case((region_grouped, ALL_REGIONS), else_=source.c.region_code),
+                case((sport_grouped, ALL_SPORTS), else_=source.c.sport_type),
+                func.sum(source.c.budget),
+                func.sum(source.c.reward),
+                func.sum(source.c.budget_row),
+                func.sum(source.c.reward_row),
+                func.max(source.c.updated_at),
+            )
+            .group_by(func.grouping_sets(
+                tuple_(source.c.year, source.c.region_code, source.c.sport_type),
+                tuple_(source.c.year, source.c.sport_type),
+                tuple_(source.c.year, source.c.region_code),
+                tuple_(source.c.year),
+            ))
+            # 지역/종목 미상 행은 전국·전체 종목 합계에만 포함
+            .having(
+                or_(region_grouped, source.c.region_code.is_not(None)),
+                or_(sport_grouped, source.c.sport_type.is_not(None)),
+            )
+        )
+
+    async def _replace(self, db: AsyncSession, scope, rows: List[dict]) -> None:
+        now = datetime.utcnow()
+        await db.execute(delete(BudgetPerformance).where(scope))
+        if rows:
+            await db.execute(
+                insert(BudgetPerformance),
+                [{**row, "created_at": now, "updated_at": now} for row in rows],
+            )
+
+    async def get_rows(
+        self,
+        db: AsyncSession,
+        *,
+        year: int = ALL_YEARS,
+        sport_type: Optional[str] = None,
+        region_code: Optional[str] = None,
+    ) -> List:
+        """집계 행 조회 (필터를 생략한 차원은 합계 행 제외, ALL_* 값으로 합계 행 조회)"""
+        region_name = func.coalesce(
+            Region.full_name,
+            case((BudgetPerformance.region_code == ALL_REGIONS, "전국"), else_=BudgetPerformance.region_code),
+        )
+        query = (
+            select(
+                BudgetPerformance.year,
+                BudgetPerformance.region_code,
+                region_name.label("region_name"),
+                BudgetPerformance.sport_type,
+                BudgetPerformance.budget_amount,
+                BudgetPerformance.reward_amount,
+                BudgetPerformance.performance_score,
+                BudgetPerformance.efficiency_ratio,
+            )
+            .outerjoin(Region, Region.code == BudgetPerformance.region_code)
+            .where(BudgetPerformance.year == year)
+            .order_by(BudgetPerformance.region_code, BudgetPerformance.sport_type)
+        )
+        if sport_type is None:
+            query = query.where(BudgetPerformance.sport_type != ALL_SPORTS)
+        else:
+            query = query.where(BudgetPerformance.sport_type == sport_type)
+        if region_code is None:
+            query = query.where(BudgetPerformance.region_code != ALL_REGIONS)
+        else:
+            query = query.where(BudgetPerformance.region_code == region_code)
+        return (await db.execute(query)).all()
+
+
+budget_performance = CRUDBudgetPerformance()
@@ -0,0 +1,74 @@
+import logging
+from typing import Dict, Optional, Tuple
+
+from sqlalchemy import func, select, text
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.counter import PlatformCounter
+from app.models.facility import SportsFacility
+from app.models.proposal import Proposal
+from app.models.region import Region
+
+
+logger = logging.getLogger(__name__)
+
+# 카운터 이름 → 실제 값 쿼리 (트리거와 같은 기준)
+COUNTERS = {
+    "total_facilities": select(func.count()).select_from(SportsFacility).where(SportsFacility.is_deleted.is_(False)),
+    "total_regions": select(func.count()).select_from(Region),
+    "total_proposals": select(func.count()).select_from(Proposal),
+}
+
+# 여러 워커/명령이 동시에 대조하지 않도록 잡는 advisory lock 키
+RECONCILE_LOCK_KEY = 0x706C6374  # 'plct'
+
+
+class CRUDPlatformCounter:
+    """플랫폼 카운터 조회/대조"""
+
+    async def get_all(self, db: AsyncSession) -> Dict[str, int]:
+        """카운터 값 (없는 카운터는 0)"""
+        result = await db.execute(select(PlatformCounter.name, PlatformCounter.value))
+        values = dict.fromkeys(COUNTERS, 0)
+        values.update({name: value for name, value in result.all() if name in values})
+        return values
+
+    async def reconcile(self, db: AsyncSession) -> Optional[Dict[str, Tuple[int, int]]]:
+        """실제 COUNT 로 카운터 교정. 어긋났던 카운터의 {이름: (저장값, 실제값)} 반환
+
+        다른 대조가 진행 중이면 아무것도 하지 않고 None 을 반환한다. commit 은 호출자가 한다.
+        """
+        locked = await db.scalar(text("SELECT pg_try_advisory_xact_lock(:key)"), {"key": RECONCILE_LOCK_KEY})
+        if not locked:
+            return None
+
+        # 카운터 행을 먼저 잠가 진행 중인 트리거 갱신이 커밋된 뒤에 세고,
+        # 이후 시작된 트랜잭션의 증감은 교정값 위에 더해지게 함
+        result = await db.execute(
+            select(PlatformCounter.name, PlatformCounter.value)
+            .where(PlatformCounter.name.in_(COUNTERS))
+            .with_for_update()
+        )
+        stored = {name: value for name, value in result.all()}
+
+        drift = {}
+        for name, query in COUNTERS.items():
+            actual = await db.scalar(query)
+            if stored.get(name) == actual:
+                continue
+            drift[name] = (stored.get(name), actual)
+            await db.execute(
+                insert(PlatformCounter)
+                .values(name=name, value=actual, created_at=func.now(), updated_at=func.now())
+                .on_conflict_do_update(
+                    index_elements=[PlatformCounter.name],
+                    set_={"value": actual, "updated_at": func.now()},
+                )
+            )
+        if drift:
+            logger.warning("Platform counters drifted: %s", drift)
+        return drift
+
+
+platform_counter = CRUDPlatformCounter()
@@ -0,0 +1,291 @@
+import base64
+import json
+from typing import AsyncIterator, List, Optional, Tuple
+
+from geoalchemy2 import Geography
+from sqlalchemy import Row, Text, case, cast, func, or_, select, text, tuple_
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.facility import SportsFacility
+from app.models.region import Region
+
+
+# 키셋 정렬 키: ix_sportsfacility_type_region_id / ix_sportsfacility_region_type_id 와 일치해야 함
+KEYSET_COLUMNS = (SportsFacility.facility_type, SportsFacility.region_code, SportsFacility.id)
+
+
+def _keyset_positions(facility_type: Optional[str], region_code: Optional[str]) -> List[int]:
+    """필터로 고정되지 않은 정렬 키 위치 (KEYSET_COLUMNS / 커서 값 기준)
+
+    고정된 컬럼까지 행 비교에 넣으면 (region_code, facility_type, id) 인덱스에서는
+    인덱스 조건이 되지 못하므로, 등호 조건 뒤에 이어지는 인덱스 컬럼만 비교/정렬한다.
+    - 유형 고정: (region_code, id) → ix_sportsfacility_type_region_id
+    - 지역 고정: (facility_type, id) → ix_sportsfacility_region_type_id
+    - 둘 다 고정: id / 고정 없음: (facility_type, region_code, id)
+    """
+    pinned = (facility_type is not None, region_code is not None, False)
+    return [position for position, is_pinned in enumerate(pinned) if not is_pinned]
+
+
+LIST_COLUMNS = (
+    SportsFacility.id,
+    SportsFacility.facility_code,
+    SportsFacility.name,
+    SportsFacility.facility_type,
+    SportsFacility.address,
+    SportsFacility.latitude,
+    SportsFacility.longitude,
+    SportsFacility.region_code,
+    Region.name.label("region_name"),
+    SportsFacility.operator,
+    SportsFacility.is_public,
+)
+
+SEARCH_MAX_TERMS = 5
+# pg_trgm 은 3글자 미만 단어에서 trigram 을 뽑지 못해 인덱스로 후보를 거르지 못하므로,
+# 2글자 단어("잠실", "수영")는 text_bigrams() GIN 표현식 인덱스로 거른다 (1글자는 인덱스 없음)
+BIGRAM_TERM_LENGTH = 2
+
+
+def open_at_slot(slot: int):
+    """주간 비트 번호에 운영 중인 시설 조건 (비트맵이 NULL 인 운영시간 미상 시설은 제외)"""
+    return func.get_bit(SportsFacility.open_hours_bitmap, slot) == 1
+
+
+def _bigrams(column):
+    """ix_sportsfacility_*_bigram 표현식 인덱스와 같은 식"""
+    return func.text_bigrams(column, type_=ARRAY(Text))
+
+
+def _contains_pattern(term: str) -> str:
+    """ILIKE '%term%' 패턴 (와일드카드 문자 이스케이프)"""
+    escaped = term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+# 타일 좌표계(EPSG:3857) 기준 extent/buffer. location(geography) GiST 인덱스로 후보를 거른 뒤
+# ST_AsMVTGeom 으로 타일 좌표로 변환한다.
+TILE_EXTENT = 4096
+TILE_BUFFER = 64
+
+TILE_SQL = text(
+    """
+    WITH bounds AS (
+        SELECT ST_TileEnvelope(:z, :x, :y) AS geom,
+               ST_Transform(
+                   ST_TileEnvelope(:z, :x, :y, margin => CAST(:margin AS float8)), 4326
+               )::geography AS filter
+    ),
+    features AS (
+        SELECT ST_AsMVTGeom(
+                   ST_Transform(f.location::geometry, 3857), bounds.geom, :extent, :buffer, true
+               ) AS geom,
+               f.id,
+               f.facility_type,
+               f.is_public
+        FROM sportsfacility AS f, bounds
+        WHERE f.location && bounds.filter AND NOT f.is_deleted
+    )
+    SELECT ST_AsMVT(features, 'facilities', :extent, 'geom') FROM features
+    """
+)
+
+
+class InvalidCursor(ValueError):
+    """해석할 수 없는 페이지 커서"""
+
+
+def encode_cursor(facility_type: str, region_code: str, facility_id: int) -> str:
+    """마지막 행의 정렬 키를 불투명 커서로 인코딩"""
+    raw = json.dumps([facility_type, region_code, facility_id], ensure_ascii=False, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[str, str, int]:
+    """커서를 (facility_type, region_code, id)로 복원"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        facility_type, region_code, facility_id = json.loads(base64.urlsafe_b64decode(padded))
+    except (ValueError, TypeError) as exc:
+        raise InvalidCursor(cursor) from exc
+    if not isinstance(facility_type, str) or not isinstance(region_code, str) or not isinstance(facility_id, int):
+        raise InvalidCursor(cursor)
+    return facility_type, region_code, facility_id
+
+
+class CRUDFacility:
+    """체육시설 CRUD 작업"""
+
+    async def get_page(
+        self,
+        db: AsyncSession,
+        *,
+        facility_type: Optional[str] = None,
+        region_code: Optional[str] = None,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        open_slot: Optional[int] = None,
+    ) -> Tuple[List[Row], Optional[str]]:
+        """(facility_type, region_code, id) 키셋 페이지 조회
+
+        OFFSET 대신 직전 페이지 마지막 키 이후부터 인덱스를 읽으므로 페이지 깊이와
+        무관하게 동작한다. 유형/지역 필터와 커서 비교가 모두 인덱스 조건이라 필터만
+        있으면 limit + 1 행을 읽고 멈추지만, open_slot 은 인덱스 밖 조건이라 운영 중인
+        시설 limit + 1 개를 찾을 때까지 더 읽는다. 다음 페이지가 없으면 커서는 None.
+        """
+        positions = _keyset_positions(facility_type, region_code)
+        columns = [KEYSET_COLUMNS[position] for position in positions]
+        query = (
+            select(*LIST_COLUMNS)
+            .join(Region, Region.code == SportsFacility.region_code)
+            .where(SportsFacility.is_deleted.is_(False))
+            .order_by(*columns)
+            .limit(limit + 1)
+        )
+        if facility_type is not None:
+            query = query.where(SportsFacility.facility_type == facility_type)
+        if region_code is not None:
+            query = query.where(SportsFacility.region_code == region_code)
+        if cursor is not None:
+            values = decode_cursor(cursor)
+            if len(columns) == 1:
+                query = query.where(columns[0] > values[positions[0]])
+            else:
+                query = query.where(tuple_(*columns) > tuple_(*(values[position] for position in positions)))
+        if open_slot is not None:
+            query = query.where(open_at_slot(open_slot))
+
+        rows = list((await db.execute(query)).all())
+        if len(rows) <= limit:
+            return rows, None
+
+        rows = rows[:limit]
+        last = rows[-1]
+        return rows, encode_cursor(last.facility_type, last.region_code, last.id)
+
+    async def get_nearby(
+        self,
+        db: AsyncSession,
+        *,
+        lat: float,
+        lng: float,
+        radius_m: float,
+        k: int = 10,
+        facility_type: Optional[str] = None,
+        open_slot: Optional[int] = None,
+    ) -> List[Row]:
+        """기준점에서 가까운 시설 k개 (반경 내, 거리 오름차순)
+
+        ST_DWithin 반경 조건과 `<->` KNN 정렬 모두 location GiST 인덱스를 사용하므로
+        전체 행의 거리를 계산하지 않는다. distance_m 은 구면 거리(미터).
+        """
+        point = cast(func.ST_SetSRID(func.ST_MakePoint(lng, lat), 4326), Geography("POINT", srid=4326))
+        query = (
+            select(*LIST_COLUMNS, func.ST_Distance(SportsFacility.location, point).label("distance_m"))
+            .join(Region, Region.code == SportsFacility.region_code)
+            .where(func.ST_DWithin(SportsFacility.location, point, radius_m))
+            .where(SportsFacility.is_deleted.is_(False))
+            .order_by(SportsFacility.location.op("<->")(point))
+            .limit(k)
+        )
+        if facility_type is not None:
+            query = query.where(SportsFacility.facility_type == facility_type)
+        if open_slot is not None:
+            query = query.where(open_at_slot(open_slot))
+        return list((await db.execute(query)).all())
+
+    async def search(
+        self,
+        db: AsyncSession,
+        *,
+        q: str,
+        facility_type: Optional[str] = None,
+        region_code: Optional[str] = None,
+        limit: int = 20,
+    ) -> List[Row]:
+        """이름/주소 검색 (공백으로 나눈 단어가 모두 이름 또는 주소에 포함, 관련도 순)
+
+        단어별 ILIKE 는 name/address 의 pg_trgm GIN 인덱스로(2글자 단어는 bigram 배열
+        GIN 인덱스로) 후보를 거르고, 유형/지역 필터도 같은 쿼리에서 적용한다. score 는
+        이름 일치를 주소보다 높게 친다.
+        """
+        terms = q.split()[:SEARCH_MAX_TERMS]
+        phrase = " ".join(terms)
+        score = (
+            case((SportsFacility.name.ilike(_contains_pattern(phrase), escape="\\"), 1.0), else_=0.0)
+            + 2 * func.word_similarity(phrase, SportsFacility.name)
+            + func.word_similarity(phrase, func.coalesce(SportsFacility.address, ""))
+        ).label("score")
+
+        query = (
+            select(*LIST_COLUMNS, score)
+            .join(Region, Region.code == SportsFacility.region_code)
+            .where(SportsFacility.is_deleted.is_(False))
+            .order_by(score.desc(), SportsFacility.id)
+            .limit(limit)
+        )
+        for term in terms:
+            pattern = _contains_pattern(term)
+            query = query.where(or_(
+                SportsFacility.name.ilike(pattern, escape="\\"),
+                SportsFacility.address.ilike(pattern, escape="\\"),
+            ))
+            if len(term) == BIGRAM_TERM_LENGTH:
+                bigram = [term.lower()]
+                query = query.where(or_(
+                    _bigrams(SportsFacility.name).contains(bigram),
+                    _bigrams(SportsFacility.address).contains(bigram),
+                ))
+        if facility_type is not None:
+            query = query.where(SportsFacility.facility_type == facility_type)
+        if region_code is not None:
+            query = query.where(SportsFacility.region_code == region_code)
+        return list((await db.execute(query)).all())
+
+    async def get_data_version(self, db: AsyncSession) -> str:
+        """시설 데이터 버전 (활성/삭제 포함 행 수와 최근 updated_at, 변경 시 항상 달라짐)"""
+        count, updated_at = (await db.execute(
+            select(func.count(), func.max(SportsFacility.updated_at))
+        )).one()
+        return f"{count}-{updated_at.timestamp() if updated_at else 0}"
+
+    async def iter_export(
+        self,
+        db: AsyncSession,
+        *,
+        facility_type: Optional[str] = None,
+        region_code: Optional[str] = None,
+        batch_size: int = 2000,
+    ) -> AsyncIterator[List[Row]]:
+        """전체 시설을 id 순으로 batch_size 행씩 (서버 측 커서, 메모리 사용량 일정)"""
+        query = (
+            select(*LIST_COLUMNS)
+            .join(Region, Region.code == SportsFacility.region_code)
+            .where(SportsFacility.is_deleted.is_(False))
+            .order_by(SportsFacility.id)
+            .execution_options(yield_per=batch_size)
+        )
+        if facility_type is not None:
+            query = query.where(SportsFacility.facility_type == facility_type)
+        if region_code is not None:
+            query = query.where(SportsFacility.region_code == region_code)
+        result = await db.stream(query)
+        async for partition in result.partitions():
+            yield partition
+
+    async def get_tile(self, db: AsyncSession, z: int, x: int, y: int) -> bytes:
+        """z/x/y 타일의 Mapbox Vector Tile (레이어 'facilities')"""
+        result = await db.execute(
+            TILE_SQL,
+            {
+                "z": z, "x": x, "y": y,
+                "margin": TILE_BUFFER / TILE_EXTENT,
+                "extent": TILE_EXTENT,
+                "buffer": TILE_BUFFER,
+            },
+        )
+        return bytes(result.scalar() or b"")
+
+
+facility = CRUDFacility()
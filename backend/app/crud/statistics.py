@@ -0,0 +1,157 @@
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Set
+
+from sqlalchemy import case, delete, func, insert, literal, or_, select, true
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.facility import FacilityStatistic, SportsFacility
+from app.models.region import Region
+
+
+STAT_COLUMNS = ["region_code", "level", "facility_type", "is_public", "facility_count", "created_at", "updated_at"]
+TOP_REGIONS = 5
+
+
+class CRUDFacilityStatistic:
+    """시설 집계 테이블 갱신/조회"""
+
+    async def refresh(self, db: AsyncSession, region_codes: Optional[Iterable[str]] = None) -> None:
+        """변경된 시설 region_code 의 시/군/구 행과 상위 시/도 행만 다시 계산
+
+        region_codes 가 None 이면 전체를 다시 계산한다. commit 은 호출자가 한다.
+        """
+        sigungu_codes: Optional[Set[str]] = None
+        sido_codes: Optional[Set[str]] = None
+        if region_codes is not None:
+            result = await db.execute(
+                select(Region.code, Region.level, Region.parent_code)
+                .where(Region.code.in_(set(region_codes)))
+            )
+            sigungu_codes, sido_codes = set(), set()
+            for code, level, parent_code in result.all():
+                if level == "sido":
+                    sido_codes.add(code)
+                else:
+                    sigungu_codes.add(code)
+                    if parent_code:
+                        sido_codes.add(parent_code)
+
+        is_public = func.coalesce(SportsFacility.is_public, true())
+        sido_code = case((Region.level == "sido", Region.code), else_=Region.parent_code)
+
+        await self._replace(
+            db,
+            level="sigungu",
+            region_expr=SportsFacility.region_code,
+            codes=sigungu_codes,
+            is_public=is_public,
+            where=Region.level == "sigungu",
+            scope=lambda codes: SportsFacility.region_code.in_(codes),
+        )
+        await self._replace(
+            db,
+            level="sido",
+            region_expr=sido_code,
+            codes=sido_codes,
+            is_public=is_public,
+            where=sido_code.is_not(None),
+            # region 쪽에서 대상 시군구를 먼저 좁혀 sportsfacility.region_code 인덱스로 조인
+            scope=lambda codes: or_(Region.code.in_(codes), Region.parent_code.in_(codes)),
+        )
+
+    async def _replace(self, db: AsyncSession, *, level, region_expr, codes, is_public, where, scope) -> None:
+        """한 레벨의 대상 지역 행을 지우고 sportsfacility 에서 다시 집계해 넣기"""
+        if codes is not None and not codes:
+            return
+
+        remove = delete(FacilityStatistic).where(FacilityStatistic.level == level)
+        aggregate = (
+            select(
+                region_expr,
+                literal(level),
+                SportsFacility.facility_type,
+                is_public,
+                func.count(),
+                func.now(),
+                func.now(),
+            )
+            .join(Region, Region.code == SportsFacility.region_code)
+            .where(where, SportsFacility.is_deleted.is_(False))
+            .group_by(region_expr, SportsFacility.facility_type, is_public)
+        )
+        if codes is not None:
+            remove = remove.where(FacilityStatistic.region_code.in_(codes))
+            aggregate = aggregate.where(scope(codes))
+
+        await db.execute(remove)
+        await db.execute(insert(FacilityStatistic).from_select(STAT_COLUMNS, aggregate))
+
+    async def get_summary(self, db: AsyncSession, region_code: Optional[str] = None) -> Optional[dict]:
+        """전국/시도/시군구 시설 통계 (지역이 없으면 None)"""
+        if region_code is None:
+            rows = await self._rows(db, FacilityStatistic.level == "sido")
+            return _summarize(rows, rows)
+
+        region_level = await db.scalar(select(Region.level).where(Region.code == region_code))
+        if region_level is None:
+            return None
+
+        rows = await self._rows(
+            db,
+            FacilityStatistic.level == region_level,
+            FacilityStatistic.region_code == region_code,
+        )
+        if region_level != "sido":
+            return _summarize(rows, rows)
+
+        children = await self._rows(
+            db,
+            FacilityStatistic.level == "sigungu",
+            Region.parent_code == region_code,
+        )
+        return _summarize(rows, children)
+
+    async def _rows(self, db: AsyncSession, *conditions) -> List:
+        result = await db.execute(
+            select(
+                FacilityStatistic.region_code,
+                Region.name.label("region_name"),
+                FacilityStatistic.facility_type,
+                FacilityStatistic.is_public,
+                FacilityStatistic.facility_count,
+            )
+            .join(Region, Region.code == FacilityStatistic.region_code)
+            .where(*conditions)
+        )
+        return result.all()
+
+
+def _summarize(rows, region_rows) -> dict:
+    """집계 행 → 응답 dict (region_rows 로 상위 지역 순위 계산)"""
+    public = private = 0
+    by_type: Dict[str, int] = defaultdict(int)
+    for row in rows:
+        by_type[row.facility_type] += row.facility_count
+        if row.is_public:
+            public += row.facility_count
+        else:
+            private += row.facility_count
+
+    by_region: Dict[tuple, int] = defaultdict(int)
+    for row in region_rows:
+        by_region[(row.region_code, row.region_name)] += row.facility_count
+    top_regions = sorted(by_region.items(), key=lambda item: item[1], reverse=True)[:TOP_REGIONS]
+
+    return {
+        "total_facilities": public + private,
+        "public_facilities": public,
+        "private_facilities": private,
+        "by_type": dict(sorted(by_type.items(), key=lambda item: item[1], reverse=True)),
+        "by_region_top5": [
+            {"region_code": code, "region_name": name, "count": count}
+            for (code, name), count in top_regions
+        ],
+    }
+
+
+facility_statistic = CRUDFacilityStatistic()
@@ -1,9 +1,16 @@
-from typing import Optional
+import csv
+import io
+import json
+from datetime import datetime
+from typing import Iterable, List, Optional, Sequence, Set
+from sqlalchemy import DateTime, insert, select
 from sqlalchemy.orm import Session
 
+from app.models.region import Region
 from app.models.user import User
 from app.schemas.user import UserCreate, UserUpdate
-from app.core.security import get_password_hash, verify_password
+from app.core.cache import principal_cache
+from app.core.security import get_password_hash, verify_password_and_update
 
 
 class CRUDUser:
@@ -17,6 +24,17 @@ class CRUDUser:
         """이메일로 사용자 조회"""
         return db.query(User).filter(User.email == email).first()
     
+    def get_by_id_cached(self, db: Session, user_id: int) -> Optional[User]:
+        """principal 캐시를 거쳐 ID로 사용자 조회 (인증 의존성용)"""
+        data = principal_cache.get(str(user_id))
+        if data is not None:
+            return self._from_cache(data)
+
+        user = self.get_by_id(db, user_id)
+        if user is not None:
+            principal_cache.set(str(user_id), self._to_cache(user))
+        return user
+    
     def get_by_username(self, db: Session, username: str) -> Optional[User]:
         """사용자명으로 사용자 조회"""
         return db.query(User).filter(User.username == username).first()
@@ -42,6 +60,100 @@ class CRUDUser:
         db.refresh(db_user)
         return db_user
     
+    def get_existing_emails(self, db: Session, emails: Iterable[str]) -> Set[str]:
+        """주어진 이메일 중 이미 등록된 이메일 집합 (일괄 중복 확인)"""
+        emails = list(emails)
+        if not emails:
+            return set()
+        return set(db.scalars(select(User.email).where(User.email.in_(emails))))
+
+    def get_existing_usernames(self, db: Session, usernames: Iterable[str]) -> Set[str]:
+        """주어진 사용자명 중 이미 사용 중인 사용자명 집합 (일괄 중복 확인)"""
+        usernames = list(usernames)
+        if not usernames:
+            return set()
+        return set(db.scalars(select(User.username).where(User.username.in_(usernames))))
+
+    def get_existing_region_codes(self, db: Session, region_codes: Iterable[str]) -> Set[str]:
+        """주어진 지역 코드 중 region 테이블에 있는 코드 집합 (user.region_code 외래키 사전 확인)"""
+        region_codes = list(region_codes)
+        if not region_codes:
+            return set()
+        return set(db.scalars(select(Region.code).where(Region.code.in_(region_codes))))
+
+    def bulk_create(
+        self,
+        db: Session,
+        users_create: Sequence[UserCreate],
+        hashed_passwords: Sequence[str],
+    ) -> int:
+        """사용자 일괄 생성 (중복 확인과 해시는 호출 측에서 완료된 상태)
+
+        PostgreSQL에서는 COPY, 그 외 DB에서는 multi-row INSERT로 적재한다.
+        """
+        now = datetime.utcnow()
+        rows = [
+            {
+                "email": user_create.email,
+                "username": user_create.username,
+                "hashed_password": hashed_password,
+                "display_name": user_create.display_name,
+                "bio": user_create.bio,
+                "region_code": user_create.region_code,
+                "interested_regions": user_create.interested_regions,
+                "interested_sports": user_create.interested_sports,
+                "interested_facility_types": user_create.interested_facility_types,
+                "is_active": True,
+                "is_verified": False,
+                "token_version": 0,
+                "proposal_count": 0,
+                "vote_count": 0,
+                "like_received": 0,
+                "report_count": 0,
+                "created_at": now,
+                "updated_at": now,
+            }
+            for user_create, hashed_password in zip(users_create, hashed_passwords)
+        ]
+        if not rows:
+            return 0
+
+        if db.get_bind().dialect.name == "postgresql":
+            self._copy_rows(db, rows)
+        else:
+            db.execute(insert(User), rows)
+        db.commit()
+        return len(rows)
+
+    def _copy_rows(self, db: Session, rows: List[dict]) -> None:
+        """COPY ... FROM STDIN (csv)으로 적재"""
+        columns = list(rows[0].keys())
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        for row in rows:
+            writer.writerow([self._copy_value(row[column]) for column in columns])
+        buffer.seek(0)
+
+        column_list = ", ".join(f'"{column}"' for column in columns)
+        cursor = db.connection().connection.cursor()
+        try:
+            cursor.copy_expert(
+                f'COPY "{User.__tablename__}" ({column_list}) '
+                f"FROM STDIN WITH (FORMAT csv, NULL '\\N')",
+                buffer,
+            )
+        finally:
+            cursor.close()
+
+    def _copy_value(self, value):
+        if value is None:
+            return "\\N"
+        if isinstance(value, (list, dict)):
+            return json.dumps(value, ensure_ascii=False)
+        if isinstance(value, datetime):
+            return value.isoformat()
+        return value
+
     def update(self, db: Session, user_id: int, user_update: UserUpdate) -> Optional[User]:
         """사용자 정보 수정"""
         db_user = self.get_by_id(db, user_id)
@@ -55,11 +167,33 @@ class CRUDUser:
             hashed_password = get_password_hash(update_data.pop("password"))
             update_data["hashed_password"] = hashed_password
         
+        # 비밀번호 변경이나 활성 상태 변경 시 기존 토큰 모두 폐기
+        revoke = "hashed_password" in update_data or (
+            "is_active" in update_data and update_data["is_active"] != db_user.is_active
+        )
+
         for field, value in update_data.items():
             setattr(db_user, field, value)
+        if revoke:
+            db_user.token_version = (db_user.token_version or 0) + 1
         
         db.commit()
         db.refresh(db_user)
+
+        # 이메일 변경, 비활성화 등이 즉시 반영되도록 캐시 무효화
+        principal_cache.invalidate(str(db_user.id))
+        return db_user
+
+    def revoke_tokens(self, db: Session, user_id: int) -> Optional[User]:
+        """token_version을 올려 발급된 액세스/리프레시 토큰을 모두 폐기"""
+        db_user = self.get_by_id(db, user_id)
+        if not db_user:
+            return None
+
+        db_user.token_version = (db_user.token_version or 0) + 1
+        db.commit()
+        db.refresh(db_user)
+        principal_cache.invalidate(str(db_user.id))
         return db_user
     
     def authenticate(self, db: Session, email: str, password: str) -> Optional[User]:
@@ -67,8 +201,13 @@ class CRUDUser:
         user = self.get_by_email(db, email)
         if not user:
             return None
-        if not verify_password(password, user.hashed_password):
+        valid, new_hash = verify_password_and_update(password, user.hashed_password)
+        if not valid:
             return None
+        if new_hash:
+            # 해시 비용이 상향된 경우 로그인 시점에 투명하게 재해시
+            user.hashed_password = new_hash
+            db.commit()
         return user
     
     def is_active(self, user: User) -> bool:
@@ -79,5 +218,25 @@ class CRUDUser:
         """사용자 인증 상태 확인"""
         return user.is_verified
 
+    def _to_cache(self, user: User) -> dict:
+        """캐시 저장용 컬럼 값 dict (JSON 직렬화 가능, 비밀번호 해시 제외)"""
+        data = {}
+        for column in User.__table__.columns:
+            if column.key == "hashed_password":
+                continue
+            value = getattr(user, column.key)
+            if isinstance(value, datetime):
+                value = value.isoformat()
+            data[column.key] = value
+        return data
+
+    def _from_cache(self, data: dict) -> User:
+        """캐시 값으로 세션에 연결되지 않은 User 인스턴스 생성"""
+        values = dict(data)
+        for column in User.__table__.columns:
+            if isinstance(column.type, DateTime) and values.get(column.key):
+                values[column.key] = datetime.fromisoformat(values[column.key])
+        return User(**values)
+
 
 user = CRUDUser()
\ No newline at end of file
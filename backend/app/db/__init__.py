@@ -1,3 +1,19 @@
-from .database import get_db, engine, SessionLocal
+from .database import (
+    get_db,
+    get_async_db,
+    engine,
+    async_engine,
+    SessionLocal,
+    AsyncSessionLocal,
+    get_pool_stats,
+)
 
-__all__ = ["get_db", "engine", "SessionLocal"]
\ No newline at end of file
+__all__ = [
+    "get_db",
+    "get_async_db",
+    "engine",
+    "async_engine",
+    "SessionLocal",
+    "AsyncSessionLocal",
+    "get_pool_stats",
+]
@@ -1,26 +1,91 @@
+from uuid import uuid4
+
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.ext.declarative import declarative_base
 
 from app.core.config import settings
+from app.core.metrics import install_query_hooks
+from app.db.pool import InstrumentedAsyncQueuePool, InstrumentedQueuePool, pool_stats
+
+
+def _async_connect_args() -> dict:
+    """asyncpg 접속 옵션
+
+    PgBouncer transaction 모드에서는 트랜잭션마다 서버 커넥션이 바뀌므로
+    서버측 prepared statement 캐시를 끄고, 문장 이름이 겹치지 않게 한다.
+    """
+    if not settings.DB_PGBOUNCER:
+        return {}
+    return {
+        "statement_cache_size": 0,
+        "prepared_statement_cache_size": 0,
+        "prepared_statement_name_func": lambda: f"__asyncpg_{uuid4()}__",
+    }
+
 
+# 동기 엔진: 동기 인증 라우트(def 핸들러, 스레드풀에서 실행)와 Alembic 전용
 engine = create_engine(
     settings.DATABASE_URL,
     echo=False,  # Set to True for SQL logging during development
+    poolclass=InstrumentedQueuePool,
     pool_pre_ping=True,
-    pool_size=10,
-    max_overflow=20,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
 )
 
+install_query_hooks(engine)
+
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# 비동기 엔진: async def 핸들러 전용 (asyncpg 드라이버, GeoAlchemy2 타입 그대로 사용 가능)
+async_engine = create_async_engine(
+    settings.ASYNC_DATABASE_URL,
+    echo=False,
+    poolclass=InstrumentedAsyncQueuePool,
+    pool_pre_ping=True,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    connect_args=_async_connect_args(),
+)
+
+install_query_hooks(async_engine.sync_engine)
+
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False,
+)
+
 Base = declarative_base()
 
 
 def get_db():
-    """Database dependency for FastAPI"""
+    """Database dependency for FastAPI (sync routes only)
+
+    Session은 첫 SQL 실행 시점에 풀에서 커넥션을 가져오고 commit/rollback 또는
+    close 시 반납한다. 쿼리하지 않는 요청은 커넥션을 점유하지 않는다.
+    """
     db = SessionLocal()
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+
+async def get_async_db():
+    """Async database dependency for FastAPI (async def routes, same lazy checkout)"""
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+def get_pool_stats() -> dict:
+    """동기/비동기 커넥션 풀 상태 (모니터링용)"""
+    return {
+        "sync": pool_stats(engine.pool),
+        "async": pool_stats(async_engine.pool),
+    }
@@ -0,0 +1,78 @@
+import threading
+import time
+from typing import Dict
+
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool, QueuePool
+
+from app.core.metrics import db_pool_checkout
+
+
+class PoolWaitStats:
+    """커넥션 체크아웃 대기 시간 집계"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.count = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+
+    def record(self, seconds: float) -> None:
+        with self._lock:
+            self.count += 1
+            self.total_seconds += seconds
+            if seconds > self.max_seconds:
+                self.max_seconds = seconds
+
+    def snapshot(self) -> Dict[str, float]:
+        with self._lock:
+            return {
+                "checkouts": self.count,
+                "wait_seconds_total": round(self.total_seconds, 6),
+                "wait_seconds_max": round(self.max_seconds, 6),
+            }
+
+
+class _CheckoutTimingMixin:
+    """connect()(체크아웃 대기 + pre-ping 포함) 소요 시간을 기록하는 풀 믹스인"""
+
+    wait_stats: PoolWaitStats
+    metrics_label = "sync"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.wait_stats = PoolWaitStats()
+
+    def connect(self):
+        started = time.perf_counter()
+        try:
+            return super().connect()
+        finally:
+            elapsed = time.perf_counter() - started
+            self.wait_stats.record(elapsed)
+            db_pool_checkout.observe(elapsed, self.metrics_label)
+
+
+class InstrumentedQueuePool(_CheckoutTimingMixin, QueuePool):
+    """동기 엔진용 계측 QueuePool"""
+
+
+class InstrumentedAsyncQueuePool(_CheckoutTimingMixin, AsyncAdaptedQueuePool):
+    """비동기 엔진용 계측 QueuePool"""
+
+    metrics_label = "async"
+
+
+def pool_stats(pool: Pool) -> Dict[str, float]:
+    """풀 게이지(사용 중, 오버플로, 유휴)와 체크아웃 대기 시간"""
+    stats: Dict[str, float] = {}
+    if isinstance(pool, QueuePool):
+        stats.update({
+            "size": pool.size(),
+            "checked_in": pool.checkedin(),
+            "checked_out": pool.checkedout(),
+            "overflow": max(0, pool.overflow()),
+        })
+    wait_stats = getattr(pool, "wait_stats", None)
+    if wait_stats is not None:
+        stats.update(wait_stats.snapshot())
+    return stats
@@ -1,15 +1,18 @@
-from .facility import SportsFacility
+from .facility import SportsFacility, FacilityStatistic
 from .region import Region
 from .proposal import Proposal, ProposalVote
 from .user import User, UserBadge
 from .report import RegionalReport
+from .counter import PlatformCounter
 
 __all__ = [
     "SportsFacility",
+    "FacilityStatistic",
     "Region",
     "Proposal",
     "ProposalVote",
     "User",
     "UserBadge", 
-    "RegionalReport"
+    "RegionalReport",
+    "PlatformCounter",
 ]
\ No newline at end of file
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Integer, Float, ForeignKey, Text, Date
+from sqlalchemy import Column, String, Integer, BigInteger, Float, ForeignKey, Text, Date, DateTime, Index, UniqueConstraint
 from sqlalchemy.orm import relationship
 
 from .base import Base
@@ -61,4 +61,36 @@ class PerformanceReward(Base):
     region = relationship("Region", foreign_keys=[estimated_region_code])
     
     def __repr__(self):
-        return f"<PerformanceReward(sport={self.sport_type}, amount={self.monthly_amount:,}원/월)>"
\ No newline at end of file
+        return f"<PerformanceReward(sport={self.sport_type}, amount={self.monthly_amount:,}원/월)>"
+
+
+class BudgetPerformance(Base):
+    """예산-성과 집계 (연도 × 지역 × 종목, /dashboard/budget-performance 조회용)
+
+    region_code='00'(전국), sport_type='전체', year=0(전체 연도)은 합계 행이다.
+    app.crud.budget_performance 가 원본 데이터가 바뀐 연도만 다시 계산한다.
+    """
+    
+    year = Column(Integer, nullable=False)  # 0 이면 전체 연도 합계
+    region_code = Column(String(10), nullable=False)  # '00' 이면 전국
+    sport_type = Column(String(100), nullable=False)  # '전체' 이면 전체 종목
+    
+    # 집계 값
+    budget_amount = Column(BigInteger, nullable=False, default=0)  # 지원금액 합계 (원)
+    reward_amount = Column(BigInteger, nullable=False, default=0)  # 성과금 월정금액 합계 (원)
+    budget_rows = Column(Integer, nullable=False, default=0)
+    reward_rows = Column(Integer, nullable=False, default=0)
+    performance_score = Column(Float, nullable=False, default=0)  # 0-100, 비교 집단 최대 성과금 대비
+    efficiency_ratio = Column(Float, nullable=True)  # 성과금 점유율 / 예산 점유율 (예산 없으면 NULL)
+    
+    # 변경 감지 (집계 시점의 원본 최근 updated_at)
+    source_updated_at = Column(DateTime, nullable=True)
+    
+    __table_args__ = (
+        # 종목 필터(+지역)는 이 제약의 인덱스, 지역만 필터는 아래 인덱스 사용
+        UniqueConstraint("year", "sport_type", "region_code", name="uq_budgetperformance_key"),
+        Index("ix_budgetperformance_region", "year", "region_code"),
+    )
+    
+    def __repr__(self):
+        return f"<BudgetPerformance(year={self.year}, region={self.region_code}, sport={self.sport_type})>"
@@ -0,0 +1,17 @@
+from sqlalchemy import BigInteger, Column, String
+
+from .base import Base
+
+
+class PlatformCounter(Base):
+    """플랫폼 전체 카운터 (/dashboard/stats 조회용)
+
+    sportsfacility/region/proposal 의 문장 단위 트리거가 삽입·삭제 행 수만큼 증감하고,
+    app.crud.counters.reconcile 이 주기적으로 실제 COUNT 와 맞춰 어긋남을 바로잡는다.
+    """
+    
+    name = Column(String(50), unique=True, nullable=False)  # total_facilities, total_regions, total_proposals
+    value = Column(BigInteger, nullable=False, default=0)
+    
+    def __repr__(self):
+        return f"<PlatformCounter(name={self.name}, value={self.value})>"
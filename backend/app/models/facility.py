@@ -1,7 +1,9 @@
-from sqlalchemy import Column, String, Float, Integer, Boolean, ForeignKey, Text, JSON
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, String, Float, Integer, Boolean, ForeignKey, Text, JSON, Index, LargeBinary, UniqueConstraint
+from sqlalchemy.orm import relationship, validates
 from geoalchemy2 import Geography
 
+from app.core.opening_hours import BITMAP_BYTES, build_bitmap
+
 from .base import Base
 
 
@@ -31,11 +33,28 @@ class SportsFacility(Base):
     # 추가 정보
     capacity = Column(Integer, nullable=True)  # 수용인원
     opening_hours = Column(JSON, nullable=True)  # 운영시간
+    open_hours_bitmap = Column(LargeBinary(BITMAP_BYTES), nullable=True)  # 주간 15분 단위 운영 비트맵 (미상이면 NULL)
     facilities_detail = Column(JSON, nullable=True)  # 세부시설 정보
     
+    # 동기화 정보
+    content_hash = Column(String(32), nullable=True)  # 원천 레코드 해시 (변경 감지)
+    is_deleted = Column(Boolean, default=False, server_default="false", nullable=False)  # 원천에서 사라진 시설
+    
     # 관계
     region = relationship("Region", foreign_keys=[region_code])
     
+    # 목록 키셋 페이지네이션용 복합 인덱스 (app.crud.facility.KEYSET_COLUMNS)
+    __table_args__ = (
+        Index("ix_sportsfacility_type_region_id", "facility_type", "region_code", "id"),
+        Index("ix_sportsfacility_region_type_id", "region_code", "facility_type", "id"),
+    )
+    
+    @validates("opening_hours")
+    def _sync_open_hours_bitmap(self, key, value):
+        """운영시간이 바뀌면 비트맵도 함께 갱신 (app.core.opening_hours)"""
+        self.open_hours_bitmap = build_bitmap(value)
+        return value
+
     def __repr__(self):
         return f"<SportsFacility(name={self.name}, type={self.facility_type})>"
 
@@ -60,4 +79,26 @@ class FacilityDemand(Base):
     region = relationship("Region", foreign_keys=[region_code])
     
     def __repr__(self):
-        return f"<FacilityDemand(region={self.region_code}, type={self.facility_type}, demand={self.demand_percentage}%)>"
\ No newline at end of file
+        return f"<FacilityDemand(region={self.region_code}, type={self.facility_type}, demand={self.demand_percentage}%)>"
+
+
+class FacilityStatistic(Base):
+    """시설 수 집계 (지역 × 시설유형 × 공공여부, /facilities/statistics 조회용)
+
+    level='sigungu' 행은 sportsfacility 를 직접 집계하고, level='sido' 행은
+    Region.parent_code 를 따라 시/군/구를 시/도로 합산한 값이다.
+    app.crud.statistics 가 시설 적재 시 변경된 지역만 다시 계산한다.
+    """
+    
+    region_code = Column(String(10), ForeignKey('region.code'), nullable=False)
+    level = Column(String(10), nullable=False)  # sido, sigungu
+    facility_type = Column(String(100), nullable=False)
+    is_public = Column(Boolean, nullable=False)
+    facility_count = Column(Integer, nullable=False, default=0)
+    
+    __table_args__ = (
+        UniqueConstraint("level", "region_code", "facility_type", "is_public", name="uq_facilitystatistic_key"),
+    )
+    
+    def __repr__(self):
+        return f"<FacilityStatistic(region={self.region_code}, type={self.facility_type}, count={self.facility_count})>"
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Integer, Boolean, ForeignKey, Text, JSON, DateTime
+from sqlalchemy import Column, String, Integer, Float, Boolean, ForeignKey, Text, JSON, DateTime
 from sqlalchemy.orm import relationship
 from datetime import datetime
 
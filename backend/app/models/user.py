@@ -25,6 +25,7 @@ class User(Base):
     # 계정 상태
     is_active = Column(Boolean, default=True)  # 활성 상태
     is_verified = Column(Boolean, default=False)  # 이메일 인증 상태
+    token_version = Column(Integer, default=0, server_default="0", nullable=False)  # 증가 시 기존 토큰 모두 폐기
     
     # 활동 통계
     proposal_count = Column(Integer, default=0)  # 작성한 제안 수
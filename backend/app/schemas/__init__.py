@@ -1,4 +1,13 @@
 from .user import User, UserCreate, UserUpdate, UserInDB
-from .token import Token, TokenData
+from .token import Token, TokenData, TokenPayload, RefreshTokenRequest
 
-__all__ = ["User", "UserCreate", "UserUpdate", "UserInDB", "Token", "TokenData"]
\ No newline at end of file
+__all__ = [
+    "User",
+    "UserCreate",
+    "UserUpdate",
+    "UserInDB",
+    "Token",
+    "TokenData",
+    "TokenPayload",
+    "RefreshTokenRequest",
+]
\ No newline at end of file
@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import List, Optional
 from pydantic import BaseModel
 
 
@@ -6,6 +6,27 @@ class Token(BaseModel):
     """액세스 토큰 응답"""
     access_token: str
     token_type: str = "bearer"
+    refresh_token: Optional[str] = None
+
+
+class RefreshTokenRequest(BaseModel):
+    """토큰 갱신 요청"""
+    refresh_token: str
+
+
+class TokenPayload(BaseModel):
+    """검증된 JWT 클레임"""
+    sub: str  # 사용자 ID
+    type: str  # access, refresh
+    exp: int
+    ver: int = 0  # 토큰 버전 (사용자 token_version과 다르면 폐기된 토큰)
+    act: bool = True  # 발급 시점 활성 상태
+    scopes: List[str] = []
+    jti: Optional[str] = None  # 리프레시 토큰 ID (한 번만 사용 가능)
+
+    @property
+    def user_id(self) -> int:
+        return int(self.sub)
 
 
 class TokenData(BaseModel):
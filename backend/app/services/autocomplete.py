@@ -0,0 +1,248 @@
+"""시설명 자동완성 인덱스 (워커 메모리)
+
+시설명과 이름 속 각 단어의 시작 위치를 키로 하는 정렬 배열에서 이분 탐색으로 접두어
+범위를 찾고, 범위 전체를 순위(이름 전체 일치 → 단어 일치, 짧은 이름 우선)로 정렬한다.
+한두 자모 입력처럼 범위가 SCAN_LIMIT 보다 넓은 접두어는 스냅샷을 만들 때 상위 목록을
+미리 계산해 둔다. 한글은 자모로 분해해 저장하므로 입력 중인 글자("잠ㅅ", "수여")도
+접두어로 일치한다. 시설 변경은 updated_at watermark 로 주기적으로(늦게 커밋된 변경을 위해
+겹치는 구간을 다시 읽음), 또는 적재 명령의 변경 알림(request_refresh)을 받으면 바로 반영한다.
+"""
+import asyncio
+import logging
+from bisect import bisect_left
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.models.facility import SportsFacility
+from app.services.watermark import ChangeWatermark
+
+
+logger = logging.getLogger(__name__)
+
+_CHO = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+_JUNG = (
+    "ㅏ", "ㅐ", "ㅑ", "ㅒ", "ㅓ", "ㅔ", "ㅕ", "ㅖ", "ㅗ", "ㅗㅏ", "ㅗㅐ",
+    "ㅗㅣ", "ㅛ", "ㅜ", "ㅜㅓ", "ㅜㅔ", "ㅜㅣ", "ㅠ", "ㅡ", "ㅡㅣ", "ㅣ",
+)
+_JONG = (
+    "", "ㄱ", "ㄲ", "ㄱㅅ", "ㄴ", "ㄴㅈ", "ㄴㅎ", "ㄷ", "ㄹ", "ㄹㄱ", "ㄹㅁ", "ㄹㅂ", "ㄹㅅ", "ㄹㅌ",
+    "ㄹㅍ", "ㄹㅎ", "ㅁ", "ㅂ", "ㅂㅅ", "ㅅ", "ㅆ", "ㅇ", "ㅈ", "ㅊ", "ㅋ", "ㅌ", "ㅍ", "ㅎ",
+)
+# 겹모음/겹받침 호환 자모 (입력 중 단독으로 올 수 있음)
+_COMPOUND_JAMO = {
+    "ㅘ": "ㅗㅏ", "ㅙ": "ㅗㅐ", "ㅚ": "ㅗㅣ", "ㅝ": "ㅜㅓ", "ㅞ": "ㅜㅔ", "ㅟ": "ㅜㅣ", "ㅢ": "ㅡㅣ",
+    "ㄳ": "ㄱㅅ", "ㄵ": "ㄴㅈ", "ㄶ": "ㄴㅎ", "ㄺ": "ㄹㄱ", "ㄻ": "ㄹㅁ", "ㄼ": "ㄹㅂ", "ㄽ": "ㄹㅅ",
+    "ㄾ": "ㄹㅌ", "ㄿ": "ㄹㅍ", "ㅀ": "ㄹㅎ", "ㅄ": "ㅂㅅ",
+}
+
+
+def _decompose_table() -> Dict[int, str]:
+    table = {ord(jamo): parts for jamo, parts in _COMPOUND_JAMO.items()}
+    for index in range(len(_CHO) * len(_JUNG) * len(_JONG)):
+        cho, rest = divmod(index, len(_JUNG) * len(_JONG))
+        jung, jong = divmod(rest, len(_JONG))
+        table[0xAC00 + index] = _CHO[cho] + _JUNG[jung] + _JONG[jong]
+    return table
+
+
+_DECOMPOSE = _decompose_table()
+
+# 질의 시 직접 순위를 매길 최대 키 범위. 더 넓은 접두어는 미리 계산한 상위 목록 사용
+SCAN_LIMIT = 2000
+# 넓은 접두어마다 (전체, 유형별로) 미리 계산해 두는 상위 시설 수 (/autocomplete limit 상한)
+TOP_PER_PREFIX = 20
+_KEY_END = "\U0010ffff"
+
+Facility = Tuple[str, str, str]  # (name, facility_type, region_code)
+Suggestion = Tuple[int, str, str, str]  # (id, name, facility_type, region_code)
+
+
+def normalize(value: str) -> str:
+    """소문자화, 공백/기호 제거, 한글 자모 분해"""
+    return "".join(ch for ch in value.lower() if ch.isalnum()).translate(_DECOMPOSE)
+
+
+class _Snapshot:
+    """정렬된 키 배열과 같은 순서의 (단어 위치, 이름 길이, id), 시설 정보, 넓은 접두어 상위 목록"""
+
+    def __init__(self, keys: List[str], entries: List[Tuple[int, int, int]], facilities: Dict[int, Facility]):
+        self.keys = keys
+        self.entries = entries
+        self.facilities = facilities
+        # 접두어 → {유형(None 은 전체): 순위순 id 목록}
+        self.top: Dict[str, Dict[Optional[str], List[int]]] = {}
+
+    def rank(self, lo: int, hi: int, facility_type: Optional[str] = None) -> List[int]:
+        """키 범위 [lo, hi) 의 시설 id 를 순위순으로 (시설마다 가장 좋은 키 기준)"""
+        facilities = self.facilities
+        best: Dict[int, Tuple[bool, int]] = {}
+        for position, length, facility_id in self.entries[lo:hi]:
+            if facility_type is not None and facilities[facility_id][1] != facility_type:
+                continue
+            rank = (position > 0, length)
+            if rank < best.get(facility_id, (True, length + 1)):
+                best[facility_id] = rank
+        ranked = sorted(best.items(), key=lambda item: (item[1], facilities[item[0]][0], item[0]))
+        return [facility_id for facility_id, _ in ranked]
+
+    def build_top(self) -> None:
+        """범위가 SCAN_LIMIT 보다 넓은 모든 접두어의 상위 목록 계산 (짧은 접두어부터 좁혀 감)"""
+        keys = self.keys
+        pending = [(0, len(keys), 0)]  # 같은 접두어(길이 depth)를 공유하는 키 범위
+        while pending:
+            lo, hi, depth = pending.pop()
+            start = lo
+            while start < hi:
+                prefix = keys[start][:depth + 1]
+                end = bisect_left(keys, prefix + _KEY_END, start, hi) if len(prefix) > depth else start + 1
+                if len(prefix) > depth and end - start > SCAN_LIMIT:
+                    ranked = self.rank(start, end)
+                    top: Dict[Optional[str], List[int]] = {None: ranked[:TOP_PER_PREFIX]}
+                    for facility_id in ranked:
+                        by_type = top.setdefault(self.facilities[facility_id][1], [])
+                        if len(by_type) < TOP_PER_PREFIX:
+                            by_type.append(facility_id)
+                    self.top[prefix] = top
+                    pending.append((start, end, depth + 1))
+                start = end
+
+
+class AutocompleteIndex:
+    """시설명 접두어 인덱스"""
+
+    def __init__(self, change_overlap: float = 0):
+        self._snapshot: Optional[_Snapshot] = None
+        self.watermark = ChangeWatermark(change_overlap)
+        self.refreshes = 0
+        self._wake: Optional[asyncio.Event] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @property
+    def ready(self) -> bool:
+        return self._snapshot is not None
+
+    def build(self, facilities: Dict[int, Facility]) -> None:
+        """시설 목록으로 새 스냅샷을 만들어 교체 (진행 중인 조회는 이전 스냅샷을 계속 사용)"""
+        items = []
+        for facility_id, (name, _, _) in facilities.items():
+            words = name.split()
+            for position in range(len(words)):
+                key = normalize("".join(words[position:]))
+                if key:
+                    items.append((key, position, len(name), facility_id))
+        items.sort()
+        snapshot = _Snapshot(
+            [item[0] for item in items],
+            [item[1:] for item in items],
+            facilities,
+        )
+        snapshot.build_top()
+        self._snapshot = snapshot
+
+    def apply_changes(self, upserts: Dict[int, Facility], deleted_ids: List[int]) -> None:
+        facilities = dict(self._snapshot.facilities) if self._snapshot is not None else {}
+        facilities.update(upserts)
+        for facility_id in deleted_ids:
+            facilities.pop(facility_id, None)
+        self.build(facilities)
+
+    def query(self, prefix: str, limit: int = 10, facility_type: Optional[str] = None) -> List[Suggestion]:
+        """접두어 일치 시설 (이름 전체 일치 → 단어 일치, 짧은 이름 우선)"""
+        snap = self._snapshot
+        key = normalize(prefix)
+        if snap is None or not key:
+            return []
+
+        lo = bisect_left(snap.keys, key)
+        hi = bisect_left(snap.keys, key + _KEY_END, lo)
+        top = snap.top.get(key)
+        if top is not None and limit <= TOP_PER_PREFIX:
+            ranked = top.get(facility_type, []) if facility_type is not None else top[None]
+        else:
+            ranked = snap.rank(lo, hi, facility_type)
+        return [(facility_id, *snap.facilities[facility_id]) for facility_id in ranked[:limit]]
+
+    async def _fetch(self, db: AsyncSession):
+        query = select(
+            SportsFacility.id,
+            SportsFacility.name,
+            SportsFacility.facility_type,
+            SportsFacility.region_code,
+            SportsFacility.updated_at,
+            SportsFacility.is_deleted,
+        )
+        since = self.watermark.since()
+        if since is not None:
+            query = query.where(SportsFacility.updated_at >= since)
+        return (await db.execute(query)).all()
+
+    async def load(self, db: AsyncSession) -> None:
+        """SportsFacility 전체로 인덱스 구성"""
+        self.watermark.reset(())
+        rows = await self._fetch(db)
+        facilities = {
+            row.id: (row.name, row.facility_type, row.region_code) for row in rows if not row.is_deleted
+        }
+        await asyncio.to_thread(self.build, facilities)
+        self.watermark.reset(rows)
+        logger.info("Autocomplete index built with %d facilities", len(facilities))
+
+    async def refresh(self, db: AsyncSession) -> int:
+        """watermark - overlap 이후 변경된 시설 중 아직 반영하지 않은 것만 반영
+
+        늦게 커밋된 변경도 잡도록 겹치는 구간을 다시 읽고, 이미 반영한 (id, updated_at)
+        은 건너뛰어 변경이 없으면 스냅샷을 다시 만들지 않는다. is_deleted 로 바뀐 시설은 제거.
+        """
+        if not self.ready:
+            await self.load(db)
+            return 0
+        rows = self.watermark.unseen(await self._fetch(db))
+        if rows:
+            upserts = {
+                row.id: (row.name, row.facility_type, row.region_code) for row in rows if not row.is_deleted
+            }
+            deleted_ids = [row.id for row in rows if row.is_deleted]
+            await asyncio.to_thread(self.apply_changes, upserts, deleted_ids)
+            self.watermark.advance(rows)
+            self.refreshes += 1
+        return len(rows)
+
+    def request_refresh(self) -> None:
+        """다음 주기를 기다리지 않고 반영 (다른 스레드에서 호출 가능)"""
+        if self._loop is not None and self._wake is not None:
+            self._loop.call_soon_threadsafe(self._wake.set)
+
+    async def run(self, session_factory, interval: float) -> None:
+        """기동 후 백그라운드 로드, 이후 interval 초마다 또는 변경 알림 시 반영 (lifespan 태스크)"""
+        self._loop = asyncio.get_running_loop()
+        self._wake = asyncio.Event()
+        while True:
+            try:
+                async with session_factory() as db:
+                    await self.refresh(db)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.warning("Autocomplete index refresh failed", exc_info=True)
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+
+    def stats(self) -> dict:
+        """인덱스 상태"""
+        snap = self._snapshot
+        return {
+            "ready": snap is not None,
+            "facilities": 0 if snap is None else len(snap.facilities),
+            "keys": 0 if snap is None else len(snap.keys),
+            "wide_prefixes": 0 if snap is None else len(snap.top),
+            "refreshes": self.refreshes,
+        }
+
+
+autocomplete_index = AutocompleteIndex(change_overlap=settings.FACILITY_CHANGE_OVERLAP_SECONDS)
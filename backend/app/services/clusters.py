@@ -0,0 +1,348 @@
+import asyncio
+import logging
+import math
+import threading
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.models.facility import SportsFacility
+from app.services.watermark import ChangeWatermark
+
+
+logger = logging.getLogger(__name__)
+
+# 줌 z 의 클러스터 격자는 축당 2^(z + CELL_BITS) 칸 (512px 타일 기준 약 64px 반경).
+# 칸 크기가 줌마다 정확히 절반이므로 z+1 의 칸은 z 의 칸 하나에 온전히 포함된다.
+CELL_BITS = 3
+TYPE_BITS = 8  # 레벨 키 하위 비트: 시설 유형 코드 (최대 256종)
+MAX_LATITUDE = 85.0511287798
+
+# (facility_id, lat, lng, facility_type)
+FacilityPoint = Tuple[int, float, float, str]
+
+
+def _project(np, lat, lng):
+    """경위도 → Web Mercator 정규 좌표 [0, 1)"""
+    lat = np.clip(np.asarray(lat, dtype=np.float64), -MAX_LATITUDE, MAX_LATITUDE)
+    x = (np.asarray(lng, dtype=np.float64) + 180.0) / 360.0
+    y = (1.0 - np.arcsinh(np.tan(np.radians(lat))) / math.pi) / 2.0
+    return np.clip(x, 0.0, 1.0 - 1e-12), np.clip(y, 0.0, 1.0 - 1e-12)
+
+
+def _unproject(np, x, y):
+    """Web Mercator 정규 좌표 → (lat, lng)"""
+    lng = x * 360.0 - 180.0
+    lat = np.degrees(np.arctan(np.sinh(math.pi * (1.0 - 2.0 * y))))
+    return lat, lng
+
+
+def _level_keys(np, z: int, x, y, type_codes):
+    """(칸 y, 칸 x, 유형) 을 정렬 가능한 int64 키로 인코딩"""
+    cells = 1 << (z + CELL_BITS)
+    cx = (x * cells).astype(np.int64)
+    cy = (y * cells).astype(np.int64)
+    return ((cy * cells + cx) << TYPE_BITS) | type_codes.astype(np.int64)
+
+
+def _group(np, keys, count, sum_x, sum_y):
+    """키별 합산 → (유일 키 오름차순, 개수, x 합, y 합)"""
+    unique, inverse = np.unique(keys, return_inverse=True)
+    return (
+        unique,
+        np.rint(np.bincount(inverse, weights=count, minlength=len(unique))).astype(np.int64),
+        np.bincount(inverse, weights=sum_x, minlength=len(unique)),
+        np.bincount(inverse, weights=sum_y, minlength=len(unique)),
+    )
+
+
+class _Level:
+    """한 줌 레벨의 (칸, 유형)별 집계. keys 오름차순 정렬 유지."""
+
+    __slots__ = ("keys", "count", "sum_x", "sum_y", "x", "y")
+
+    def __init__(self, keys, count, sum_x, sum_y):
+        self.keys = keys
+        self.count = count
+        self.sum_x = sum_x
+        self.sum_y = sum_y
+        self.x = sum_x / count
+        self.y = sum_y / count
+
+    @classmethod
+    def build(cls, np, keys, x, y) -> "_Level":
+        return cls(*_group(np, keys, np.ones(len(keys)), x, y))
+
+    def merge(self, np, keys, count, sum_x, sum_y) -> "_Level":
+        """증분 적용 (기존 키는 합산, 새 키는 삽입, 0개가 된 칸은 제거)"""
+        d_keys, d_count, d_sum_x, d_sum_y = _group(np, keys, count, sum_x, sum_y)
+        pos = np.searchsorted(self.keys, d_keys)
+        found = pos < len(self.keys)
+        found[found] = self.keys[pos[found]] == d_keys[found]
+
+        count = self.count.copy()
+        sum_x = self.sum_x.copy()
+        sum_y = self.sum_y.copy()
+        # d_keys 가 유일하므로 pos[found] 도 중복이 없다
+        count[pos[found]] += d_count[found]
+        sum_x[pos[found]] += d_sum_x[found]
+        sum_y[pos[found]] += d_sum_y[found]
+
+        new = ~found
+        keys = np.insert(self.keys, pos[new], d_keys[new])
+        count = np.insert(count, pos[new], d_count[new])
+        sum_x = np.insert(sum_x, pos[new], d_sum_x[new])
+        sum_y = np.insert(sum_y, pos[new], d_sum_y[new])
+
+        keep = count > 0
+        return _Level(keys[keep], count[keep], sum_x[keep], sum_y[keep])
+
+
+class _Snapshot:
+    """읽기 전용 인덱스 상태. 갱신 시 새 스냅샷으로 통째로 교체한다."""
+
+    __slots__ = ("ids", "lat", "lng", "x", "y", "type_codes", "levels")
+
+    def __init__(self, ids, lat, lng, x, y, type_codes, levels):
+        self.ids = ids
+        self.lat = lat
+        self.lng = lng
+        self.x = x
+        self.y = y
+        self.type_codes = type_codes
+        self.levels: List[_Level] = levels
+
+
+class ClusterIndex:
+    """줌 레벨별 격자 계층 클러스터 인덱스 (NumPy, 워커 메모리)
+
+    0..max_zoom 각 레벨은 (격자 칸, 시설 유형)별 개수와 좌표 합을 가진다.
+    max_zoom 을 넘는 줌에서는 개별 시설을 그대로 반환한다. 시설 변경은
+    apply_changes() 로 바뀐 점의 기여분만 각 레벨에 더하고 빼며, 조회는 항상
+    교체가 끝난 스냅샷을 읽으므로 잠금이 없다.
+    """
+
+    def __init__(self, max_zoom: int, change_overlap: float = 0):
+        self.max_zoom = max_zoom
+        self._snapshot: Optional[_Snapshot] = None
+        self._types: List[str] = []
+        self._type_codes: Dict[str, int] = {}
+        self._write_lock = threading.Lock()
+        self.watermark = ChangeWatermark(change_overlap)  # 반영한 updated_at
+        self.changes_applied = 0
+
+    @property
+    def ready(self) -> bool:
+        return self._snapshot is not None
+
+    def _codes_for(self, np, facility_types: Sequence[str]):
+        codes = np.empty(len(facility_types), dtype=np.int64)
+        for i, facility_type in enumerate(facility_types):
+            code = self._type_codes.get(facility_type)
+            if code is None:
+                if len(self._types) >= 1 << TYPE_BITS:
+                    raise ValueError("too many facility types for cluster index")
+                code = self._type_codes[facility_type] = len(self._types)
+                self._types.append(facility_type)
+            codes[i] = code
+        return codes
+
+    def _point_arrays(self, np, points: Sequence[FacilityPoint]):
+        ids = np.fromiter((p[0] for p in points), dtype=np.int64, count=len(points))
+        lat = np.fromiter((p[1] for p in points), dtype=np.float64, count=len(points))
+        lng = np.fromiter((p[2] for p in points), dtype=np.float64, count=len(points))
+        codes = self._codes_for(np, [p[3] for p in points])
+        x, y = _project(np, lat, lng)
+        return ids, lat, lng, x, y, codes
+
+    def build(self, points: Sequence[FacilityPoint]) -> None:
+        """전체 재구성 (기동 시 1회)"""
+        import numpy as np
+
+        with self._write_lock:
+            ids, lat, lng, x, y, codes = self._point_arrays(np, points)
+            order = np.argsort(ids, kind="stable")
+            ids, lat, lng, x, y, codes = (a[order] for a in (ids, lat, lng, x, y, codes))
+            levels = [
+                _Level.build(np, _level_keys(np, z, x, y, codes), x, y)
+                for z in range(self.max_zoom + 1)
+            ]
+            self._snapshot = _Snapshot(ids, lat, lng, x, y, codes, levels)
+
+    def apply_changes(
+        self,
+        upserts: Sequence[FacilityPoint] = (),
+        deleted_ids: Iterable[int] = (),
+    ) -> None:
+        """추가/이동/삭제된 시설만 반영하는 증분 갱신"""
+        import numpy as np
+
+        with self._write_lock:
+            snap = self._snapshot
+            if snap is None:
+                return
+
+            new_ids, new_lat, new_lng, new_x, new_y, new_codes = self._point_arrays(np, upserts)
+            changed = np.union1d(new_ids, np.fromiter(deleted_ids, dtype=np.int64))
+            pos = np.searchsorted(snap.ids, changed)
+            exists = pos < len(snap.ids)
+            exists[exists] = snap.ids[pos[exists]] == changed[exists]
+            old = pos[exists]
+
+            keep = np.ones(len(snap.ids), dtype=bool)
+            keep[old] = False
+            ids = np.concatenate([snap.ids[keep], new_ids])
+            order = np.argsort(ids, kind="stable")
+            arrays = [
+                np.concatenate([getattr(snap, name)[keep], new])[order]
+                for name, new in (
+                    ("lat", new_lat), ("lng", new_lng), ("x", new_x), ("y", new_y),
+                    ("type_codes", new_codes),
+                )
+            ]
+
+            removed = -np.ones(len(old))
+            added = np.ones(len(new_ids))
+            levels = []
+            for z, level in enumerate(snap.levels):
+                keys = np.concatenate([
+                    _level_keys(np, z, snap.x[old], snap.y[old], snap.type_codes[old]),
+                    _level_keys(np, z, new_x, new_y, new_codes),
+                ])
+                levels.append(level.merge(
+                    np,
+                    keys,
+                    np.concatenate([removed, added]),
+                    np.concatenate([-snap.x[old], new_x]),
+                    np.concatenate([-snap.y[old], new_y]),
+                ))
+
+            self._snapshot = _Snapshot(ids[order], *arrays, levels)
+            self.changes_applied += len(changed)
+
+    def query(
+        self,
+        bbox: Tuple[float, float, float, float],
+        zoom: int,
+        facility_type: Optional[str] = None,
+    ) -> List[dict]:
+        """bbox(min_lng, min_lat, max_lng, max_lat) 안의 클러스터/시설 목록"""
+        import numpy as np
+
+        snap = self._snapshot
+        if snap is None:
+            return []
+
+        type_code = None
+        if facility_type is not None:
+            type_code = self._type_codes.get(facility_type)
+            if type_code is None:
+                return []
+
+        min_lng, min_lat, max_lng, max_lat = bbox
+        xs, ys = _project(np, [min_lat, max_lat], [min_lng, max_lng])
+        min_x, max_x = xs
+        max_y, min_y = ys  # Mercator y 는 남쪽으로 증가
+
+        if zoom > self.max_zoom:
+            mask = (snap.x >= min_x) & (snap.x <= max_x) & (snap.y >= min_y) & (snap.y <= max_y)
+            if type_code is not None:
+                mask &= snap.type_codes == type_code
+            return [
+                {"lat": lat, "lng": lng, "count": 1, "facility_id": facility_id}
+                for facility_id, lat, lng in zip(
+                    snap.ids[mask].tolist(), snap.lat[mask].tolist(), snap.lng[mask].tolist()
+                )
+            ]
+
+        level = snap.levels[max(0, zoom)]
+        mask = (level.x >= min_x) & (level.x <= max_x) & (level.y >= min_y) & (level.y <= max_y)
+        if type_code is not None:
+            mask &= (level.keys & ((1 << TYPE_BITS) - 1)) == type_code
+        keys = level.keys[mask] >> TYPE_BITS
+        if len(keys) == 0:
+            return []
+
+        # 같은 칸의 유형별 행은 키 정렬상 연속이므로 reduceat 으로 칸 단위 합산
+        starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]])
+        count = np.add.reduceat(level.count[mask], starts)
+        lat, lng = _unproject(
+            np,
+            np.add.reduceat(level.sum_x[mask], starts) / count,
+            np.add.reduceat(level.sum_y[mask], starts) / count,
+        )
+        return [
+            {"lat": a, "lng": b, "count": c, "facility_id": None}
+            for a, b, c in zip(lat.tolist(), lng.tolist(), count.tolist())
+        ]
+
+    async def _fetch(self, db: AsyncSession):
+        query = select(
+            SportsFacility.id,
+            SportsFacility.latitude,
+            SportsFacility.longitude,
+            SportsFacility.facility_type,
+            SportsFacility.updated_at,
+            SportsFacility.is_deleted,
+        )
+        since = self.watermark.since()
+        if since is not None:
+            query = query.where(SportsFacility.updated_at >= since)
+        return (await db.execute(query)).all()
+
+    async def load(self, db: AsyncSession) -> None:
+        """SportsFacility 전체로 인덱스 구성"""
+        self.watermark.reset(())
+        rows = await self._fetch(db)
+        points = [(row.id, row.latitude, row.longitude, row.facility_type) for row in rows if not row.is_deleted]
+        await asyncio.to_thread(self.build, points)
+        self.watermark.reset(rows)
+        logger.info("Cluster index built with %d facilities", len(rows))
+
+    async def refresh(self, db: AsyncSession) -> int:
+        """watermark - overlap 이후 변경된 시설 중 아직 반영하지 않은 것만 증분 반영
+
+        늦게 커밋된 변경도 잡도록 겹치는 구간을 다시 읽고, 이미 반영한 (id, updated_at)
+        은 건너뛴다. is_deleted 로 바뀐 시설은 제거.
+        """
+        if not self.ready:
+            await self.load(db)
+            return 0
+        rows = self.watermark.unseen(await self._fetch(db))
+        if rows:
+            points = [(row.id, row.latitude, row.longitude, row.facility_type) for row in rows if not row.is_deleted]
+            deleted_ids = [row.id for row in rows if row.is_deleted]
+            await asyncio.to_thread(self.apply_changes, points, deleted_ids)
+            self.watermark.advance(rows)
+        return len(rows)
+
+    async def run(self, session_factory, interval: float) -> None:
+        """기동 후 백그라운드 로드, 이후 interval 초마다 증분 반영 (lifespan 태스크)"""
+        while True:
+            try:
+                async with session_factory() as db:
+                    await self.refresh(db)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.warning("Cluster index refresh failed", exc_info=True)
+            await asyncio.sleep(interval)
+
+    def stats(self) -> dict:
+        """인덱스 상태"""
+        snap = self._snapshot
+        return {
+            "ready": snap is not None,
+            "facilities": 0 if snap is None else len(snap.ids),
+            "max_zoom": self.max_zoom,
+            "clusters_at_zoom_0": 0 if snap is None else len(snap.levels[0].keys),
+            "changes_applied": self.changes_applied,
+        }
+
+
+cluster_index = ClusterIndex(
+    max_zoom=settings.CLUSTER_MAX_ZOOM,
+    change_overlap=settings.FACILITY_CHANGE_OVERLAP_SECONDS,
+)
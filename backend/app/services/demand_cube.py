@@ -0,0 +1,257 @@
+"""시설 수요(FacilityDemand) 컬럼형 큐브 (NumPy, 워커 메모리)
+
+차원 컬럼은 사전 인코딩(값 목록 + 정수 코드 배열)하고 demand_percentage 는 float
+배열로 들고 있다가, 필터는 코드 비교 마스크로, group-by 는 차원 코드를 하나의
+정수 키로 합친 뒤 bincount 로 집계한다. NULL 인 인구통계 차원은 '전체' 응답 행이므로
+값 None 인 별도 항목으로 다루고, 묶지도 거르지도 않은 인구통계 차원은 '전체' 행으로
+한정한다(연령대별 행과 전체 행을 함께 평균내지 않도록). 테이블 변경은 행 수/최근 updated_at 으로 감지해
+통째로 다시 읽는다.
+"""
+import asyncio
+import logging
+from datetime import datetime
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.facility import FacilityDemand
+from app.models.region import Region
+
+
+logger = logging.getLogger(__name__)
+
+DIMENSIONS = (
+    "region_code", "facility_type", "survey_year", "age_group", "gender", "occupation", "income_level",
+)
+DEMOGRAPHICS = ("age_group", "gender", "occupation", "income_level")
+
+# 인구통계 차원 필터에서 NULL('전체' 응답 행)을 고르는 값
+OVERALL = "전체"
+
+
+class UnknownDimension(ValueError):
+    """큐브에 없는 차원"""
+
+
+def _sort_key(value):
+    return (value is not None, value)
+
+
+class _Cube:
+    """차원별 (값 목록, 코드 배열)과 수요 비율 배열"""
+
+    def __init__(self, values: Dict[str, list], codes: Dict, demand, region_names: Dict[str, str]):
+        self.values = values
+        self.codes = codes
+        self.demand = demand
+        self.region_names = region_names
+        self.lookup = {dim: {value: code for code, value in enumerate(vals)} for dim, vals in values.items()}
+
+    def __len__(self) -> int:
+        return len(self.demand)
+
+
+def _check_dimensions(dims: Sequence[str]) -> None:
+    for dim in dims:
+        if dim not in DIMENSIONS:
+            raise UnknownDimension(dim)
+
+
+def _scoped_filters(dims: Sequence[str], filters: Dict[str, object]) -> Dict[str, object]:
+    """묶지도 거르지도 않은 인구통계 차원은 NULL('전체' 행)로 한정"""
+    scoped = dict(filters)
+    for dim in DEMOGRAPHICS:
+        if dim not in dims and dim not in scoped:
+            scoped[dim] = None
+    return scoped
+
+
+class DemandCube:
+    """FacilityDemand group-by/필터/피벗 조회"""
+
+    def __init__(self):
+        self._cube: Optional[_Cube] = None
+        self._version: Optional[Tuple[int, Optional[datetime]]] = None  # (행 수, max(updated_at))
+        self.reloads = 0
+
+    @property
+    def ready(self) -> bool:
+        return self._cube is not None
+
+    def build(self, rows: Sequence[Sequence], region_names: Optional[Dict[str, str]] = None) -> None:
+        """DIMENSIONS 순서 값 + demand_percentage 행으로 큐브 구성"""
+        import numpy as np
+
+        values, codes = {}, {}
+        for position, dim in enumerate(DIMENSIONS):
+            column = [row[position] for row in rows]
+            vals = sorted(set(column), key=_sort_key)
+            lookup = {value: code for code, value in enumerate(vals)}
+            values[dim] = vals
+            codes[dim] = np.fromiter((lookup[value] for value in column), dtype=np.int32, count=len(column))
+        demand = np.fromiter((row[len(DIMENSIONS)] for row in rows), dtype=np.float64, count=len(rows))
+        self._cube = _Cube(values, codes, demand, dict(region_names or {}))
+
+    def _mask(self, np, cube: _Cube, filters: Dict[str, object]):
+        mask = np.ones(len(cube), dtype=bool)
+        for dim, value in filters.items():
+            code = cube.lookup[dim].get(value)
+            if code is None:
+                return np.zeros(len(cube), dtype=bool)
+            mask &= cube.codes[dim] == code
+        return mask
+
+    def _aggregate(self, np, cube: _Cube, dims: Sequence[str], mask):
+        """마스크 행을 dims 로 묶어 (그룹별 차원 코드 목록, 평균, 최소, 최대, 행 수)"""
+        key = np.zeros(int(mask.sum()), dtype=np.int64)
+        for dim in dims:
+            key = key * len(cube.values[dim]) + cube.codes[dim][mask]
+        groups, inverse = np.unique(key, return_inverse=True)
+        demand = cube.demand[mask]
+
+        count = np.bincount(inverse, minlength=len(groups))
+        total = np.bincount(inverse, weights=demand, minlength=len(groups))
+        low = np.full(len(groups), np.inf)
+        high = np.full(len(groups), -np.inf)
+        np.minimum.at(low, inverse, demand)
+        np.maximum.at(high, inverse, demand)
+
+        group_codes = []
+        remaining = groups
+        for dim in reversed(dims):
+            remaining, code = np.divmod(remaining, len(cube.values[dim]))
+            group_codes.append(code)
+        group_codes.reverse()
+        return group_codes, total / np.maximum(count, 1), low, high, count
+
+    def group_by(self, dims: Sequence[str], filters: Optional[Dict[str, object]] = None) -> List[dict]:
+        """filters 로 거른 행을 dims 별로 묶은 평균 수요 비율 (차원 값 순)
+
+        filters 값 None 은 NULL('전체' 행)을 고른다.
+        """
+        import numpy as np
+
+        filters = filters or {}
+        _check_dimensions(list(dims) + list(filters))
+        cube = self._cube
+        if cube is None:
+            return []
+
+        mask = self._mask(np, cube, _scoped_filters(dims, filters))
+        if not mask.any():
+            return []
+        group_codes, mean, low, high, count = self._aggregate(np, cube, dims, mask)
+
+        columns = [[cube.values[dim][code] for code in codes.tolist()] for dim, codes in zip(dims, group_codes)]
+        results = []
+        for i, (avg, min_, max_, rows) in enumerate(zip(mean.tolist(), low.tolist(), high.tolist(), count.tolist())):
+            item = {dim: column[i] for dim, column in zip(dims, columns)}
+            if "region_code" in item:
+                item["region_name"] = cube.region_names.get(item["region_code"])
+            item.update(
+                demand_percentage=round(avg, 2),
+                min_percentage=min_,
+                max_percentage=max_,
+                rows=rows,
+            )
+            results.append(item)
+        return results
+
+    def pivot(
+        self,
+        rows: Sequence[str],
+        column: str,
+        filters: Optional[Dict[str, object]] = None,
+    ) -> dict:
+        """rows 차원 × column 차원 평균 수요 비율 표 (해당 조합이 없으면 None)"""
+        import numpy as np
+
+        filters = filters or {}
+        _check_dimensions(list(rows) + [column] + list(filters))
+        cube = self._cube
+        if cube is None:
+            return {"columns": [], "rows": []}
+
+        mask = self._mask(np, cube, _scoped_filters(list(rows) + [column], filters))
+        if not mask.any():
+            return {"columns": [], "rows": []}
+        group_codes, mean, _, _, _ = self._aggregate(np, cube, list(rows) + [column], mask)
+
+        column_codes = np.unique(group_codes[-1])
+        row_key = np.zeros(len(mean), dtype=np.int64)
+        for dim, codes in zip(rows, group_codes[:-1]):
+            row_key = row_key * len(cube.values[dim]) + codes
+        row_groups, row_index = np.unique(row_key, return_inverse=True)
+
+        table = np.full((len(row_groups), len(column_codes)), np.nan)
+        table[row_index, np.searchsorted(column_codes, group_codes[-1])] = np.round(mean, 2)
+
+        row_codes = []
+        remaining = row_groups
+        for dim in reversed(rows):
+            remaining, code = np.divmod(remaining, len(cube.values[dim]))
+            row_codes.append(code.tolist())
+        row_codes.reverse()
+        return {
+            "columns": [cube.values[column][code] for code in column_codes.tolist()],
+            "rows": [
+                {
+                    "key": {dim: cube.values[dim][codes[i]] for dim, codes in zip(rows, row_codes)},
+                    "values": [None if value != value else value for value in values],  # NaN → None
+                }
+                for i, values in enumerate(table.tolist())
+            ],
+        }
+
+    async def _current_version(self, db: AsyncSession):
+        result = await db.execute(select(func.count(), func.max(FacilityDemand.updated_at)))
+        return tuple(result.one())
+
+    async def load(self, db: AsyncSession) -> None:
+        """FacilityDemand 전체로 큐브 구성"""
+        version = await self._current_version(db)
+        result = await db.execute(
+            select(*(getattr(FacilityDemand, dim) for dim in DIMENSIONS), FacilityDemand.demand_percentage)
+        )
+        rows = result.all()
+        region_names = dict((await db.execute(select(Region.code, Region.full_name))).all())
+        await asyncio.to_thread(self.build, rows, region_names)
+        self._version = version
+        self.reloads += 1
+        logger.info("Demand cube built with %d rows", len(rows))
+
+    async def refresh(self, db: AsyncSession) -> bool:
+        """테이블이 바뀌었으면 다시 읽기"""
+        if self._version is not None and await self._current_version(db) == self._version:
+            return False
+        await self.load(db)
+        return True
+
+    async def run(self, session_factory, interval: float) -> None:
+        """기동 후 백그라운드 로드, 이후 interval 초마다 변경 확인 (lifespan 태스크)"""
+        while True:
+            try:
+                async with session_factory() as db:
+                    await self.refresh(db)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.warning("Demand cube refresh failed", exc_info=True)
+            await asyncio.sleep(interval)
+
+    def stats(self) -> dict:
+        """큐브 상태"""
+        cube = self._cube
+        return {
+            "ready": cube is not None,
+            "rows": 0 if cube is None else len(cube),
+            "reloads": self.reloads,
+            **{
+                f"{dim}_values": 0 if cube is None else len(cube.values[dim])
+                for dim in DIMENSIONS
+            },
+        }
+
+
+demand_cube = DemandCube()
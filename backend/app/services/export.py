@@ -0,0 +1,303 @@
+"""시설 데이터 내보내기 (CSV / GeoJSON / Parquet 스트리밍)
+
+서버 측 커서로 받은 배치를 곧바로 형식별로 인코딩해 내보내므로 행 수와 관계없이
+메모리 사용량이 일정하다. 같은 (형식, 필터, 데이터 버전) 결과는 디스크에 한 번만
+만들어 두고 이후 요청은 파일을 그대로 보낸다. CSV/GeoJSON 은 gzip 으로 저장해
+Accept-Encoding 에 gzip 이 있으면 그대로, 없으면 풀어서 보낸다. Parquet 은 열 단위
+압축을 쓰므로 gzip 을 적용하지 않으며, pyarrow 가 설치된 경우에만 지원한다.
+"""
+import asyncio
+import csv
+import glob
+import hashlib
+import importlib.util
+import io
+import json
+import os
+import threading
+import zlib
+from typing import AsyncIterable, AsyncIterator, Dict, Iterator, List, Optional, Sequence
+
+from app.core.config import settings
+
+# 컬럼/인코딩이 바뀌면 올려 기존 결과 파일 무효화
+ARTIFACT_VERSION = 1
+
+EXPORT_COLUMNS = (
+    "facility_code", "name", "facility_type", "address", "latitude", "longitude",
+    "region_code", "region_name", "operator", "is_public",
+)
+
+MEDIA_TYPES = {
+    "csv": "text/csv; charset=utf-8",
+    "geojson": "application/geo+json",
+    "parquet": "application/vnd.apache.parquet",
+}
+
+GZIP_FORMATS = {"csv", "geojson"}
+READ_CHUNK = 64 * 1024
+
+
+def accepts_gzip(accept_encoding: Optional[str]) -> bool:
+    """Accept-Encoding 헤더가 gzip 을 허용하는지 (q=0 은 거부)"""
+    for part in (accept_encoding or "").split(","):
+        coding, _, params = part.strip().partition(";")
+        if coding.strip().lower() not in ("gzip", "*"):
+            continue
+        quality = params.strip()
+        if quality.startswith("q="):
+            try:
+                return float(quality[2:]) > 0
+            except ValueError:
+                return False
+        return True
+    return False
+
+
+class _CsvEncoder:
+    def start(self) -> bytes:
+        # Excel 에서 한글이 깨지지 않도록 BOM 포함
+        return ("\ufeff" + ",".join(EXPORT_COLUMNS) + "\r\n").encode("utf-8")
+
+    def batch(self, rows: Sequence) -> bytes:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        for row in rows:
+            writer.writerow([getattr(row, column) for column in EXPORT_COLUMNS])
+        return buffer.getvalue().encode("utf-8")
+
+    def finish(self) -> bytes:
+        return b""
+
+
+class _GeoJsonEncoder:
+    def __init__(self):
+        self._first = True
+
+    def start(self) -> bytes:
+        return b'{"type":"FeatureCollection","features":['
+
+    def batch(self, rows: Sequence) -> bytes:
+        features = []
+        for row in rows:
+            features.append(json.dumps(
+                {
+                    "type": "Feature",
+                    "geometry": {"type": "Point", "coordinates": [row.longitude, row.latitude]},
+                    "properties": {
+                        column: getattr(row, column)
+                        for column in EXPORT_COLUMNS if column not in ("latitude", "longitude")
+                    },
+                },
+                ensure_ascii=False,
+                separators=(",", ":"),
+            ))
+        if not features:
+            return b""
+        prefix = "" if self._first else ","
+        self._first = False
+        return (prefix + ",".join(features)).encode("utf-8")
+
+    def finish(self) -> bytes:
+        return b"]}"
+
+
+class _Sink(io.RawIOBase):
+    """ParquetWriter 출력을 모아 두었다가 배치마다 내보내는 파일 객체"""
+
+    def __init__(self):
+        self._chunks: List[bytes] = []
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        data = bytes(data)
+        self._chunks.append(data)
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks = []
+        return data
+
+
+class _ParquetEncoder:
+    """배치마다 row group 하나 (푸터는 finish 에서 기록)"""
+
+    def __init__(self):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        self._pa = pa
+        self._schema = pa.schema([
+            ("facility_code", pa.string()),
+            ("name", pa.string()),
+            ("facility_type", pa.string()),
+            ("address", pa.string()),
+            ("latitude", pa.float64()),
+            ("longitude", pa.float64()),
+            ("region_code", pa.string()),
+            ("region_name", pa.string()),
+            ("operator", pa.string()),
+            ("is_public", pa.bool_()),
+        ])
+        self._sink = _Sink()
+        self._writer = pq.ParquetWriter(self._sink, self._schema, compression="zstd")
+
+    def start(self) -> bytes:
+        return self._sink.drain()
+
+    def batch(self, rows: Sequence) -> bytes:
+        table = self._pa.Table.from_pydict(
+            {column: [getattr(row, column) for row in rows] for column in EXPORT_COLUMNS},
+            schema=self._schema,
+        )
+        self._writer.write_table(table)
+        return self._sink.drain()
+
+    def finish(self) -> bytes:
+        self._writer.close()
+        return self._sink.drain()
+
+
+def format_available(fmt: str) -> bool:
+    """형식에 필요한 선택 의존성 설치 여부 (parquet → pyarrow)"""
+    return fmt != "parquet" or importlib.util.find_spec("pyarrow") is not None
+
+
+def _encoder(fmt: str):
+    if fmt == "csv":
+        return _CsvEncoder()
+    if fmt == "geojson":
+        return _GeoJsonEncoder()
+    return _ParquetEncoder()
+
+
+class FacilityExporter:
+    """내보내기 스트림 생성과 결과 파일 캐시"""
+
+    def __init__(self, directory: Optional[str], max_files: int):
+        self.directory = directory or None
+        self.max_files = max_files
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.written = 0
+
+    def artifact_key(self, fmt: str, filters: Dict[str, Optional[str]], data_version: str) -> str:
+        payload = json.dumps([ARTIFACT_VERSION, fmt, sorted(filters.items()), data_version], ensure_ascii=False)
+        return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+    def _path(self, fmt: str, key: str) -> str:
+        suffix = f"{fmt}.gz" if fmt in GZIP_FORMATS else fmt
+        return os.path.join(self.directory, f"{key}.{suffix}")
+
+    def cached_path(self, fmt: str, key: str) -> Optional[str]:
+        """결과 파일 경로 (없으면 None)"""
+        if self.directory is None:
+            return None
+        path = self._path(fmt, key)
+        if not os.path.exists(path):
+            return None
+        self.hits += 1
+        return path
+
+    def read_cached(self, path: str, decompress: bool) -> Iterator[bytes]:
+        """결과 파일 조각 (gzip 을 받지 않는 클라이언트에는 풀어서, 블로킹 I/O)"""
+        decompressor = zlib.decompressobj(wbits=31) if decompress else None
+        with open(path, "rb") as fp:
+            while True:
+                chunk = fp.read(READ_CHUNK)
+                if not chunk:
+                    break
+                yield decompressor.decompress(chunk) if decompressor else chunk
+        if decompressor:
+            yield decompressor.flush()
+
+    async def stream(
+        self,
+        fmt: str,
+        key: str,
+        batches: AsyncIterable[Sequence],
+        gzip_response: bool,
+    ) -> AsyncIterator[bytes]:
+        """배치를 인코딩해 내보내며 결과 파일도 함께 기록 (끝까지 보낸 경우에만 캐시)
+
+        gzip_response 는 CSV/GeoJSON 에서만 의미가 있다.
+        """
+        encoder = _encoder(fmt)
+        self.misses += 1
+
+        fp = tmp_path = None
+        if self.directory is not None:
+            os.makedirs(self.directory, exist_ok=True)
+            tmp_path = f"{self._path(fmt, key)}.{os.getpid()}.{threading.get_ident()}.tmp"
+            fp = open(tmp_path, "wb")
+
+        compress = fmt in GZIP_FORMATS and (fp is not None or gzip_response)
+        compressor = zlib.compressobj(6, zlib.DEFLATED, 31) if compress else None
+
+        async def emit(raw: bytes, final: bool = False):
+            stored = raw
+            if compressor is not None:
+                stored = compressor.compress(raw) + (compressor.flush() if final else b"")
+            if fp is not None and stored:
+                await asyncio.to_thread(fp.write, stored)
+            return stored if compress and gzip_response else raw
+
+        completed = False
+        try:
+            chunk = await emit(encoder.start())
+            if chunk:
+                yield chunk
+            async for rows in batches:
+                chunk = await emit(encoder.batch(rows))
+                if chunk:
+                    yield chunk
+            chunk = await emit(encoder.finish(), final=True)
+            if chunk:
+                yield chunk
+            completed = True
+        finally:
+            if fp is not None:
+                fp.close()
+                if completed:
+                    os.replace(tmp_path, self._path(fmt, key))
+                    self.written += 1
+                    await asyncio.to_thread(self._prune)
+                else:
+                    os.remove(tmp_path)
+
+    def _prune(self) -> None:
+        """max_files 를 넘는 오래된 결과 파일 삭제"""
+        with self._lock:
+            paths = [path for path in glob.glob(os.path.join(self.directory, "*")) if not path.endswith(".tmp")]
+            if len(paths) <= self.max_files:
+                return
+            paths.sort(key=os.path.getmtime)
+            for path in paths[:len(paths) - self.max_files]:
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+
+    def stats(self) -> dict:
+        """캐시 통계"""
+        return {
+            "enabled": self.directory is not None,
+            "hits": self.hits,
+            "misses": self.misses,
+            "written": self.written,
+        }
+
+
+facility_exporter = FacilityExporter(
+    directory=settings.EXPORT_CACHE_DIR and os.path.join(settings.EXPORT_CACHE_DIR, f"v{ARTIFACT_VERSION}"),
+    max_files=settings.EXPORT_CACHE_MAX_FILES,
+)
@@ -0,0 +1,102 @@
+import json
+import logging
+import threading
+from dataclasses import dataclass, field
+from typing import List, Set, Tuple
+
+from app.core.cache import get_redis
+from app.services.autocomplete import autocomplete_index
+from app.services.tiles import tile_cache
+
+
+logger = logging.getLogger(__name__)
+
+CHANNEL = "facility:changes"
+
+
+@dataclass
+class FacilityChangeset:
+    """동기화 1회의 시설 변경 내역 (캐시/집계 선택 무효화용)"""
+    added: List[int] = field(default_factory=list)
+    changed: List[int] = field(default_factory=list)
+    removed: List[int] = field(default_factory=list)
+    regions: Set[str] = field(default_factory=set)  # 변경 전/후 region_code
+    points: List[Tuple[float, float]] = field(default_factory=list)  # 변경 전/후 (lat, lng)
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.changed or self.removed)
+
+    def to_dict(self) -> dict:
+        return {
+            "added": self.added,
+            "changed": self.changed,
+            "removed": self.removed,
+            "regions": sorted(self.regions),
+            "points": [list(point) for point in self.points],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "FacilityChangeset":
+        return cls(
+            added=list(data.get("added", [])),
+            changed=list(data.get("changed", [])),
+            removed=list(data.get("removed", [])),
+            regions=set(data.get("regions", [])),
+            points=[tuple(point) for point in data.get("points", [])],
+        )
+
+
+def publish_changeset(changeset: FacilityChangeset) -> bool:
+    """다른 프로세스(API 워커)에 변경 내역 전파 (REDIS_URL 미설정/장애 시 False)"""
+    client = get_redis()
+    if client is None or not changeset:
+        return False
+    try:
+        client.publish(CHANNEL, json.dumps(changeset.to_dict()))
+    except Exception as exc:
+        logger.warning("facility changeset publish failed: %s", exc)
+        return False
+    return True
+
+
+class FacilityChangeListener:
+    """API 워커에서 변경 내역을 받아 워커 로컬 캐시를 무효화
+
+    벡터 타일 메모리 캐시는 바뀐 좌표의 타일만 지우고, 자동완성 인덱스는 바로
+    증분 반영을 요청한다. 클러스터 인덱스는 updated_at watermark 로 주기적으로
+    따라잡으므로 여기서 다루지 않는다.
+    """
+
+    def __init__(self):
+        self._thread = None
+        self._lock = threading.Lock()
+        self.received = 0
+
+    def start(self) -> None:
+        client = get_redis()
+        if client is None:
+            return
+        with self._lock:
+            if self._thread is not None:
+                return
+            try:
+                pubsub = client.pubsub(ignore_subscribe_messages=True)
+                pubsub.subscribe(**{CHANNEL: self._on_message})
+                self._thread = pubsub.run_in_thread(sleep_time=1.0, daemon=True)
+            except Exception as exc:  # Redis 미가동 시 TTL 만료에 맡김
+                logger.warning("facility change listener disabled: %s", exc)
+
+    def stop(self) -> None:
+        with self._lock:
+            if self._thread is not None:
+                self._thread.stop()
+                self._thread = None
+
+    def _on_message(self, message: dict) -> None:
+        changeset = FacilityChangeset.from_dict(json.loads(message["data"]))
+        self.received += 1
+        tile_cache.invalidate_points(changeset.points)
+        autocomplete_index.request_refresh()
+
+
+facility_change_listener = FacilityChangeListener()
@@ -0,0 +1,441 @@
+"""전국공공체육시설 API 적재(델타 동기화) 파이프라인
+
+페이지를 공유 httpx.AsyncClient 로 동시에(세마포어 제한) 받아 도착 순서대로
+레코드를 파싱하고 레코드별 content_hash 를 계산한다. 저장된 해시와 같은 레코드는
+건너뛰고, 바뀐 레코드만 배치 단위로 임시 스테이징 테이블에 COPY 한 뒤
+`INSERT ... ON CONFLICT (facility_code)` 로 반영한다. region_code 는 좌표가 속한
+행정구역 경계로 다시 정한다(경계가 없으면 원천 코드). 전체 동기화에서는 원천에서
+사라진 시설을 is_deleted 로 표시하고, 결과를 FacilityChangeset 으로 돌려준다.
+
+원천 API 레코드에는 운영시간 필드가 없으므로 opening_hours 와 open_hours_bitmap 은
+적재 대상이 아니다. upsert 는 두 컬럼을 쓰지 않아 ORM(@validates)이나
+build_open_hours 명령으로 채운 값이 그대로 함께 유지된다.
+"""
+import asyncio
+import hashlib
+import random
+import time
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Dict, List, Optional, Set, Tuple
+
+import httpx
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+from app.core.config import settings
+from app.services.facility_changes import FacilityChangeset
+from app.services.region_assign import locate_region_sql
+
+# API 응답 필드 → sportsfacility 컬럼 (운영시간 필드는 원천에 없음)
+FIELD_MAP = {
+    "faci_cd": "facility_code",
+    "faci_nm": "name",
+    "ftype_nm": "facility_type",
+    "fcob_nm": "sub_facility_type",
+    "cpb_cd": "region_code",
+    "faci_road_addr": "address",
+    "faci_lat": "latitude",
+    "faci_lot": "longitude",
+    "fmng_cp_nm": "operator",
+    "faci_tel_no": "phone",
+    "faci_homepage": "website",
+    "faci_gb_nm": "is_public",
+}
+
+STAGING_COLUMNS = (
+    "facility_code", "name", "facility_type", "sub_facility_type", "region_code", "address",
+    "latitude", "longitude", "operator", "phone", "website", "is_public", "content_hash",
+)
+
+RETRY_STATUS = {429, 500, 502, 503, 504}
+
+StagingRow = Tuple
+
+_CREATE_STAGING_SQL = """
+CREATE TEMP TABLE facility_staging (
+    facility_code varchar(50) NOT NULL,
+    name varchar(200) NOT NULL,
+    facility_type varchar(100) NOT NULL,
+    sub_facility_type varchar(100),
+    region_code varchar(10),
+    address text,
+    latitude double precision NOT NULL,
+    longitude double precision NOT NULL,
+    operator varchar(200),
+    phone varchar(20),
+    website varchar(500),
+    is_public boolean NOT NULL,
+    content_hash varchar(32) NOT NULL,
+    resolved_region_code varchar(10)
+) ON COMMIT DROP
+"""
+
+# 원천 행정구역 코드는 누락/오기가 잦아 좌표 기준 경계(GiST)를 우선한다
+_RESOLVE_REGION_SQL = f"""
+UPDATE facility_staging AS s
+SET resolved_region_code = COALESCE(
+    {locate_region_sql("ST_SetSRID(ST_MakePoint(s.longitude, s.latitude), 4326)::geography")},
+    (SELECT r.code FROM region AS r WHERE r.code = s.region_code)
+)
+"""
+
+_STAGING_COUNTS_SQL = """
+SELECT count(DISTINCT s.facility_code) AS total,
+       count(DISTINCT s.facility_code) FILTER (WHERE s.resolved_region_code IS NULL) AS unknown_region,
+       count(DISTINCT s.facility_code) FILTER (
+           WHERE s.resolved_region_code IS NOT NULL AND s.resolved_region_code IS DISTINCT FROM s.region_code
+       ) AS region_mismatches
+FROM facility_staging AS s
+"""
+
+# 같은 문장 안의 조회는 INSERT 이전 스냅샷을 보므로 old.* 는 갱신 전 값이다.
+# 해시가 같은 활성 행은 갱신하지 않아 updated_at(증분 반영 watermark)이 바뀌지 않는다.
+# updated_at 은 트랜잭션 시작 시각(now()) 대신 clock_timestamp() 로 찍어 커밋 시각과의 차이를
+# 줄인다 (남는 차이는 증분 반영이 FACILITY_CHANGE_OVERLAP_SECONDS 만큼 다시 읽어 메운다).
+_UPSERT_SQL = """
+WITH source AS (
+    SELECT DISTINCT ON (s.facility_code)
+           s.facility_code, s.name, s.facility_type, s.sub_facility_type,
+           s.resolved_region_code AS region_code, s.address, s.latitude, s.longitude,
+           s.operator, s.phone, s.website, s.is_public, s.content_hash
+    FROM facility_staging AS s
+    WHERE s.resolved_region_code IS NOT NULL
+    ORDER BY s.facility_code
+),
+upserted AS (
+    INSERT INTO sportsfacility (
+        facility_code, name, facility_type, sub_facility_type, region_code, address,
+        latitude, longitude, location, operator, phone, website, is_public, is_free,
+        content_hash, is_deleted, created_at, updated_at
+    )
+    SELECT facility_code, name, facility_type, sub_facility_type, region_code, address,
+           latitude, longitude, ST_SetSRID(ST_MakePoint(longitude, latitude), 4326)::geography,
+           operator, phone, website, is_public, false, content_hash, false, clock_timestamp(), clock_timestamp()
+    FROM source
+    ON CONFLICT (facility_code) DO UPDATE SET
+        name = EXCLUDED.name,
+        facility_type = EXCLUDED.facility_type,
+        sub_facility_type = EXCLUDED.sub_facility_type,
+        region_code = EXCLUDED.region_code,
+        address = EXCLUDED.address,
+        latitude = EXCLUDED.latitude,
+        longitude = EXCLUDED.longitude,
+        location = EXCLUDED.location,
+        operator = EXCLUDED.operator,
+        phone = EXCLUDED.phone,
+        website = EXCLUDED.website,
+        is_public = EXCLUDED.is_public,
+        content_hash = EXCLUDED.content_hash,
+        is_deleted = false,
+        updated_at = clock_timestamp()
+    WHERE sportsfacility.is_deleted
+       OR sportsfacility.content_hash IS DISTINCT FROM EXCLUDED.content_hash
+    RETURNING id, facility_code, region_code, latitude, longitude
+)
+SELECT u.id, u.region_code, u.latitude, u.longitude,
+       old.id IS NULL OR old.is_deleted AS added,
+       old.region_code AS old_region_code, old.latitude AS old_latitude, old.longitude AS old_longitude
+FROM upserted AS u
+LEFT JOIN sportsfacility AS old ON old.facility_code = u.facility_code
+"""
+
+
+_ACTIVE_HASHES_SQL = "SELECT facility_code, content_hash FROM sportsfacility WHERE NOT is_deleted"
+
+_SOFT_DELETE_SQL = """
+UPDATE sportsfacility
+SET is_deleted = true, updated_at = clock_timestamp()
+WHERE NOT is_deleted AND facility_code <> ALL(:seen)
+RETURNING id, region_code, latitude, longitude
+"""
+
+
+class IngestError(Exception):
+    """API 응답 오류 (재시도 대상 아님)"""
+
+
+class _RetryableResponse(Exception):
+    def __init__(self, response: httpx.Response):
+        super().__init__(f"HTTP {response.status_code}")
+        self.response = response
+
+
+@dataclass
+class IngestReport:
+    """적재 결과"""
+    pages: int = 0
+    fetched: int = 0
+    invalid: int = 0
+    skipped_region: int = 0
+    region_mismatches: int = 0  # 원천 region_code 가 없거나 좌표상 지역과 다른 레코드
+    unchanged: int = 0
+    retries: int = 0
+    deletes_skipped: int = 0  # 삭제 비율 상한 초과로 보류한 soft-delete 수
+    elapsed: float = 0.0
+    changeset: FacilityChangeset = field(default_factory=FacilityChangeset)
+
+    @property
+    def rows_per_sec(self) -> float:
+        return self.fetched / self.elapsed if self.elapsed else 0.0
+
+
+def _text(value, limit: Optional[int] = None) -> Optional[str]:
+    if value is None:
+        return None
+    value = str(value).strip()[:limit]
+    return value or None
+
+
+def content_hash(values: Tuple) -> str:
+    """스테이징 행 값의 해시 (원천 레코드 변경 감지용)"""
+    joined = "\x1f".join("" if value is None else str(value) for value in values)
+    return hashlib.blake2b(joined.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def parse_item(item: Dict) -> Optional[StagingRow]:
+    """API 레코드 → 스테이징 행 (마지막 값은 content_hash, 필수값/좌표가 없으면 None)"""
+    row = {column: item.get(source) for source, column in FIELD_MAP.items()}
+    try:
+        latitude = float(row["latitude"])
+        longitude = float(row["longitude"])
+    except (TypeError, ValueError):
+        return None
+    if not (-90 <= latitude <= 90 and -180 <= longitude <= 180) or (latitude == 0 and longitude == 0):
+        return None
+
+    facility_code = _text(row["facility_code"], 50)
+    name = _text(row["name"], 200)
+    facility_type = _text(row["facility_type"], 100)
+    if not (facility_code and name and facility_type):
+        return None
+
+    values = (
+        facility_code,
+        name,
+        facility_type,
+        _text(row["sub_facility_type"], 100),
+        _text(row["region_code"], 10),
+        _text(row["address"]),
+        latitude,
+        longitude,
+        _text(row["operator"], 200),
+        _text(row["phone"], 20),
+        _text(row["website"], 500),
+        _text(row["is_public"]) != "민간",
+    )
+    return values + (content_hash(values),)
+
+
+def _items(body: Dict) -> List[Dict]:
+    """data.go.kr 응답 body 의 items 정규화 (빈 문자열 / 단일 dict 대응)"""
+    items = body.get("items") or {}
+    if isinstance(items, list):
+        return items
+    item = items.get("item") or []
+    return [item] if isinstance(item, dict) else item
+
+
+class FacilityApiClient:
+    """전국공공체육시설 API 페이지 조회 (동시 요청 제한 + 지수 백오프 재시도)"""
+
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        url: str,
+        api_key: Optional[str],
+        page_size: int = 1000,
+        concurrency: int = 8,
+        max_retries: int = 5,
+        backoff: float = 0.5,
+    ):
+        self.client = client
+        self.url = url
+        self.api_key = api_key
+        self.page_size = page_size
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self.retries = 0
+
+    async def fetch_page(self, page_no: int) -> Dict:
+        """한 페이지의 body (header.resultCode 확인 포함)"""
+        params = {"pageNo": page_no, "numOfRows": self.page_size, "resultType": "json"}
+        if self.api_key:
+            params["serviceKey"] = self.api_key
+
+        async with self._semaphore:
+            for attempt in range(self.max_retries + 1):
+                try:
+                    response = await self.client.get(self.url, params=params)
+                    if response.status_code in RETRY_STATUS:
+                        raise _RetryableResponse(response)
+                    response.raise_for_status()
+                    break
+                except (httpx.TransportError, _RetryableResponse) as exc:
+                    if attempt == self.max_retries:
+                        raise
+                    self.retries += 1
+                    await asyncio.sleep(self._delay(attempt, exc))
+
+        try:
+            payload = response.json()["response"]
+        except (ValueError, KeyError) as exc:
+            # 인증키 오류 등은 JSON 요청에도 XML 로 응답한다
+            raise IngestError(f"unexpected response for page {page_no}: {response.text[:200]}") from exc
+        header = payload.get("header") or {}
+        if header.get("resultCode", "00") not in ("00", "0"):
+            raise IngestError(f"page {page_no}: {header.get('resultCode')} {header.get('resultMsg')}")
+        return payload.get("body") or {}
+
+    def _delay(self, attempt: int, exc: Exception) -> float:
+        if isinstance(exc, _RetryableResponse):
+            retry_after = exc.response.headers.get("Retry-After", "")
+            if retry_after.isdigit():
+                return float(retry_after)
+        # full jitter
+        return random.uniform(0, self.backoff * (2 ** attempt))
+
+    async def iter_pages(self, max_pages: Optional[int] = None) -> AsyncIterator[List[Dict]]:
+        """페이지별 레코드 목록을 도착 순서대로 반환"""
+        first = await self.fetch_page(1)
+        yield _items(first)
+
+        total = int(first.get("totalCount") or 0)
+        pages = max(1, -(-total // self.page_size))
+        if max_pages is not None:
+            pages = min(pages, max_pages)
+
+        tasks = [asyncio.create_task(self.fetch_page(page_no)) for page_no in range(2, pages + 1)]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield _items(await next_done)
+        finally:
+            for task in tasks:
+                task.cancel()
+
+
+async def load_batch(conn: AsyncConnection, rows: List[StagingRow], report: IngestReport) -> None:
+    """스테이징 COPY + upsert 후 커밋, 변경 내역을 report.changeset 에 누적"""
+    async with conn.begin():
+        await conn.execute(text(_CREATE_STAGING_SQL))
+        raw = await conn.get_raw_connection()
+        await raw.driver_connection.copy_records_to_table(
+            "facility_staging", records=rows, columns=STAGING_COLUMNS
+        )
+        await conn.execute(text(_RESOLVE_REGION_SQL))
+        counts = (await conn.execute(text(_STAGING_COUNTS_SQL))).one()
+        upserted = (await conn.execute(text(_UPSERT_SQL))).all()
+
+    report.skipped_region += counts.unknown_region
+    report.region_mismatches += counts.region_mismatches
+    report.unchanged += counts.total - counts.unknown_region - len(upserted)
+    changeset = report.changeset
+    for row in upserted:
+        (changeset.added if row.added else changeset.changed).append(row.id)
+        changeset.regions.add(row.region_code)
+        changeset.points.append((row.latitude, row.longitude))
+        if row.old_region_code is not None:
+            changeset.regions.add(row.old_region_code)
+            changeset.points.append((row.old_latitude, row.old_longitude))
+
+
+async def soft_delete_missing(
+    conn: AsyncConnection,
+    seen: Set[str],
+    report: IngestReport,
+    max_delete_ratio: float,
+) -> None:
+    """이번 동기화에서 보이지 않은 활성 시설을 is_deleted 로 표시
+
+    원천 API 의 일시적인 누락으로 대량 삭제되지 않도록, 활성 시설 중 삭제 대상
+    비율이 max_delete_ratio 를 넘으면 아무것도 지우지 않는다.
+    """
+    async with conn.begin():
+        active = await conn.scalar(text("SELECT count(*) FROM sportsfacility WHERE NOT is_deleted"))
+        missing = await conn.scalar(
+            text("SELECT count(*) FROM sportsfacility WHERE NOT is_deleted AND facility_code <> ALL(:seen)"),
+            {"seen": list(seen)},
+        )
+        if not missing:
+            return
+        if missing > active * max_delete_ratio:
+            report.deletes_skipped = missing
+            return
+        removed = (await conn.execute(text(_SOFT_DELETE_SQL), {"seen": list(seen)})).all()
+
+    changeset = report.changeset
+    for row in removed:
+        changeset.removed.append(row.id)
+        changeset.regions.add(row.region_code)
+        changeset.points.append((row.latitude, row.longitude))
+
+
+async def ingest_facilities(
+    engine: AsyncEngine,
+    api: FacilityApiClient,
+    batch_size: int = 5000,
+    max_pages: Optional[int] = None,
+    sync_deletes: bool = True,
+    max_delete_ratio: float = 0.1,
+) -> IngestReport:
+    """API 전체를 받아 sportsfacility 와 동기화
+
+    페이지 수신과 DB 적재를 큐로 연결해 겹쳐 실행한다(큐가 차면 수신이 대기).
+    저장된 content_hash 와 같은 레코드는 DB 에 보내지 않는다. 삭제 동기화는
+    모든 페이지를 받은 경우(max_pages 미지정)에만 수행한다.
+    """
+    report = IngestReport()
+    started = time.perf_counter()
+    queue: "asyncio.Queue[Optional[List[Dict]]]" = asyncio.Queue(maxsize=8)
+
+    async def produce() -> None:
+        try:
+            async for items in api.iter_pages(max_pages):
+                await queue.put(items)
+        finally:
+            await queue.put(None)
+
+    producer = asyncio.create_task(produce())
+    try:
+        async with engine.connect() as conn:
+            stored: Dict[str, str] = dict((await conn.execute(text(_ACTIVE_HASHES_SQL))).all())
+            await conn.commit()
+
+            seen: Set[str] = set()
+            buffer: List[StagingRow] = []
+            while True:
+                items = await queue.get()
+                if items is None:
+                    break
+                report.pages += 1
+                report.fetched += len(items)
+                for item in items:
+                    row = parse_item(item)
+                    if row is None:
+                        report.invalid += 1
+                        continue
+                    seen.add(row[0])
+                    if stored.get(row[0]) == row[-1]:
+                        report.unchanged += 1
+                    else:
+                        buffer.append(row)
+                if len(buffer) >= batch_size:
+                    await load_batch(conn, buffer, report)
+                    buffer = []
+            await producer  # 수신 중 예외 전파 (이후 삭제 동기화를 하지 않음)
+            if buffer:
+                await load_batch(conn, buffer, report)
+            if sync_deletes and max_pages is None and seen:
+                await soft_delete_missing(conn, seen, report, max_delete_ratio)
+    finally:
+        producer.cancel()
+
+    report.retries = api.retries
+    report.elapsed = time.perf_counter() - started
+    return report
+
+
+def default_api_url() -> str:
+    """DATA_GO_KR_BASE_URL + FACILITY_API_PATH"""
+    return settings.DATA_GO_KR_BASE_URL.rstrip("/") + settings.FACILITY_API_PATH
+
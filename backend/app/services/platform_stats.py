@@ -0,0 +1,70 @@
+"""대시보드 플랫폼 통계 (/dashboard/stats)
+
+시설/지역/제안 수는 DB 트리거가 증감하는 platformcounter 에서 한 번에 읽고, 활성
+사용자는 인증 요청마다 기록한 HyperLogLog 로 센다. 트리거가 놓친 변경(TRUNCATE,
+트리거 비활성화 상태의 적재 등)은 주기적인 대조 작업이 실제 COUNT 로 바로잡는다.
+"""
+import asyncio
+import logging
+from datetime import datetime
+from typing import Dict, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.activity import active_users
+from app.crud.counters import platform_counter as platform_counter_crud
+
+
+logger = logging.getLogger(__name__)
+
+
+class PlatformStats:
+    """카운터 조회와 주기적 대조"""
+
+    def __init__(self):
+        self.reconciled_at: Optional[datetime] = None
+        self.reconciliations = 0
+        self.corrections = 0
+        self.skipped = 0  # 다른 워커가 대조 중이라 건너뛴 횟수
+
+    async def get(self, db: AsyncSession) -> Dict[str, int]:
+        counters = await platform_counter_crud.get_all(db)
+        active = await asyncio.to_thread(active_users.count)
+        return {**counters, "active_users": active}
+
+    async def reconcile(self, db: AsyncSession) -> Optional[Dict]:
+        """카운터 대조. 다른 워커가 대조 중이라 건너뛰었으면 None"""
+        drift = await platform_counter_crud.reconcile(db)
+        await db.commit()
+        if drift is None:
+            self.skipped += 1
+            return None
+        self.reconciled_at = datetime.utcnow()
+        self.reconciliations += 1
+        self.corrections += len(drift)
+        return drift
+
+    async def run(self, session_factory, interval: float) -> None:
+        """interval 초마다 카운터 대조 (lifespan 태스크, 워커 간에는 advisory lock 으로 하나만 수행)"""
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                async with session_factory() as db:
+                    await self.reconcile(db)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.warning("Platform counter reconciliation failed", exc_info=True)
+
+    def stats(self) -> dict:
+        """대조 상태"""
+        return {
+            "reconciliations": self.reconciliations,
+            "corrections": self.corrections,
+            "skipped": self.skipped,
+            "reconciled_at": self.reconciled_at.isoformat() if self.reconciled_at else None,
+            "active_users": active_users.stats(),
+        }
+
+
+platform_stats = PlatformStats()
@@ -0,0 +1,93 @@
+"""좌표 기반 행정구역 일괄 지정
+
+Region.geometry(GiST) 에 대한 점-폴리곤 공간 조인을 한 문장(set-based)으로 실행한다.
+시/군/구 경계를 우선하고, 시/군/구가 없는 지역(예: 세종특별자치시)은 시/도로 지정한다.
+"""
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.services.facility_changes import FacilityChangeset
+
+
+def locate_region_sql(point: str) -> str:
+    """point(geography 식)를 덮는 행정구역 코드를 돌려주는 스칼라 서브쿼리"""
+    return f"""(
+        SELECT r.code FROM region AS r
+        WHERE r.geometry IS NOT NULL
+          AND r.level IN ('sigungu', 'sido')
+          AND ST_Covers(r.geometry, {point})
+        ORDER BY r.level = 'sigungu' DESC
+        LIMIT 1
+    )"""
+
+
+_ASSIGN_SQL = f"""
+WITH located AS (
+    SELECT f.id, f.facility_code, f.region_code AS old_code, f.latitude, f.longitude,
+           {locate_region_sql("f.location")} AS new_code
+    FROM sportsfacility AS f
+    WHERE NOT f.is_deleted
+),
+updated AS (
+    UPDATE sportsfacility AS f
+    SET region_code = l.new_code, updated_at = now()
+    FROM located AS l
+    WHERE f.id = l.id
+      AND l.new_code IS NOT NULL
+      AND l.new_code <> l.old_code
+      AND NOT CAST(:dry_run AS boolean)
+    RETURNING f.id
+)
+SELECT l.id, l.facility_code, l.old_code, l.new_code, l.latitude, l.longitude,
+       l.id IN (SELECT id FROM updated) AS updated,
+       (SELECT count(*) FROM located) AS total
+FROM located AS l
+WHERE l.new_code IS NULL OR l.new_code <> l.old_code
+"""
+
+
+@dataclass
+class RegionAssignReport:
+    """행정구역 지정 결과"""
+    total: int = 0
+    mismatched: int = 0  # 저장된 region_code 와 좌표상 지역이 다른 시설
+    unlocated: int = 0  # 어느 경계에도 속하지 않는 시설 (좌표 오류 등)
+    updated: int = 0
+    samples: List[Tuple[str, str, Optional[str]]] = field(default_factory=list)  # (facility_code, 기존, 좌표상)
+    changeset: FacilityChangeset = field(default_factory=FacilityChangeset)
+
+
+async def assign_facility_regions(
+    db: AsyncSession,
+    dry_run: bool = False,
+    sample_size: int = 20,
+) -> RegionAssignReport:
+    """모든 활성 시설의 region_code 를 좌표가 속한 행정구역으로 맞춤
+
+    commit 은 호출자가 한다. dry_run 이면 불일치만 보고한다.
+    """
+    report = RegionAssignReport()
+    result = await db.execute(text(_ASSIGN_SQL), {"dry_run": dry_run})
+    rows = result.all()
+
+    if rows:
+        report.total = rows[0].total
+    else:
+        report.total = await db.scalar(text("SELECT count(*) FROM sportsfacility WHERE NOT is_deleted"))
+
+    changeset = report.changeset
+    for row in rows:
+        if row.new_code is None:
+            report.unlocated += 1
+        else:
+            report.mismatched += 1
+        if len(report.samples) < sample_size:
+            report.samples.append((row.facility_code, row.old_code, row.new_code))
+        if row.updated:
+            report.updated += 1
+            changeset.changed.append(row.id)
+            changeset.regions.update((row.old_code, row.new_code))
+    return report
@@ -0,0 +1,211 @@
+"""지역 × 시설유형 수요-공급 행렬 (/dashboard/supply-demand)
+
+시설 수(sportsfacility)와 수요 비율(facilitydemand)을 각각 한 번의 GROUP BY 로 읽어
+pandas 로 전체 행렬을 한 번에 계산한다. 수요 조사는 시/도 또는 시/군/구 단위일 수
+있으므로 시설 수는 두 레벨 모두로 집계해 수요 행의 지역 레벨에 맞춘다.
+
+    supply_index  = (지역 인구 10만명당 시설 수) / (같은 레벨 전국 인구 10만명당 시설 수)
+    demand_index  = (지역 수요 비율) / (같은 레벨 전국 평균 수요 비율)
+    supply_demand_ratio = supply_index / demand_index   (1 미만이면 수요 대비 공급 부족)
+
+행렬은 워커 메모리에 들고 필터 요청은 DB 조회 없이 이를 잘라서 응답한다. 데이터
+버전(시설/수요/지역 테이블의 행 수와 최근 updated_at)은 요청 경로가 아니라 백그라운드
+태스크가 주기적으로 확인해 바뀌었을 때만 다시 만든다.
+"""
+import asyncio
+import logging
+from typing import List, Optional, Sequence, Tuple
+
+from sqlalchemy import and_, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.facility import FacilityDemand, SportsFacility
+from app.models.region import Region
+
+
+logger = logging.getLogger(__name__)
+
+MATRIX_COLUMNS = [
+    "region_code", "region_name", "facility_type", "supply_count", "demand_percentage",
+    "supply_demand_ratio", "coordinates",
+]
+
+# 인구통계 차원이 모두 NULL 인 '전체' 응답 행
+_OVERALL = and_(
+    FacilityDemand.age_group.is_(None),
+    FacilityDemand.gender.is_(None),
+    FacilityDemand.occupation.is_(None),
+    FacilityDemand.income_level.is_(None),
+)
+
+
+def build_matrix(supply_rows: Sequence, demand_rows: Sequence, region_rows: Sequence):
+    """GROUP BY 결과 → 수요-공급 행렬 DataFrame (MATRIX_COLUMNS + sido_code)
+
+    supply_rows: (region_code, facility_type, supply_count)
+    demand_rows: (region_code, facility_type, demand_percentage)
+    region_rows: (code, full_name, level, parent_code, population, center_lat, center_lng)
+    """
+    import numpy as np
+    import pandas as pd
+
+    regions = pd.DataFrame(
+        region_rows,
+        columns=["region_code", "region_name", "level", "parent_code", "population", "center_lat", "center_lng"],
+    )
+    regions["sido_code"] = regions["parent_code"].where(regions["level"] != "sido", regions["region_code"])
+    demand = pd.DataFrame(demand_rows, columns=["region_code", "facility_type", "demand_percentage"])
+    if demand.empty:
+        return pd.DataFrame(columns=MATRIX_COLUMNS + ["sido_code"])
+
+    # 시/군/구 시설 수 + 시/도 합계 (시/도 코드로 직접 등록된 시설은 시/도에만 포함)
+    supply = pd.DataFrame(supply_rows, columns=["region_code", "facility_type", "supply_count"])
+    supply = supply.merge(regions[["region_code", "level", "sido_code"]], on="region_code", how="inner")
+    by_sido = (
+        supply.dropna(subset=["sido_code"])
+        .groupby(["sido_code", "facility_type"], as_index=False)["supply_count"].sum()
+        .rename(columns={"sido_code": "region_code"})
+    )
+    supply = pd.concat([supply.loc[supply["level"] != "sido", ["region_code", "facility_type", "supply_count"]], by_sido])
+
+    matrix = (
+        demand.merge(regions, on="region_code", how="inner")
+        .merge(supply, on=["region_code", "facility_type"], how="left")
+    )
+    matrix["supply_count"] = matrix["supply_count"].fillna(0).astype(np.int64)
+
+    population = matrix["population"].astype(float).where(matrix["population"] > 0)
+    per_capita = matrix["supply_count"] / population * 100000
+    keys = [matrix["level"], matrix["facility_type"]]
+    has_population = population.notna()
+    national_supply = matrix["supply_count"].where(has_population, 0).groupby(keys).transform("sum")
+    national_population = population.fillna(0).groupby(keys).transform("sum")
+    supply_index = per_capita / (national_supply / national_population * 100000)
+    demand_index = matrix["demand_percentage"] / matrix.groupby(keys)["demand_percentage"].transform("mean")
+    ratio = (supply_index / demand_index).replace([np.inf, -np.inf], np.nan)
+    # 같은 레벨 전국 시설이 0개여도 인구가 있는 지역의 공급 0 은 비율 0
+    ratio = ratio.mask(has_population & (matrix["supply_count"] == 0), 0.0)
+    matrix["supply_demand_ratio"] = ratio.round(3).astype(object).where(ratio.notna(), None)
+
+    has_center = matrix["center_lat"].notna() & matrix["center_lng"].notna()
+    matrix["coordinates"] = [
+        [lng, lat] if ok else []
+        for lng, lat, ok in zip(matrix["center_lng"], matrix["center_lat"], has_center)
+    ]
+    matrix["demand_percentage"] = matrix["demand_percentage"].round(2)
+    return (
+        matrix[MATRIX_COLUMNS + ["sido_code"]]
+        .sort_values(["region_code", "facility_type"])
+        .reset_index(drop=True)
+    )
+
+
+class SupplyDemandAnalyzer:
+    """데이터 버전별 행렬 캐시 (버전 확인은 백그라운드)"""
+
+    def __init__(self):
+        self._version: Optional[Tuple] = None
+        self._matrix = None
+        self._lock = asyncio.Lock()
+        self.builds = 0
+        self.hits = 0
+
+    @property
+    def ready(self) -> bool:
+        return self._matrix is not None
+
+    async def data_version(self, db: AsyncSession) -> Tuple:
+        """(시설, 수요, 지역) 테이블별 행 수와 최근 updated_at"""
+        result = await db.execute(
+            select(*(
+                select(column).select_from(model).scalar_subquery()
+                for model in (SportsFacility, FacilityDemand, Region)
+                for column in (func.count(), func.max(model.updated_at))
+            ))
+        )
+        return tuple(result.one())
+
+    async def _load(self, db: AsyncSession):
+        supply_rows = (await db.execute(
+            select(SportsFacility.region_code, SportsFacility.facility_type, func.count())
+            .where(SportsFacility.is_deleted.is_(False))
+            .group_by(SportsFacility.region_code, SportsFacility.facility_type)
+        )).all()
+
+        # 최신 조사 연도의 '전체' 응답 행 평균 (없으면 세분화 행 평균)
+        latest_year = select(func.max(FacilityDemand.survey_year)).scalar_subquery()
+        demand = func.coalesce(
+            func.avg(FacilityDemand.demand_percentage).filter(_OVERALL),
+            func.avg(FacilityDemand.demand_percentage),
+        )
+        demand_rows = (await db.execute(
+            select(FacilityDemand.region_code, FacilityDemand.facility_type, demand)
+            .where(FacilityDemand.survey_year == latest_year)
+            .group_by(FacilityDemand.region_code, FacilityDemand.facility_type)
+        )).all()
+
+        region_rows = (await db.execute(
+            select(
+                Region.code, Region.full_name, Region.level, Region.parent_code,
+                Region.population, Region.center_lat, Region.center_lng,
+            )
+        )).all()
+        return await asyncio.to_thread(build_matrix, supply_rows, demand_rows, region_rows)
+
+    async def get(
+        self,
+        db: AsyncSession,
+        facility_type: Optional[str] = None,
+        region_code: Optional[str] = None,
+    ) -> List[dict]:
+        """행렬 조회 (region_code 가 시/도이면 하위 시/군/구 행 포함)
+
+        행렬이 만들어진 뒤에는 DB 를 쓰지 않는다. 백그라운드 로드 전의 첫 요청만 직접 만든다.
+        """
+        if self._matrix is None:
+            await self.refresh(db)
+        else:
+            self.hits += 1
+
+        matrix = self._matrix
+        if facility_type is not None:
+            matrix = matrix[matrix["facility_type"] == facility_type]
+        if region_code is not None:
+            matrix = matrix[(matrix["region_code"] == region_code) | (matrix["sido_code"] == region_code)]
+        return matrix[MATRIX_COLUMNS].to_dict("records")
+
+    async def refresh(self, db: AsyncSession) -> bool:
+        """데이터 버전이 바뀌었으면(또는 아직 없으면) 행렬 다시 만들기"""
+        async with self._lock:
+            version = await self.data_version(db)
+            if self._matrix is not None and version == self._version:
+                return False
+            self._matrix = await self._load(db)
+            self._version = version
+            self.builds += 1
+            logger.info("Supply-demand matrix built with %d rows", len(self._matrix))
+            return True
+
+    async def run(self, session_factory, interval: float) -> None:
+        """기동 후 백그라운드 로드, 이후 interval 초마다 데이터 버전 확인 (lifespan 태스크)"""
+        while True:
+            try:
+                async with session_factory() as db:
+                    await self.refresh(db)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.warning("Supply-demand matrix refresh failed", exc_info=True)
+            await asyncio.sleep(interval)
+
+    def stats(self) -> dict:
+        """캐시 상태"""
+        return {
+            "ready": self._matrix is not None,
+            "rows": 0 if self._matrix is None else len(self._matrix),
+            "builds": self.builds,
+            "hits": self.hits,
+        }
+
+
+supply_demand_analyzer = SupplyDemandAnalyzer()
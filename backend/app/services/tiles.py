@@ -0,0 +1,175 @@
+import logging
+import math
+import os
+import threading
+import time
+from typing import Iterable, Iterator, Optional, Set, Tuple
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.crud.facility import TILE_BUFFER, TILE_EXTENT
+
+
+logger = logging.getLogger(__name__)
+
+TileKey = Tuple[int, int, int]
+
+MAX_LATITUDE = 85.0511287798  # Web Mercator 표현 한계
+
+
+def lonlat_to_tile(lng: float, lat: float, z: int) -> Tuple[float, float]:
+    """경위도를 z 레벨 타일 좌표(실수)로 변환"""
+    lat = max(-MAX_LATITUDE, min(MAX_LATITUDE, lat))
+    n = 2 ** z
+    x = (lng + 180.0) / 360.0 * n
+    lat_rad = math.radians(lat)
+    y = (1.0 - math.asinh(math.tan(lat_rad)) / math.pi) / 2.0 * n
+    return x, y
+
+
+def tiles_for_point(lat: float, lng: float, max_zoom: int) -> Iterator[TileKey]:
+    """점이 그려지는 모든 타일 (0..max_zoom, 타일 버퍼에 걸치는 이웃 타일 포함)"""
+    margin = TILE_BUFFER / TILE_EXTENT
+    for z in range(max_zoom + 1):
+        n = 2 ** z
+        fx, fy = lonlat_to_tile(lng, lat, z)
+        x_range = range(max(0, math.floor(fx - margin)), min(n - 1, math.floor(fx + margin)) + 1)
+        y_range = range(max(0, math.floor(fy - margin)), min(n - 1, math.floor(fy + margin)) + 1)
+        for x in x_range:
+            for y in y_range:
+                yield z, x, y
+
+
+class TileCache:
+    """벡터 타일 2단 캐시 (워커 메모리 LRU + 디스크)
+
+    키는 (TILE_CACHE_VERSION, z, x, y)로 시설 변경과 무관하게 고정이다. 시설 변경은
+    invalidate_points()로 해당 좌표가 그려지는 타일만 지우고(적재 명령 + 변경 알림),
+    그 밖의 경로로 바뀐 시설은 ttl 이 지나 다시 렌더링될 때 반영된다. 디스크 경로도
+    키만으로 정해지므로 어느 프로세스에서 지워도 워커가 읽는 파일이 지워진다.
+    렌더링 도중 무효화가 일어나면 결과를 저장하지 않도록 세대(generation) 번호를
+    함께 확인한다.
+    """
+
+    def __init__(
+        self,
+        directory: Optional[str],
+        version: int,
+        memory_tiles: int,
+        ttl: float,
+        max_zoom: int,
+    ):
+        self.directory = directory or None
+        self.version = version
+        self.max_zoom = max_zoom
+        self.ttl = ttl
+        self._memory = TTLCache(maxsize=memory_tiles, ttl=ttl)
+        self._lock = threading.Lock()
+        self._generation = 0
+        self.disk_hits = 0
+        self.disk_expired = 0
+        self.invalidated = 0
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    def _path(self, key: TileKey) -> str:
+        z, x, y = key
+        return os.path.join(self.directory, f"v{self.version}", str(z), str(x), f"{y}.mvt")
+
+    def _memory_key(self, key: TileKey) -> tuple:
+        return (self.version, *key)
+
+    def get_memory(self, key: TileKey) -> Optional[bytes]:
+        """메모리 캐시 조회"""
+        return self._memory.get(self._memory_key(key))
+
+    def get_disk(self, key: TileKey) -> Optional[bytes]:
+        """디스크 캐시 조회 (ttl 이 지난 파일은 지우고 미적중, 적중 시 메모리에 적재, 블로킹 I/O)"""
+        if self.directory is None:
+            return None
+        path = self._path(key)
+        try:
+            with open(path, "rb") as fp:
+                if time.time() - os.fstat(fp.fileno()).st_mtime > self.ttl:
+                    data = None
+                else:
+                    data = fp.read()
+        except FileNotFoundError:
+            return None
+        if data is None:
+            self.disk_expired += 1
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            return None
+        self._memory.set(self._memory_key(key), data)
+        self.disk_hits += 1
+        return data
+
+    def store(self, key: TileKey, data: bytes, generation: int) -> None:
+        """렌더링 결과 저장 (렌더링 시작 이후 무효화가 있었으면 버림, 블로킹 I/O)"""
+        with self._lock:
+            if generation != self._generation:
+                return
+            self._memory.set(self._memory_key(key), data)
+        if self.directory is None:
+            return
+
+        path = self._path(key)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(tmp_path, "wb") as fp:
+                fp.write(data)
+            os.replace(tmp_path, path)
+        except OSError:
+            logger.warning("Failed to write tile cache %s", path, exc_info=True)
+
+    def invalidate(self, keys: Iterable[TileKey]) -> int:
+        """지정 타일 제거 (블로킹 I/O)"""
+        keys: Set[TileKey] = set(keys)
+        with self._lock:
+            self._generation += 1
+            for key in keys:
+                self._memory.pop(self._memory_key(key))
+        if self.directory is not None:
+            for key in keys:
+                try:
+                    os.remove(self._path(key))
+                except FileNotFoundError:
+                    pass
+        self.invalidated += len(keys)
+        return len(keys)
+
+    def invalidate_points(self, points: Iterable[Tuple[float, float]]) -> int:
+        """(lat, lng) 좌표들이 그려지는 타일 제거
+
+        위치가 바뀐 시설은 이전 좌표와 새 좌표를 모두 넘겨야 한다.
+        """
+        keys: Set[TileKey] = set()
+        for lat, lng in points:
+            keys.update(tiles_for_point(lat, lng, self.max_zoom))
+        return self.invalidate(keys)
+
+    def stats(self) -> dict:
+        """캐시 통계"""
+        return {
+            **self._memory.stats(),
+            "version": self.version,
+            "disk_enabled": self.directory is not None,
+            "disk_hits": self.disk_hits,
+            "disk_expired": self.disk_expired,
+            "invalidated_tiles": self.invalidated,
+        }
+
+
+tile_cache = TileCache(
+    directory=settings.TILE_CACHE_DIR,
+    version=settings.TILE_CACHE_VERSION,
+    memory_tiles=settings.TILE_CACHE_MEMORY_TILES,
+    ttl=settings.TILE_CACHE_TTL_SECONDS,
+    max_zoom=settings.TILE_MAX_ZOOM,
+)
@@ -0,0 +1,41 @@
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Sequence
+
+
+class ChangeWatermark:
+    """updated_at 기준 증분 조회 위치
+
+    updated_at 은 커밋 전에 찍히므로 watermark 보다 이른 시각으로 늦게 커밋된 행은
+    `updated_at > watermark` 로는 영영 읽히지 않는다. 그래서 watermark - overlap 부터
+    다시 읽고, 그 구간에서 이미 반영한 (id, updated_at) 은 unseen() 에서 걸러 같은
+    변경을 두 번 반영하지 않는다. 행은 id, updated_at 속성을 가져야 한다.
+    """
+
+    def __init__(self, overlap: float):
+        self.overlap = timedelta(seconds=overlap)
+        self.value: Optional[datetime] = None  # 반영한 가장 최근 updated_at
+        self._seen: Dict[int, datetime] = {}  # 겹치는 구간 안에서 반영한 id → updated_at
+
+    def since(self) -> Optional[datetime]:
+        """다음 증분 조회의 하한 (updated_at >= since, 아직 기준이 없으면 None)"""
+        return None if self.value is None else self.value - self.overlap
+
+    def unseen(self, rows: Sequence) -> List:
+        """아직 반영하지 않은 변경 행"""
+        return [row for row in rows if self._seen.get(row.id) != row.updated_at]
+
+    def advance(self, rows: Sequence) -> None:
+        """반영한 행으로 watermark 이동 (겹치는 구간을 벗어난 기록은 버림)"""
+        for row in rows:
+            self._seen[row.id] = row.updated_at
+            if self.value is None or row.updated_at > self.value:
+                self.value = row.updated_at
+        since = self.since()
+        if since is not None:
+            self._seen = {key: value for key, value in self._seen.items() if value >= since}
+
+    def reset(self, rows: Sequence) -> None:
+        """전체 로드 후 기준 재설정"""
+        self.value = None
+        self._seen = {}
+        self.advance(rows)
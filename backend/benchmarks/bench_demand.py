@@ -0,0 +1,171 @@
+"""수요 큐브 vs SQL GROUP BY 지연 벤치마크
+
+한 트랜잭션 안에서 facilitydemand 에 임의 인구통계 조합 N행을 적재하고 큐브를 구성한
+뒤, 임의 차원 조합/필터의 group-by 를 DemandCube 와 같은 의미의 SQL 로 번갈아 실행해
+지연 분포를 비교한다. 종료 시 롤백하므로 실제 데이터는 남지 않는다.
+
+    python -m benchmarks.bench_demand --rows 200000 --queries 200
+"""
+import argparse
+import asyncio
+import random
+import time
+from typing import List
+
+from sqlalchemy import func, select, text
+
+from app.db.database import AsyncSessionLocal, async_engine
+from app.models.facility import FacilityDemand
+from app.services.demand_cube import DIMENSIONS, DemandCube
+
+
+BENCH_REGION_PREFIX = "B"
+REGIONS = 250
+FACILITY_TYPES = ("수영장", "체육관", "테니스장", "축구장", "배드민턴장", "헬스장", "골프장", "탁구장")
+YEARS = (2019, 2020, 2021, 2022, 2023)
+AGE_GROUPS = ("10대", "20대", "30대", "40대", "50대", "60대", "70대 이상")
+GENDERS = ("남", "여")
+OCCUPATIONS = ("학생", "사무직", "전문직", "서비스직", "생산직", "자영업", "주부", "무직")
+INCOME_LEVELS = ("100만원 미만", "100-300만원", "300-500만원", "500만원 이상")
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+async def _seed(db, rows: int) -> None:
+    await db.execute(
+        text(
+            """
+            INSERT INTO region (code, name, full_name, level, created_at, updated_at)
+            SELECT :prefix || g, 'bench ' || g, 'bench ' || g, 'sigungu', now(), now()
+            FROM generate_series(1, CAST(:regions AS integer)) AS g
+            """
+        ),
+        {"prefix": BENCH_REGION_PREFIX, "regions": REGIONS},
+    )
+    # 인구통계 차원은 약 10% 확률로 NULL('전체' 응답 행)
+    await db.execute(
+        text(
+            """
+            INSERT INTO facilitydemand (
+                region_code, facility_type, survey_year, age_group, gender, occupation, income_level,
+                demand_percentage, created_at, updated_at
+            )
+            SELECT :prefix || (1 + floor(random() * CAST(:regions AS integer))::int),
+                   types[1 + floor(random() * cardinality(types))::int],
+                   years[1 + floor(random() * cardinality(years))::int],
+                   CASE WHEN random() < 0.1 THEN NULL ELSE ages[1 + floor(random() * cardinality(ages))::int] END,
+                   CASE WHEN random() < 0.1 THEN NULL ELSE genders[1 + floor(random() * cardinality(genders))::int] END,
+                   CASE WHEN random() < 0.1 THEN NULL ELSE jobs[1 + floor(random() * cardinality(jobs))::int] END,
+                   CASE WHEN random() < 0.1 THEN NULL ELSE incomes[1 + floor(random() * cardinality(incomes))::int] END,
+                   round((random() * 100)::numeric, 1), now(), now()
+            FROM generate_series(1, CAST(:rows AS integer)) AS g,
+                 CAST(:types AS text[]) AS types,
+                 CAST(:years AS int[]) AS years,
+                 CAST(:ages AS text[]) AS ages,
+                 CAST(:genders AS text[]) AS genders,
+                 CAST(:jobs AS text[]) AS jobs,
+                 CAST(:incomes AS text[]) AS incomes
+            """
+        ),
+        {
+            "prefix": BENCH_REGION_PREFIX,
+            "regions": REGIONS,
+            "rows": rows,
+            "types": list(FACILITY_TYPES),
+            "years": list(YEARS),
+            "ages": list(AGE_GROUPS),
+            "genders": list(GENDERS),
+            "jobs": list(OCCUPATIONS),
+            "incomes": list(INCOME_LEVELS),
+        },
+    )
+    await db.execute(text("ANALYZE facilitydemand"))
+
+
+def _random_query(rng: random.Random):
+    dims = rng.sample(DIMENSIONS, rng.randint(1, 3))
+    filters = {}
+    if rng.random() < 0.5:
+        filters["survey_year"] = rng.choice(YEARS)
+    if rng.random() < 0.5:
+        filters["facility_type"] = rng.choice(FACILITY_TYPES)
+    return dims, filters
+
+
+def _sql(dims, filters):
+    """DemandCube.group_by 와 같은 의미의 SQL"""
+    columns = [getattr(FacilityDemand, dim) for dim in dims]
+    return (
+        select(
+            *columns,
+            func.avg(FacilityDemand.demand_percentage),
+            func.min(FacilityDemand.demand_percentage),
+            func.max(FacilityDemand.demand_percentage),
+            func.count(),
+        )
+        .where(*(getattr(FacilityDemand, dim) == value for dim, value in filters.items()))
+        .group_by(*columns)
+        .order_by(*columns)
+    )
+
+
+async def run(args) -> None:
+    rng = random.Random(args.seed)
+    cube = DemandCube()
+    cube_ms: List[float] = []
+    sql_ms: List[float] = []
+    async with AsyncSessionLocal() as db:
+        transaction = await db.begin()
+        try:
+            started = time.perf_counter()
+            await _seed(db, args.rows)
+            print(f"seeded {args.rows} rows in {time.perf_counter() - started:.1f}s")
+
+            started = time.perf_counter()
+            await cube.load(db)
+            print(f"cube built in {time.perf_counter() - started:.2f}s ({cube.stats()['rows']} rows)")
+
+            for i in range(args.warmup + args.queries):
+                dims, filters = _random_query(rng)
+
+                started = time.perf_counter()
+                cube_rows = cube.group_by(dims, filters)
+                cube_elapsed = (time.perf_counter() - started) * 1000
+
+                started = time.perf_counter()
+                sql_rows = (await db.execute(_sql(dims, filters))).all()
+                sql_elapsed = (time.perf_counter() - started) * 1000
+
+                if len(cube_rows) != len(sql_rows):
+                    raise AssertionError(f"group count mismatch for {dims} {filters}")
+                if i >= args.warmup:
+                    cube_ms.append(cube_elapsed)
+                    sql_ms.append(sql_elapsed)
+        finally:
+            await transaction.rollback()
+    await async_engine.dispose()
+
+    print()
+    print(f"queries : {len(cube_ms)}")
+    for label, latencies in (("cube", cube_ms), ("sql", sql_ms)):
+        print(
+            f"{label:<5}: p50 {_percentile(latencies, 50):.2f} ms, "
+            f"p95 {_percentile(latencies, 95):.2f} ms, p99 {_percentile(latencies, 99):.2f} ms"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="/facilities/demand 큐브 vs SQL 벤치마크")
+    parser.add_argument("--rows", type=int, default=200000)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--warmup", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=42)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""로그인 처리량 벤치마크
+
+실행 중인 API 서버에 동시 로그인 요청을 보내면서, 같은 시간 동안 /health 응답
+지연을 함께 측정한다. 해시 풀이 동작하면 로그인 폭주 중에도 다른 라우트의 지연이
+유지되고, 한도를 넘는 로그인은 503(Retry-After)으로 빠르게 거절되어야 한다.
+
+    python -m benchmarks.bench_login --email bench@example.com --password benchpass \\
+        --concurrency 64 --requests 500
+"""
+import argparse
+import asyncio
+import statistics
+import time
+from typing import List
+
+import httpx
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+async def _ensure_user(client: httpx.AsyncClient, email: str, password: str) -> None:
+    await client.post(
+        "/api/v1/auth/register",
+        json={
+            "email": email,
+            "username": email.split("@")[0],
+            "password": password,
+            "display_name": "Benchmark User",
+        },
+    )
+
+
+async def _login_worker(client, queue, email, password, latencies, statuses) -> None:
+    while True:
+        try:
+            queue.get_nowait()
+        except asyncio.QueueEmpty:
+            return
+        started = time.perf_counter()
+        response = await client.post(
+            "/api/v1/auth/login", data={"username": email, "password": password}
+        )
+        latencies.append(time.perf_counter() - started)
+        statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+
+
+async def _health_probe(client, stop: asyncio.Event, latencies: List[float]) -> None:
+    while not stop.is_set():
+        started = time.perf_counter()
+        await client.get("/api/v1/health")
+        latencies.append(time.perf_counter() - started)
+        await asyncio.sleep(0.05)
+
+
+async def run(args: argparse.Namespace) -> None:
+    limits = httpx.Limits(max_connections=args.concurrency + 1)
+    async with httpx.AsyncClient(base_url=args.url, limits=limits, timeout=60) as client:
+        await _ensure_user(client, args.email, args.password)
+
+        queue: asyncio.Queue = asyncio.Queue()
+        for _ in range(args.requests):
+            queue.put_nowait(None)
+
+        login_latencies: List[float] = []
+        health_latencies: List[float] = []
+        statuses: dict = {}
+        stop = asyncio.Event()
+
+        probe = asyncio.create_task(_health_probe(client, stop, health_latencies))
+        started = time.perf_counter()
+        await asyncio.gather(*[
+            _login_worker(client, queue, args.email, args.password, login_latencies, statuses)
+            for _ in range(args.concurrency)
+        ])
+        elapsed = time.perf_counter() - started
+        stop.set()
+        await probe
+
+    succeeded = statuses.get(200, 0)
+    print(f"requests      : {args.requests} (concurrency {args.concurrency})")
+    print(f"elapsed       : {elapsed:.2f}s")
+    print(f"status counts : {dict(sorted(statuses.items()))}")
+    print(f"logins/sec    : {succeeded / elapsed:.1f} (all responses {args.requests / elapsed:.1f}/s)")
+    print(
+        f"login latency : p50 {statistics.median(login_latencies) * 1000:.0f}ms "
+        f"p95 {_percentile(login_latencies, 95) * 1000:.0f}ms"
+    )
+    if health_latencies:
+        print(
+            f"health latency: p50 {statistics.median(health_latencies) * 1000:.1f}ms "
+            f"p95 {_percentile(health_latencies, 95) * 1000:.1f}ms"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="로그인 처리량 벤치마크")
+    parser.add_argument("--url", default="http://localhost:8000")
+    parser.add_argument("--email", default="bench@example.com")
+    parser.add_argument("--password", default="benchpassword")
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--requests", type=int, default=500)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
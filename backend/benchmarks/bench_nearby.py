@@ -0,0 +1,129 @@
+"""주변 시설(KNN) 조회 지연 벤치마크
+
+한 트랜잭션 안에서 sportsfacility 에 국내 범위의 임의 좌표 N개를 적재하고
+ANALYZE 한 뒤, CRUDFacility.get_nearby 와 같은 쿼리를 임의 기준점으로 반복 실행해
+지연 분포를 출력한다. 종료 시 롤백하므로 실제 데이터는 남지 않는다.
+
+    python -m benchmarks.bench_nearby --points 100000 --queries 500 --radius 5000 --k 10
+"""
+import argparse
+import asyncio
+import random
+import statistics
+import time
+from typing import List
+
+from sqlalchemy import text
+
+from app.crud.facility import facility as facility_crud
+from app.db.database import AsyncSessionLocal, async_engine
+
+
+# 대략적인 남한 경위도 범위
+LAT_RANGE = (33.1, 38.6)
+LNG_RANGE = (125.0, 129.6)
+FACILITY_TYPES = ("수영장", "체육관", "테니스장", "축구장", "배드민턴장")
+BENCH_REGION_CODE = "BENCH"
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+async def _seed(db, points: int) -> None:
+    await db.execute(
+        text(
+            "INSERT INTO region (code, name, full_name, level, created_at, updated_at) "
+            "VALUES (:code, 'bench', 'bench', 'sigungu', now(), now())"
+        ),
+        {"code": BENCH_REGION_CODE},
+    )
+    await db.execute(
+        text(
+            """
+            INSERT INTO sportsfacility (
+                facility_code, name, facility_type, region_code,
+                latitude, longitude, location, is_public, created_at, updated_at
+            )
+            SELECT
+                'BENCH-' || g, 'bench ' || g, types[1 + g % cardinality(types)], :region,
+                lat, lng, ST_SetSRID(ST_MakePoint(lng, lat), 4326)::geography, true, now(), now()
+            FROM (
+                SELECT g,
+                       CAST(:lat_min AS float8) + random() * CAST(:lat_span AS float8) AS lat,
+                       CAST(:lng_min AS float8) + random() * CAST(:lng_span AS float8) AS lng
+                FROM generate_series(1, CAST(:points AS integer)) AS g
+            ) AS seed, CAST(:types AS text[]) AS types
+            """
+        ),
+        {
+            "types": list(FACILITY_TYPES),
+            "region": BENCH_REGION_CODE,
+            "lat_min": LAT_RANGE[0], "lat_span": LAT_RANGE[1] - LAT_RANGE[0],
+            "lng_min": LNG_RANGE[0], "lng_span": LNG_RANGE[1] - LNG_RANGE[0],
+            "points": points,
+        },
+    )
+    await db.execute(text("ANALYZE sportsfacility"))
+
+
+async def run(args) -> None:
+    rng = random.Random(args.seed)
+    async with AsyncSessionLocal() as db:
+        transaction = await db.begin()
+        try:
+            started = time.perf_counter()
+            await _seed(db, args.points)
+            print(f"seeded {args.points} points in {time.perf_counter() - started:.1f}s")
+
+            plan = await db.execute(
+                text(
+                    "EXPLAIN SELECT id FROM sportsfacility "
+                    "WHERE ST_DWithin(location, ST_SetSRID(ST_MakePoint(127, 37.5), 4326)::geography, :r) "
+                    "ORDER BY location <-> ST_SetSRID(ST_MakePoint(127, 37.5), 4326)::geography LIMIT :k"
+                ),
+                {"r": args.radius, "k": args.k},
+            )
+            print("\n".join(row[0] for row in plan))
+
+            latencies: List[float] = []
+            found: List[int] = []
+            for i in range(args.warmup + args.queries):
+                lat = rng.uniform(*LAT_RANGE)
+                lng = rng.uniform(*LNG_RANGE)
+                facility_type = rng.choice(FACILITY_TYPES) if args.with_type else None
+                started = time.perf_counter()
+                rows = await facility_crud.get_nearby(
+                    db, lat=lat, lng=lng, radius_m=args.radius, k=args.k, facility_type=facility_type
+                )
+                if i >= args.warmup:
+                    latencies.append((time.perf_counter() - started) * 1000)
+                    found.append(len(rows))
+        finally:
+            await transaction.rollback()
+    await async_engine.dispose()
+
+    print()
+    print(f"queries : {len(latencies)} (radius={args.radius:.0f}m, k={args.k})")
+    print(f"rows    : mean {statistics.mean(found):.1f}")
+    print(f"p50     : {_percentile(latencies, 50):.2f} ms")
+    print(f"p95     : {_percentile(latencies, 95):.2f} ms")
+    print(f"p99     : {_percentile(latencies, 99):.2f} ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="/facilities/nearby KNN 지연 벤치마크")
+    parser.add_argument("--points", type=int, default=100000)
+    parser.add_argument("--queries", type=int, default=500)
+    parser.add_argument("--warmup", type=int, default=50)
+    parser.add_argument("--radius", type=float, default=5000)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--with-type", action="store_true", help="임의 facility_type 필터 추가")
+    parser.add_argument("--seed", type=int, default=42)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""요청당 토큰 검증 비용 마이크로벤치마크
+
+같은 액세스 토큰을 반복 검증할 때, 캐시 없이 매번 jose.jwt.decode 하는 경우와
+verify_token의 검증 완료 토큰 캐시를 거치는 경우의 호출당 시간을 비교한다.
+
+    python -m benchmarks.bench_verify_token --iterations 20000
+"""
+import argparse
+import timeit
+
+from app.core.security import create_access_token, token_cache, verify_token
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="verify_token 마이크로벤치마크")
+    parser.add_argument("--iterations", type=int, default=20000)
+    args = parser.parse_args()
+
+    token = create_access_token(
+        subject=1, claims={"act": True, "ver": 0, "scopes": ["read", "write"]}
+    )
+
+    def uncached() -> None:
+        token_cache.clear()
+        verify_token(token)
+
+    def cached() -> None:
+        verify_token(token)
+
+    verify_token(token)  # 워밍업 및 캐시 적재
+    cached_seconds = timeit.timeit(cached, number=args.iterations)
+    uncached_seconds = timeit.timeit(uncached, number=args.iterations)
+
+    per_uncached = uncached_seconds / args.iterations * 1e6
+    per_cached = cached_seconds / args.iterations * 1e6
+    print(f"iterations     : {args.iterations}")
+    print(f"full decode    : {per_uncached:.1f} µs/request")
+    print(f"verified cache : {per_cached:.1f} µs/request")
+    print(f"speedup        : {per_uncached / per_cached:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,5 @@
+import asyncio
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
@@ -5,15 +7,49 @@ import uvicorn
 
 from app.api.v1.api import api_router
 from app.core.config import settings
+from app.core.hashing import hash_pool
+from app.core.metrics import MetricsMiddleware
+from app.db.database import AsyncSessionLocal
+from app.services.autocomplete import autocomplete_index
+from app.services.clusters import cluster_index
+from app.services.demand_cube import demand_cube
+from app.services.facility_changes import facility_change_listener
+from app.services.platform_stats import platform_stats
+from app.services.supply_demand import supply_demand_analyzer
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup
     print("🚀 Starting up Sports Data Lab API...")
+    # 클러스터 인덱스는 기동을 막지 않도록 백그라운드에서 구성 (준비 전 /clusters 는 503)
+    cluster_task = asyncio.create_task(
+        cluster_index.run(AsyncSessionLocal, settings.CLUSTER_INDEX_REFRESH_SECONDS)
+    )
+    autocomplete_task = asyncio.create_task(
+        autocomplete_index.run(AsyncSessionLocal, settings.AUTOCOMPLETE_REFRESH_SECONDS)
+    )
+    demand_task = asyncio.create_task(
+        demand_cube.run(AsyncSessionLocal, settings.DEMAND_CUBE_REFRESH_SECONDS)
+    )
+    counter_task = asyncio.create_task(
+        platform_stats.run(AsyncSessionLocal, settings.COUNTER_RECONCILE_SECONDS)
+    )
+    supply_demand_task = asyncio.create_task(
+        supply_demand_analyzer.run(AsyncSessionLocal, settings.SUPPLY_DEMAND_REFRESH_SECONDS)
+    )
+    # 적재 명령이 보낸 시설 변경 내역으로 워커 로컬 타일 캐시/자동완성 갱신 (REDIS_URL 필요)
+    facility_change_listener.start()
     yield
     # Shutdown
     print("🛑 Shutting down Sports Data Lab API...")
+    cluster_task.cancel()
+    autocomplete_task.cancel()
+    demand_task.cancel()
+    counter_task.cancel()
+    supply_demand_task.cancel()
+    facility_change_listener.stop()
+    hash_pool.shutdown()
 
 
 def create_application():
@@ -32,8 +68,12 @@ def create_application():
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        expose_headers=["X-Next-Cursor"],
     )
 
+    # Per-route latency / DB usage metrics (GET /api/v1/metrics)
+    app.add_middleware(MetricsMiddleware)
+
     app.include_router(api_router, prefix=settings.API_V1_STR)
 
     return app
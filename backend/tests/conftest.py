@@ -0,0 +1,51 @@
+from typing import List
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+
+@pytest.fixture
+def anyio_backend():
+    """비동기 테스트는 asyncio 백엔드로만 실행 (asyncpg/FastAPI 런타임과 동일)"""
+    return "asyncio"
+
+
+class _Result:
+    def __init__(self, rows):
+        self._rows = rows
+
+    def all(self):
+        return self._rows
+
+
+class RecordingSession:
+    """실행한 문장을 기록하고 미리 정한 결과를 차례로 돌려주는 AsyncSession 대역
+
+    execute 는 results 의 행 목록을, scalar 는 scalars 의 값을 순서대로 돌려주고
+    다 쓰면 빈 목록 / None 을 돌려준다.
+    """
+
+    def __init__(self, *results, scalars=()):
+        self.results = list(results)
+        self.scalars = list(scalars)
+        self.statements = []  # execute 한 문장
+        self.params = []
+
+    async def execute(self, statement, params=None):
+        self.statements.append(statement)
+        self.params.append(params)
+        return _Result(self.results.pop(0) if self.results else [])
+
+    async def scalar(self, statement, params=None):
+        return self.scalars.pop(0) if self.scalars else None
+
+    @property
+    def sql(self) -> List[str]:
+        """execute 한 문장의 PostgreSQL SQL"""
+        return [str(statement.compile(dialect=postgresql.dialect())) for statement in self.statements]
+
+
+@pytest.fixture
+def recording_session():
+    """RecordingSession(*results, scalars=...) 생성자"""
+    return RecordingSession
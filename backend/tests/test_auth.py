@@ -5,7 +5,7 @@ from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 
 from app.core.deps import get_db
-from app.db.database import Base
+from app.models.base import Base
 from app.models.user import User
 from main import app
 
@@ -19,7 +19,8 @@ engine = create_engine(
 )
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
-Base.metadata.create_all(bind=engine)
+# 사용자 관련 테이블만 생성 (시설/지역 모델의 공간 컬럼은 SQLite 에서 만들 수 없음)
+Base.metadata.create_all(bind=engine, tables=[User.__table__])
 
 
 def override_get_db():
@@ -200,4 +201,70 @@ def test_invalid_token():
         "/api/v1/auth/me",
         headers={"Authorization": "Bearer invalid_token"}
     )
-    assert response.status_code == 401
\ No newline at end of file
+    assert response.status_code == 401
+
+def _login(email: str, username: str, password: str) -> dict:
+    client.post(
+        "/api/v1/auth/register",
+        json={"email": email, "username": username, "password": password, "display_name": username},
+    )
+    response = client.post("/api/v1/auth/login", data={"username": email, "password": password})
+    assert response.status_code == 200
+    return response.json()
+
+
+def test_refresh_rotates_tokens():
+    """리프레시 토큰은 한 번만 사용 가능, 새로 받은 토큰으로 다시 갱신"""
+    tokens = _login("refresh@example.com", "refreshuser", "refreshpassword")
+
+    response = client.post("/api/v1/auth/refresh", json={"refresh_token": tokens["refresh_token"]})
+    assert response.status_code == 200
+    rotated = response.json()
+    assert rotated["refresh_token"] != tokens["refresh_token"]
+    me = client.get("/api/v1/auth/me", headers={"Authorization": f"Bearer {rotated['access_token']}"})
+    assert me.status_code == 200
+
+    response = client.post("/api/v1/auth/refresh", json={"refresh_token": rotated["refresh_token"]})
+    assert response.status_code == 200
+
+
+def test_refresh_token_reuse_revokes_all_tokens():
+    """이미 사용된 리프레시 토큰이 다시 오면 거절하고 그 사용자의 토큰을 모두 폐기"""
+    tokens = _login("reuse@example.com", "reuseuser", "reusepassword")
+    rotated = client.post("/api/v1/auth/refresh", json={"refresh_token": tokens["refresh_token"]}).json()
+
+    response = client.post("/api/v1/auth/refresh", json={"refresh_token": tokens["refresh_token"]})
+    assert response.status_code == 401
+
+    # 탈취 대응으로 교체받은 토큰도 함께 폐기됨
+    response = client.post("/api/v1/auth/refresh", json={"refresh_token": rotated["refresh_token"]})
+    assert response.status_code == 401
+    me = client.get("/api/v1/auth/me", headers={"Authorization": f"Bearer {rotated['access_token']}"})
+    assert me.status_code == 401
+
+
+def test_logout_revokes_access_and_refresh_tokens():
+    """로그아웃 후에는 기존 액세스/리프레시 토큰 모두 거절"""
+    tokens = _login("logout@example.com", "logoutuser", "logoutpassword")
+    headers = {"Authorization": f"Bearer {tokens['access_token']}"}
+
+    assert client.post("/api/v1/auth/logout", headers=headers).status_code == 204
+    assert client.get("/api/v1/auth/me", headers=headers).status_code == 401
+    response = client.post("/api/v1/auth/refresh", json={"refresh_token": tokens["refresh_token"]})
+    assert response.status_code == 401
+
+
+def test_stale_token_version_rejected():
+    """token_version 이 올라가면 (비밀번호 변경 등) 이전 ver 의 토큰은 get_current_user 에서 거절"""
+    tokens = _login("stale@example.com", "staleuser", "stalepassword")
+    headers = {"Authorization": f"Bearer {tokens['access_token']}"}
+
+    response = client.put("/api/v1/auth/me", headers=headers, json={"password": "newstalepassword"})
+    assert response.status_code == 200
+    assert client.get("/api/v1/auth/me", headers=headers).status_code == 401
+
+    fresh = client.post(
+        "/api/v1/auth/login", data={"username": "stale@example.com", "password": "newstalepassword"}
+    ).json()
+    me = client.get("/api/v1/auth/me", headers={"Authorization": f"Bearer {fresh['access_token']}"})
+    assert me.status_code == 200
@@ -0,0 +1,113 @@
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+from app.services.autocomplete import AutocompleteIndex, normalize
+
+
+FACILITIES = {
+    1: ("잠실실내수영장", "수영장", "11710"),
+    2: ("잠실종합운동장 수영장", "수영장", "11710"),
+    3: ("송파 잠실 테니스장", "테니스장", "11710"),
+    4: ("Olympic Park Tennis", "테니스장", "11710"),
+    5: ("광주월드컵경기장", "축구장", "29140"),
+}
+
+
+def _index():
+    index = AutocompleteIndex()
+    index.build(FACILITIES)
+    return index
+
+
+def test_normalize_decomposes_hangul():
+    """완성형 한글과 겹모음/겹받침은 자모로 분해, 공백/기호/대소문자 무시"""
+    assert normalize("잠실") == "ㅈㅏㅁㅅㅣㄹ"
+    assert normalize("광") == "ㄱㅗㅏㅇ"
+    assert normalize("ㅘ") == "ㅗㅏ"
+    assert normalize(" Olympic-Park ") == "olympicpark"
+
+
+def test_prefix_matches_name_and_word_starts():
+    """이름 전체 일치가 단어 일치보다 먼저, 같은 조건에선 짧은 이름 우선"""
+    index = _index()
+    assert [row[0] for row in index.query("잠실")] == [1, 2, 3]
+    assert [row[0] for row in index.query("수영장")] == [2]
+    assert [row[0] for row in index.query("tennis")] == [4]
+    assert index.query("야구") == []
+
+
+def test_prefix_matches_partial_syllable():
+    """입력 중인 글자(받침/모음 미완성)도 일치"""
+    index = _index()
+    assert [row[0] for row in index.query("잠ㅅ")] == [1, 2, 3]
+    assert [row[0] for row in index.query("과")] == [5]
+    assert [row[0] for row in index.query("잠실ㅈ")] == [2]
+
+
+def test_filter_and_changes():
+    """유형 필터와 변경/삭제 반영"""
+    index = _index()
+    assert [row[0] for row in index.query("잠실", facility_type="테니스장")] == [3]
+
+    index.apply_changes({6: ("잠실 배드민턴장", "배드민턴장", "11710"), 1: ("신천수영장", "수영장", "11710")}, [3])
+    assert [row[0] for row in index.query("잠실")] == [6, 2]
+    assert index.query("신천")[0] == (1, "신천수영장", "수영장", "11710")
+    assert index.stats()["facilities"] == 5
+
+
+def test_ranking_covers_whole_prefix_range(monkeypatch):
+    """넓은 접두어도 범위 전체에서 순위를 매김 (사전순 앞쪽 키만 보고 자르지 않음)"""
+    from app.services import autocomplete
+
+    facilities = {
+        i: (f"잠실{'가나다라마바사'[i % 7]}{i:04d} 체육관", "체육관" if i % 2 else "수영장", "11710")
+        for i in range(1, 300)
+    }
+    facilities[999] = ("잠", "테니스장", "11710")  # 사전순으로는 앞이지만 단어 일치 키는 뒤쪽
+    facilities[1000] = ("하늘 잠실", "수영장", "11710")
+
+    exact = AutocompleteIndex()
+    exact.build(facilities)
+    assert exact.stats()["wide_prefixes"] == 0
+
+    monkeypatch.setattr(autocomplete, "SCAN_LIMIT", 10)
+    wide = AutocompleteIndex()
+    wide.build(facilities)
+    assert wide.stats()["wide_prefixes"] > 0
+
+    for prefix in ("ㅈ", "잠", "잠실", "잠실가", "ㅊ", "체육"):
+        for facility_type in (None, "수영장", "테니스장", "골프장"):
+            expected = exact.query(prefix, limit=20, facility_type=facility_type)
+            assert wide.query(prefix, limit=20, facility_type=facility_type) == expected
+    # 이름이 가장 짧은 전체 일치가 먼저
+    assert exact.query("잠", limit=1)[0][0] == 999
+
+
+def _row(facility_id, name, updated_at, is_deleted=False):
+    return SimpleNamespace(
+        id=facility_id, name=name, facility_type="수영장", region_code="11710",
+        updated_at=updated_at, is_deleted=is_deleted,
+    )
+
+
+@pytest.mark.anyio
+async def test_refresh_rereads_overlap_for_late_commits(recording_session):
+    """watermark 보다 이른 updated_at 으로 늦게 커밋된 변경도 반영하고, 변경이 없으면 다시 만들지 않음"""
+    t0 = datetime(2026, 1, 1, 12, 0, 0)
+    index = AutocompleteIndex(change_overlap=300)
+    late = _row(3, "잠실 늦은수영장", t0 - timedelta(seconds=30))
+    db = recording_session(
+        [_row(1, "잠실실내수영장", t0 - timedelta(hours=1)), _row(2, "신천수영장", t0)],
+        [_row(2, "신천수영장", t0), late],
+        [_row(2, "신천수영장", t0), late],
+    )
+
+    await index.load(db)
+    assert await index.refresh(db) == 1
+    assert "updated_at >= %(updated_at_1)s" in db.sql[1]
+    assert [row[0] for row in index.query("잠실")] == [1, 3]
+
+    assert await index.refresh(db) == 0
+    assert index.refreshes == 1
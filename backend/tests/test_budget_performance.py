@@ -0,0 +1,97 @@
+from datetime import datetime
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.crud.budget_performance import (
+    ALL_REGIONS,
+    ALL_SPORTS,
+    budget_performance,
+    score_rows,
+)
+
+
+def _row(region_code, sport_type, budget, reward, year=2023):
+    return (year, region_code, sport_type, budget, reward, 1, 1, datetime(2024, 1, 1))
+
+
+def _by_key(rows):
+    return {(row["region_code"], row["sport_type"]): row for row in score_rows(rows)}
+
+
+def test_score_compares_regions_within_same_sport():
+    """지역×종목 행은 같은 종목의 지역끼리 점유율/최대 성과금을 비교"""
+    rows = _by_key([
+        _row("11", "양궁", 100, 300),
+        _row("26", "양궁", 300, 100),
+        _row("11", "수영", 100, 0),
+        _row("11", ALL_SPORTS, 200, 300),
+        _row(ALL_REGIONS, "양궁", 400, 400),
+    ])
+
+    assert rows[("11", "양궁")]["performance_score"] == 100.0
+    assert rows[("11", "양궁")]["efficiency_ratio"] == pytest.approx(3.0)  # 0.75 / 0.25
+    assert rows[("26", "양궁")]["efficiency_ratio"] == pytest.approx(1 / 3, abs=0.001)
+    assert rows[("11", "수영")]["performance_score"] == 0
+    assert rows[("11", "수영")]["efficiency_ratio"] == 0
+    # 비교 대상이 자기 자신뿐인 합계 행
+    assert rows[("11", ALL_SPORTS)]["efficiency_ratio"] == pytest.approx(1.0)
+    assert rows[(ALL_REGIONS, "양궁")]["performance_score"] == 100.0
+
+
+def test_score_without_budget_has_no_ratio():
+    """예산이 없는 행은 효율 비율 None, 다른 연도와는 비교하지 않음"""
+    rows = score_rows([_row("11", "양궁", 0, 50), _row("11", "양궁", 10, 5, year=2022)])
+    assert rows[0]["efficiency_ratio"] is None
+    assert rows[0]["performance_score"] == 100.0
+    assert rows[1]["performance_score"] == 100.0
+    assert rows[1]["year"] == 2022
+
+
+def _sql(statement) -> str:
+    return str(statement.compile(dialect=postgresql.dialect()))
+
+
+def test_aggregate_uses_grouping_sets_for_target_years():
+    """대상 연도만 읽어 네 가지 집계 단위를 한 번에 계산"""
+    sql = _sql(budget_performance._aggregate({2023}))
+    assert "GROUP BY GROUPING SETS" in sql
+    assert "sportsbudgetsupport.support_year IN" in sql
+    assert "performancereward.award_year IN" in sql
+    assert "grouping(anon_1.region_code)" in sql
+
+
+@pytest.mark.anyio
+async def test_changed_years_detects_new_updated_and_removed_years(recording_session):
+    """행 수/최근 수정 시각이 다르거나 원본에서 사라진 연도만 다시 계산 대상"""
+    old, new = datetime(2024, 1, 1), datetime(2024, 6, 1)
+    db = recording_session(
+        [(2021, 3, 1, old), (2022, 3, 1, new), (2023, 5, 0, old), (2024, 1, 0, old)],
+        [(2021, 3, 1, old), (2022, 3, 1, old), (2023, 4, 0, old), (2020, 2, 2, old)],
+    )
+    assert await budget_performance.changed_years(db) == {2020, 2022, 2023, 2024}
+
+
+@pytest.mark.anyio
+async def test_refresh_replaces_only_target_years_and_totals(recording_session):
+    """대상 연도 행을 교체한 뒤 전체 연도 합계는 집계 테이블에서 다시 합산"""
+    db = recording_session([_row("11", "양궁", 10, 5)], [], [], [(0, "11", "양궁", 10, 5, 1, 1, None)])
+    assert await budget_performance.refresh(db, [2023]) == [2023]
+
+    aggregate, delete_years, insert_years, totals, delete_totals, insert_totals = db.sql
+    assert "GROUPING SETS" in aggregate
+    assert delete_years.startswith("DELETE FROM budgetperformance WHERE budgetperformance.year IN")
+    assert insert_years.startswith("INSERT INTO budgetperformance")
+    assert "FROM budgetperformance" in totals and "sportsbudgetsupport" not in totals
+    assert delete_totals.startswith("DELETE FROM budgetperformance WHERE budgetperformance.year =")
+
+
+@pytest.mark.anyio
+async def test_get_rows_filters_on_summary_table(recording_session):
+    """필터는 집계 테이블 키 조회, 생략한 차원은 합계 행 제외"""
+    db = recording_session([])
+    await budget_performance.get_rows(db, year=2023, sport_type="양궁")
+    sql = db.sql[0]
+    assert "FROM budgetperformance LEFT OUTER JOIN region" in sql
+    assert "budgetperformance.sport_type = " in sql
+    assert "budgetperformance.region_code != " in sql
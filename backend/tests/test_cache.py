@@ -0,0 +1,42 @@
+import time
+
+from app.core.cache import PrincipalCache, TTLCache
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    """최대 크기 초과 시 가장 오래 사용하지 않은 항목 제거"""
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1  # a를 최근 사용으로 갱신
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_ttl_cache_expires_entries():
+    """TTL이 지난 항목은 미적중 처리"""
+    cache = TTLCache(maxsize=10, ttl=60)
+    cache.set("short", "value", ttl=0.01)
+    time.sleep(0.02)
+
+    assert cache.get("short") is None
+    assert cache.stats()["misses"] == 1
+    assert len(cache) == 0
+
+
+def test_principal_cache_invalidate_and_stats():
+    """무효화 후에는 미적중, 적중/미적중 통계 집계"""
+    cache = PrincipalCache(maxsize=10, ttl=60, redis_ttl=60)
+    cache.set("user@example.com", {"id": 1, "is_active": True})
+
+    assert cache.get("user@example.com") == {"id": 1, "is_active": True}
+    cache.invalidate("user@example.com")
+    assert cache.get("user@example.com") is None
+
+    stats = cache.stats()
+    assert stats["local_hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["invalidations"] == 1
@@ -0,0 +1,103 @@
+import random
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from app.services.clusters import ClusterIndex
+
+
+KOREA = (124.0, 33.0, 130.0, 39.0)
+TYPES = ["수영장", "체육관", "테니스장"]
+
+
+def _points(count, seed=1, start_id=1):
+    rng = random.Random(seed)
+    return [
+        (start_id + i, rng.uniform(33.1, 38.6), rng.uniform(125.0, 129.6), rng.choice(TYPES))
+        for i in range(count)
+    ]
+
+
+def test_clusters_preserve_counts_at_every_zoom():
+    """모든 줌에서 클러스터 개수 합 = 영역 내 시설 수"""
+    index = ClusterIndex(max_zoom=12)
+    index.build(_points(2000))
+
+    for zoom in (0, 4, 8, 12):
+        assert sum(c["count"] for c in index.query(KOREA, zoom)) == 2000
+    assert len(index.query(KOREA, 0)) < len(index.query(KOREA, 8))
+
+
+def test_zoom_above_max_returns_facilities():
+    """max_zoom 초과 줌은 개별 시설(facility_id 포함) 반환"""
+    index = ClusterIndex(max_zoom=5)
+    index.build([(10, 37.5665, 126.978, "수영장"), (11, 35.1796, 129.0756, "체육관")])
+
+    seoul_only = index.query((126.9, 37.5, 127.1, 37.6), 6)
+    assert seoul_only == [{"lat": 37.5665, "lng": 126.978, "count": 1, "facility_id": 10}]
+
+
+def test_facility_type_filter():
+    """유형 필터 적용 시 해당 유형만 집계, 모르는 유형은 빈 결과"""
+    points = _points(1000)
+    index = ClusterIndex(max_zoom=10)
+    index.build(points)
+
+    pools = sum(1 for p in points if p[3] == "수영장")
+    assert sum(c["count"] for c in index.query(KOREA, 6, "수영장")) == pools
+    assert index.query(KOREA, 6, "골프장") == []
+
+
+def test_apply_changes_matches_full_rebuild():
+    """증분 갱신(추가/이동/삭제) 결과가 전체 재구성과 동일"""
+    points = _points(3000)
+    index = ClusterIndex(max_zoom=10)
+    index.build(points)
+
+    moved = _points(100, seed=2)  # id 1..100 위치/유형 변경
+    added = _points(50, seed=3, start_id=10000)
+    index.apply_changes(moved + added, deleted_ids=[500, 501, 99999])
+
+    expected = {p[0]: p for p in points}
+    expected.update({p[0]: p for p in moved + added})
+    del expected[500], expected[501]
+    rebuilt = ClusterIndex(max_zoom=10)
+    rebuilt._types, rebuilt._type_codes = list(index._types), dict(index._type_codes)
+    rebuilt.build(list(expected.values()))
+
+    for ours, theirs in zip(index._snapshot.levels, rebuilt._snapshot.levels):
+        assert np.array_equal(ours.keys, theirs.keys)
+        assert np.array_equal(ours.count, theirs.count)
+        assert np.allclose(ours.sum_x, theirs.sum_x)
+    assert index.stats()["facilities"] == len(expected)
+
+
+def _row(facility_id, updated_at, lat=37.5, lng=127.0, is_deleted=False):
+    return SimpleNamespace(
+        id=facility_id, latitude=lat, longitude=lng, facility_type="수영장",
+        updated_at=updated_at, is_deleted=is_deleted,
+    )
+
+
+@pytest.mark.anyio
+async def test_refresh_rereads_overlap_for_late_commits(recording_session):
+    """watermark 보다 이른 updated_at 으로 늦게 커밋된 변경도 반영하고, 이미 반영한 변경은 건너뜀"""
+    t0 = datetime(2026, 1, 1, 12, 0, 0)
+    index = ClusterIndex(max_zoom=5, change_overlap=300)
+    late = _row(3, t0 - timedelta(seconds=30), lat=35.1, lng=129.0)
+    db = recording_session(
+        [_row(1, t0 - timedelta(hours=1)), _row(2, t0)],  # 전체 로드
+        [_row(2, t0), late],  # 긴 트랜잭션이 t0 이전 시각으로 커밋
+        [_row(2, t0), late],  # 변경 없음
+    )
+
+    await index.load(db)
+    assert await index.refresh(db) == 1
+    assert "updated_at >= %(updated_at_1)s" in db.sql[1]
+    assert db.statements[1].compile().params["updated_at_1"] == t0 - timedelta(seconds=300)
+    assert index.stats()["facilities"] == 3
+
+    assert await index.refresh(db) == 0
+    assert index.changes_applied == 1
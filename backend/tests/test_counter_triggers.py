@@ -0,0 +1,87 @@
+"""platformcounter 트리거 마이그레이션(d9f3a7c2e6b1) 통합 테스트
+
+실제 PostgreSQL 이 필요하므로 TEST_DATABASE_URL(psycopg2 URL)이 있을 때만 실행한다.
+임시 스키마에 카운트 대상 테이블의 최소 형태를 만들고 마이그레이션을 적용한 뒤
+한 트랜잭션 안에서 확인하고 롤백하므로 DB 에 흔적을 남기지 않는다.
+"""
+import importlib.util
+import os
+
+import pytest
+from sqlalchemy import create_engine, text
+
+
+TEST_DATABASE_URL = os.environ.get("TEST_DATABASE_URL")
+MIGRATION = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "alembic", "versions", "d9f3a7c2e6b1_add_platform_counters.py",
+)
+
+pytestmark = pytest.mark.skipif(TEST_DATABASE_URL is None, reason="TEST_DATABASE_URL 미설정 (PostgreSQL 필요)")
+
+
+def _load_migration():
+    spec = importlib.util.spec_from_file_location("platform_counter_migration", MIGRATION)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture
+def connection():
+    from alembic.migration import MigrationContext
+    from alembic.operations import Operations
+
+    engine = create_engine(TEST_DATABASE_URL)
+    with engine.connect() as conn:
+        transaction = conn.begin()
+        try:
+            conn.execute(text("CREATE SCHEMA platformcounter_test"))
+            conn.execute(text("SET LOCAL search_path TO platformcounter_test"))
+            conn.execute(text("CREATE TABLE sportsfacility (id serial PRIMARY KEY, is_deleted boolean NOT NULL DEFAULT false)"))
+            conn.execute(text("CREATE TABLE region (code varchar(10) PRIMARY KEY)"))
+            conn.execute(text("CREATE TABLE proposal (id serial PRIMARY KEY)"))
+            conn.execute(text("INSERT INTO sportsfacility (is_deleted) VALUES (false), (false), (true)"))
+            conn.execute(text("INSERT INTO region VALUES ('11')"))
+
+            with Operations.context(MigrationContext.configure(conn)):
+                _load_migration().upgrade()
+            yield conn
+        finally:
+            transaction.rollback()
+    engine.dispose()
+
+
+def _counters(conn) -> dict:
+    return dict(conn.execute(text("SELECT name, value FROM platformcounter")).all())
+
+
+def test_seeded_from_current_rows(connection):
+    """마이그레이션 시점의 행 수로 초기화 (소프트 삭제 행 제외)"""
+    assert _counters(connection) == {"total_facilities": 2, "total_regions": 1, "total_proposals": 0}
+
+
+def test_triggers_track_inserts_deletes_and_soft_deletes(connection):
+    """문장 단위 트리거가 여러 행 INSERT/DELETE 와 is_deleted 전환을 반영"""
+    connection.execute(text("INSERT INTO sportsfacility (is_deleted) VALUES (false), (false), (true)"))
+    connection.execute(text("INSERT INTO region VALUES ('26'), ('27')"))
+    connection.execute(text("INSERT INTO proposal DEFAULT VALUES"))
+    connection.execute(text("INSERT INTO proposal DEFAULT VALUES"))
+    assert _counters(connection) == {"total_facilities": 4, "total_regions": 3, "total_proposals": 2}
+
+    # 소프트 삭제 / 복구 / 삭제 행 물리 삭제 / 활성 행 물리 삭제
+    connection.execute(text("UPDATE sportsfacility SET is_deleted = true WHERE id = 1"))
+    connection.execute(text("UPDATE sportsfacility SET is_deleted = false WHERE id = 3"))
+    connection.execute(text("DELETE FROM sportsfacility WHERE id IN (3, 6)"))
+    connection.execute(text("DELETE FROM region WHERE code = '27'"))
+    connection.execute(text("DELETE FROM proposal"))
+    assert _counters(connection) == {"total_facilities": 3, "total_regions": 2, "total_proposals": 0}
+
+    actual = connection.execute(text("SELECT count(*) FROM sportsfacility WHERE NOT is_deleted")).scalar()
+    assert actual == 3
+
+
+def test_updates_without_state_change_leave_counter(connection):
+    """is_deleted 를 바꾸지 않는 갱신은 카운터를 건드리지 않음"""
+    connection.execute(text("UPDATE sportsfacility SET is_deleted = is_deleted"))
+    assert _counters(connection)["total_facilities"] == 2
@@ -0,0 +1,136 @@
+import os
+import subprocess
+import sys
+import threading
+import time
+
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+
+from app.core.config import settings
+from app.db import database
+from app.db.pool import InstrumentedQueuePool, pool_stats
+
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 비동기 엔진이 드라이버에 넘기는 접속 인자 이름을 출력 (실제 접속 전에 중단)
+_CONNECT_ARGS_SCRIPT = """
+import asyncio
+from app.db.database import async_engine
+
+captured = {}
+
+def fake_connect(*args, **kwargs):
+    captured.update(kwargs)
+    captured["statement_names"] = {kwargs["prepared_statement_name_func"]() for _ in range(2)} \\
+        if "prepared_statement_name_func" in kwargs else set()
+    raise RuntimeError("stop")
+
+async_engine.dialect.connect = fake_connect
+
+async def main():
+    try:
+        async with async_engine.connect():
+            pass
+    except RuntimeError:
+        pass
+
+asyncio.run(main())
+print(captured.get("statement_cache_size"), captured.get("prepared_statement_cache_size"))
+print(len(captured["statement_names"]))
+"""
+
+
+def _engine(tmp_path, pool_size=1, max_overflow=1):
+    return create_engine(
+        f"sqlite:///{tmp_path / 'pool.db'}",
+        poolclass=InstrumentedQueuePool,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        pool_timeout=5,
+    )
+
+
+def test_pgbouncer_connect_args(monkeypatch):
+    """PgBouncer 모드에서만 prepared statement 캐시를 끄고 문장 이름을 매번 새로 만듦"""
+    monkeypatch.setattr(settings, "DB_PGBOUNCER", False)
+    assert database._async_connect_args() == {}
+
+    monkeypatch.setattr(settings, "DB_PGBOUNCER", True)
+    args = database._async_connect_args()
+    assert args["statement_cache_size"] == 0
+    assert args["prepared_statement_cache_size"] == 0
+    assert args["prepared_statement_name_func"]() != args["prepared_statement_name_func"]()
+
+
+def test_async_engine_passes_pgbouncer_args_to_driver():
+    """DB_PGBOUNCER=true 로 기동하면 비동기 엔진의 드라이버 접속 인자에 반영"""
+    result = subprocess.run(
+        [sys.executable, "-c", _CONNECT_ARGS_SCRIPT],
+        cwd=BACKEND_DIR, capture_output=True, text=True, check=True,
+        env={**os.environ, "DB_PGBOUNCER": "true"},
+    )
+    assert result.stdout.split("\n")[:2] == ["0 0", "2"]
+
+
+def test_pool_stats_reports_in_use_overflow_and_wait(tmp_path):
+    """사용 중/오버플로 게이지와 체크아웃 대기 시간"""
+    engine = _engine(tmp_path)
+    first = engine.connect()
+    second = engine.connect()  # pool_size 1 을 넘어 오버플로
+
+    stats = pool_stats(engine.pool)
+    assert (stats["size"], stats["checked_out"], stats["overflow"]) == (1, 2, 1)
+    assert stats["checkouts"] == 2
+
+    second.close()
+    first.close()
+    stats = pool_stats(engine.pool)
+    assert (stats["checked_out"], stats["overflow"], stats["checked_in"]) == (0, 0, 1)
+    engine.dispose()
+
+
+def test_checkout_wait_recorded_when_pool_exhausted(tmp_path):
+    """풀이 가득 차면 반납까지 기다린 시간이 wait_seconds_max 에 남음"""
+    engine = _engine(tmp_path, max_overflow=0)
+    held = engine.connect()
+    releaser = threading.Timer(0.2, held.close)
+    releaser.start()
+    try:
+        with engine.connect():
+            pass
+    finally:
+        releaser.join()
+
+    stats = pool_stats(engine.pool)
+    assert stats["checkouts"] == 2
+    assert stats["wait_seconds_max"] >= 0.15
+    assert stats["wait_seconds_total"] >= stats["wait_seconds_max"]
+    engine.dispose()
+
+
+def test_pool_gauges_in_health_stats_and_metrics(tmp_path, monkeypatch):
+    """get_pool_stats() 와 /api/v1/metrics 에 풀 게이지/체크아웃 히스토그램 노출"""
+    from main import create_application
+
+    engine = _engine(tmp_path)
+    monkeypatch.setattr(database, "engine", engine)
+    first, second = engine.connect(), engine.connect()
+    try:
+        sync = database.get_pool_stats()["sync"]
+        assert (sync["checked_out"], sync["overflow"], sync["checkouts"]) == (2, 1, 2)
+        assert "wait_seconds_max" in database.get_pool_stats()["async"]
+
+        response = TestClient(create_application()).get(f"{settings.API_V1_STR}/metrics")
+    finally:
+        second.close()
+        first.close()
+        engine.dispose()
+
+    assert response.status_code == 200
+    body = response.text
+    assert 'app_component_stat{component="db_pool",stat="sync_checked_out"} 2' in body
+    assert 'app_component_stat{component="db_pool",stat="sync_overflow"} 1' in body
+    assert 'app_component_stat{component="db_pool",stat="sync_wait_seconds_max"}' in body
+    assert 'db_pool_checkout_seconds_count{pool="sync"}' in body
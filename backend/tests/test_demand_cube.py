@@ -0,0 +1,109 @@
+import random
+from collections import defaultdict
+
+import pytest
+
+from app.api.v1.endpoints.facilities import _demand_filters
+from app.services.demand_cube import DEMOGRAPHICS, DIMENSIONS, DemandCube, UnknownDimension
+
+
+def _rows(count=500, seed=7):
+    rng = random.Random(seed)
+    return [
+        (
+            rng.choice(["11110", "11140", "26110"]),
+            rng.choice(["수영장", "체육관", "테니스장"]),
+            rng.choice([2022, 2023]),
+            rng.choice([None, "20대", "30대", "40대"]),
+            rng.choice([None, "남", "여"]),
+            rng.choice([None, "학생", "사무직"]),
+            rng.choice([None, "300만원 미만", "300만원 이상"]),
+            round(rng.uniform(0, 100), 1),
+        )
+        for _ in range(count)
+    ]
+
+
+def _cube(rows):
+    cube = DemandCube()
+    cube.build(rows, {"11140": "서울특별시 중구"})
+    return cube
+
+
+@pytest.mark.parametrize("dims,filters", [
+    (["region_code"], {}),
+    (["facility_type", "age_group"], {"survey_year": 2023}),
+    (["gender", "income_level", "occupation"], {"facility_type": "수영장", "region_code": "11140"}),
+    ([], {"age_group": None}),
+])
+def test_group_by_matches_brute_force(dims, filters):
+    """큐브 group-by 결과가 행 단위 계산과 같음 (NULL 차원은 별도 항목, 나머지 인구통계 차원은 NULL 행만)"""
+    rows = _rows()
+    overall = [dim for dim in DEMOGRAPHICS if dim not in dims and dim not in filters]
+    expected = defaultdict(list)
+    for row in rows:
+        values = dict(zip(DIMENSIONS, row))
+        if (
+            all(values[dim] == value for dim, value in filters.items())
+            and all(values[dim] is None for dim in overall)
+        ):
+            expected[tuple(values[dim] for dim in dims)].append(row[-1])
+
+    result = _cube(rows).group_by(dims, filters)
+    assert len(result) == len(expected)
+    for item in result:
+        demand = expected[tuple(item[dim] for dim in dims)]
+        assert item["rows"] == len(demand)
+        assert item["demand_percentage"] == pytest.approx(sum(demand) / len(demand), abs=0.01)
+        assert (item["min_percentage"], item["max_percentage"]) == (min(demand), max(demand))
+
+
+def test_group_by_region_names_and_unknown_values():
+    """지역 차원에는 지역명, 없는 필터 값은 빈 결과, 없는 차원은 오류"""
+    cube = _cube(_rows())
+    names = {item["region_code"]: item["region_name"] for item in cube.group_by(["region_code"])}
+    assert names == {"11110": None, "11140": "서울특별시 중구", "26110": None}
+    assert cube.group_by(["region_code"], {"facility_type": "골프장"}) == []
+    with pytest.raises(UnknownDimension):
+        cube.group_by(["demand_percentage"])
+
+
+def test_pivot_fills_missing_cells_with_none():
+    """행 × 열 표, 없는 조합은 None"""
+    rows = [
+        ("11110", "수영장", 2023, "20대", None, None, None, 70.0),
+        ("11110", "수영장", 2023, "20대", None, None, None, 50.0),
+        ("11110", "체육관", 2023, "30대", None, None, None, 40.0),
+        ("11140", "수영장", 2022, "30대", None, None, None, 30.0),
+    ]
+    table = _cube(rows).pivot(["region_code"], "age_group")
+    assert table["columns"] == ["20대", "30대"]
+    assert table["rows"] == [
+        {"key": {"region_code": "11110"}, "values": [60.0, 40.0]},
+        {"key": {"region_code": "11140"}, "values": [None, 30.0]},
+    ]
+
+
+def test_overall_rows_not_averaged_with_breakdowns():
+    """연령대로 묶지 않으면 '전체' 행(40)만 쓰고 연령대별 행(80, 10)과 섞지 않음"""
+    rows = [
+        ("11110", "수영장", 2023, None, None, None, None, 40.0),
+        ("11110", "수영장", 2023, "20대", None, None, None, 80.0),
+        ("11110", "수영장", 2023, "60대", None, None, None, 10.0),
+    ]
+    cube = _cube(rows)
+
+    [item] = cube.group_by(["region_code"])
+    assert (item["demand_percentage"], item["rows"]) == (40.0, 1)
+    assert [
+        (item["age_group"], item["demand_percentage"]) for item in cube.group_by(["age_group"])
+    ] == [(None, 40.0), ("20대", 80.0), ("60대", 10.0)]
+    assert cube.group_by(["region_code"], {"age_group": "20대"})[0]["demand_percentage"] == 80.0
+    assert cube.pivot(["region_code"], "facility_type")["rows"][0]["values"] == [40.0]
+
+
+def test_overall_filter_value_selects_null_rows():
+    """인구통계 필터의 '전체'는 NULL 행, 다른 차원의 값은 그대로"""
+    assert _demand_filters(region_code="11110", age_group="전체", gender=None, facility_type="전체") == {
+        "region_code": "11110", "age_group": None, "facility_type": "전체",
+    }
@@ -0,0 +1,93 @@
+import csv
+import gzip
+import io
+import json
+import os
+from types import SimpleNamespace
+
+import pytest
+
+from app.services.export import EXPORT_COLUMNS, FacilityExporter, accepts_gzip
+
+
+def _row(i):
+    return SimpleNamespace(
+        facility_code=f"F{i:05d}", name=f"시설, {i}", facility_type="수영장", address=None,
+        latitude=37.5 + i / 1000, longitude=127.0, region_code="11140", region_name="서울특별시 중구",
+        operator=None, is_public=True,
+    )
+
+
+async def _batches(count, size, fail_after=None):
+    for start in range(0, count, size):
+        if fail_after is not None and start >= fail_after:
+            raise RuntimeError("connection lost")
+        yield [_row(i) for i in range(start, min(count, start + size))]
+
+
+async def _collect(stream):
+    return b"".join([chunk async for chunk in stream])
+
+
+@pytest.mark.parametrize("header,expected", [
+    ("gzip, deflate, br", True),
+    ("br;q=1.0, gzip;q=0.5", True),
+    ("gzip;q=0", False),
+    ("*", True),
+    ("identity", False),
+    (None, False),
+])
+def test_accepts_gzip(header, expected):
+    """Accept-Encoding 협상"""
+    assert accepts_gzip(header) is expected
+
+
+@pytest.mark.anyio
+async def test_csv_stream_writes_gzip_artifact(tmp_path):
+    """CSV 스트림과 캐시 파일(gzip)이 같은 내용, 캐시 적중 시 풀어서 전송 가능"""
+    exporter = FacilityExporter(str(tmp_path), max_files=10)
+    key = exporter.artifact_key("csv", {"facility_type": None}, "10-1.0")
+    assert exporter.cached_path("csv", key) is None
+
+    body = await _collect(exporter.stream("csv", key, _batches(25, 10), gzip_response=False))
+    rows = list(csv.reader(io.StringIO(body.decode("utf-8-sig"))))
+    assert rows[0] == list(EXPORT_COLUMNS)
+    assert len(rows) == 26
+    assert rows[1][1] == "시설, 0"
+
+    path = exporter.cached_path("csv", key)
+    with open(path, "rb") as fp:
+        assert gzip.decompress(fp.read()) == body
+    assert b"".join(exporter.read_cached(path, decompress=True)) == body
+    assert os.listdir(tmp_path) == [os.path.basename(path)]
+
+
+@pytest.mark.anyio
+async def test_geojson_gzip_response():
+    """gzip 응답은 유효한 FeatureCollection 으로 풀림 (캐시 미사용)"""
+    exporter = FacilityExporter(None, max_files=10)
+    body = await _collect(exporter.stream("geojson", "k", _batches(5, 2), gzip_response=True))
+    collection = json.loads(gzip.decompress(body))
+    assert len(collection["features"]) == 5
+    feature = collection["features"][0]
+    assert feature["geometry"] == {"type": "Point", "coordinates": [127.0, 37.5]}
+    assert feature["properties"]["region_name"] == "서울특별시 중구"
+
+
+@pytest.mark.anyio
+async def test_interrupted_stream_is_not_cached(tmp_path):
+    """중간에 실패한 내보내기는 캐시 파일을 남기지 않음"""
+    exporter = FacilityExporter(str(tmp_path), max_files=10)
+    with pytest.raises(RuntimeError):
+        await _collect(exporter.stream("csv", "k", _batches(30, 10, fail_after=10), gzip_response=True))
+    assert os.listdir(tmp_path) == []
+
+
+def test_artifact_key_depends_on_filters_and_version():
+    """필터/데이터 버전/형식이 다르면 다른 결과 파일"""
+    exporter = FacilityExporter(None, max_files=10)
+    base = exporter.artifact_key("csv", {"region_code": "11140"}, "v1")
+    assert base == exporter.artifact_key("csv", {"region_code": "11140"}, "v1")
+    assert base != exporter.artifact_key("csv", {"region_code": "11110"}, "v1")
+    assert base != exporter.artifact_key("csv", {"region_code": "11140"}, "v2")
+    assert base != exporter.artifact_key("geojson", {"region_code": "11140"}, "v1")
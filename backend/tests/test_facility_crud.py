@@ -0,0 +1,144 @@
+import re
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.crud.facility import InvalidCursor, decode_cursor, encode_cursor, facility
+
+
+def test_cursor_round_trip():
+    """한글 유형명과 지역 코드가 포함된 커서 왕복"""
+    cursor = encode_cursor("수영장", "11140", 12345)
+    assert "=" not in cursor
+    assert decode_cursor(cursor) == ("수영장", "11140", 12345)
+
+
+@pytest.mark.parametrize("cursor", ["", "not-base64!", encode_cursor("a", "b", 1)[:-2], "WzEsMiwzXQ"])
+def test_invalid_cursor_rejected(cursor):
+    """잘못된 커서는 InvalidCursor"""
+    with pytest.raises(InvalidCursor):
+        decode_cursor(cursor)
+
+
+class _Row:
+    def __init__(self, facility_type, region_code, id):
+        self.facility_type = facility_type
+        self.region_code = region_code
+        self.id = id
+
+
+@pytest.mark.anyio
+async def test_get_page_uses_keyset_without_offset(recording_session):
+    """다음 페이지는 OFFSET 없이 정렬 키 비교로 조회"""
+    rows = [_Row("수영장", "11140", i) for i in range(1, 4)]
+    db = recording_session(rows, rows)
+
+    page, next_cursor = await facility.get_page(db, facility_type="수영장", limit=2)
+    assert [row.id for row in page] == [1, 2]
+    assert decode_cursor(next_cursor) == ("수영장", "11140", 2)
+
+    await facility.get_page(db, facility_type="수영장", limit=2, cursor=next_cursor)
+    sql = db.sql[-1]
+    assert "OFFSET" not in sql
+    assert "(sportsfacility.region_code, sportsfacility.id) >" in sql
+    assert "JOIN region" in sql
+
+
+@pytest.mark.parametrize(
+    "filters, predicate, order_by, cursor_values",
+    [
+        (
+            {},
+            "(sportsfacility.facility_type, sportsfacility.region_code, sportsfacility.id) > "
+            "(%(param_1)s, %(param_2)s, %(param_3)s)",
+            "sportsfacility.facility_type, sportsfacility.region_code, sportsfacility.id",
+            ["수영장", "11140", 2],
+        ),
+        (
+            {"facility_type": "수영장"},
+            "(sportsfacility.region_code, sportsfacility.id) > (%(param_1)s, %(param_2)s)",
+            "sportsfacility.region_code, sportsfacility.id",
+            ["11140", 2],
+        ),
+        (
+            {"region_code": "11140"},
+            "(sportsfacility.facility_type, sportsfacility.id) > (%(param_1)s, %(param_2)s)",
+            "sportsfacility.facility_type, sportsfacility.id",
+            ["수영장", 2],
+        ),
+        (
+            {"facility_type": "수영장", "region_code": "11140"},
+            "sportsfacility.id > %(id_1)s",
+            "sportsfacility.id",
+            [2],
+        ),
+    ],
+)
+@pytest.mark.anyio
+async def test_get_page_keyset_matches_index_per_filter(recording_session, filters, predicate, order_by, cursor_values):
+    """고정된 필터 컬럼은 비교/정렬에서 빼고 인덱스의 나머지 컬럼만 행 비교 (인덱스 조건으로 쓰이도록)"""
+    db = recording_session([])
+    await facility.get_page(db, limit=2, cursor=encode_cursor("수영장", "11140", 2), **filters)
+
+    statement = db.statements[-1]
+    compiled = statement.compile(dialect=postgresql.dialect())
+    sql = str(compiled)
+    assert predicate in sql
+    assert f"ORDER BY {order_by} \n" in sql
+    names = re.findall(r"%\((\w+)\)s", predicate)
+    assert [compiled.params[name] for name in names] == cursor_values
+
+
+@pytest.mark.anyio
+async def test_last_page_has_no_cursor(recording_session):
+    """limit 이하로 조회되면 다음 커서 없음"""
+    db = recording_session([_Row("체육관", "11110", 7)])
+    page, next_cursor = await facility.get_page(db, limit=2)
+    assert len(page) == 1
+    assert next_cursor is None
+
+
+@pytest.mark.anyio
+async def test_nearby_uses_radius_prefilter_and_knn_ordering(recording_session):
+    """반경 조건(ST_DWithin)과 <-> 정렬, 미터 거리 컬럼"""
+    db = recording_session([])
+    await facility.get_nearby(db, lat=37.5665, lng=126.978, radius_m=3000, k=5, facility_type="수영장")
+
+    sql = db.sql[-1]
+    assert "ST_DWithin(sportsfacility.location" in sql
+    assert "ORDER BY sportsfacility.location <-> CAST(" in sql
+    assert "AS distance_m" in sql
+    assert "geography(POINT,4326)" in sql
+
+
+@pytest.mark.anyio
+async def test_search_pushes_filters_and_escapes_terms(recording_session):
+    """단어별 이름/주소 ILIKE 와 유형/지역 필터를 한 쿼리로, 와일드카드는 이스케이프"""
+    db = recording_session([])
+    await facility.search(db, q=" 잠실  수영_장 ", facility_type="수영장", region_code="11710", limit=5)
+    statement = db.statements[-1]
+    sql = str(statement.compile(dialect=postgresql.dialect()))
+    params = statement.compile(dialect=postgresql.dialect()).params
+
+    assert sql.count("sportsfacility.name ILIKE") == 3  # score + 단어 2개
+    assert "word_similarity" in sql
+    assert "ORDER BY score DESC, sportsfacility.id" in sql
+    assert "%잠실%" in params.values()
+    assert "%수영\\_장%" in params.values()
+    assert "11710" in params.values() and "수영장" in params.values()
+    # 2글자 단어만 bigram 인덱스 조건 추가
+    assert sql.count("text_bigrams(sportsfacility.name) @>") == 1
+    assert sql.count("text_bigrams(sportsfacility.address) @>") == 1
+    assert ["잠실"] in params.values()
+
+
+@pytest.mark.anyio
+async def test_open_slot_filters_with_bitmap(recording_session):
+    """운영시간 필터는 비트맵 get_bit 검사 (JSON 해석 없음)"""
+    db = recording_session([])
+    await facility.get_page(db, limit=10, open_slot=558)
+    await facility.get_nearby(db, lat=37.5, lng=127.0, radius_m=1000, open_slot=558)
+    for statement in db.statements:
+        compiled = statement.compile(dialect=postgresql.dialect())
+        assert "get_bit(sportsfacility.open_hours_bitmap" in str(compiled)
+        assert 558 in compiled.params.values()
@@ -0,0 +1,149 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import httpx
+import pytest
+
+from app.services.facility_changes import FacilityChangeset
+from app.services.facility_ingest import (
+    _UPSERT_SQL, FIELD_MAP, STAGING_COLUMNS, FacilityApiClient, IngestError, parse_item,
+)
+
+
+TOTAL = 2345
+
+
+def _item(n):
+    return {
+        "faci_cd": f"F{n:05d}",
+        "faci_nm": f"시설 {n}",
+        "ftype_nm": "수영장" if n % 2 else "체육관",
+        "cpb_cd": "11140",
+        "faci_road_addr": "서울특별시 중구 세종대로 110",
+        "faci_lat": "37.5665",
+        "faci_lot": "126.978",
+        "faci_gb_nm": "공공",
+    }
+
+
+class _StubApi(BaseHTTPRequestHandler):
+    """data.go.kr 형식 페이지 응답, 2페이지 첫 요청은 503"""
+
+    failed_once = set()
+    requests = []
+
+    def do_GET(self):
+        query = parse_qs(urlparse(self.path).query)
+        page_no, page_size = int(query["pageNo"][0]), int(query["numOfRows"][0])
+        self.requests.append(page_no)
+        if page_no == 2 and page_no not in self.failed_once:
+            self.failed_once.add(page_no)
+            self.send_response(503)
+            self.send_header("Retry-After", "0")
+            self.end_headers()
+            return
+
+        start = (page_no - 1) * page_size
+        items = [_item(n) for n in range(start, min(start + page_size, TOTAL))]
+        body = json.dumps({
+            "response": {
+                "header": {"resultCode": "00", "resultMsg": "NORMAL SERVICE."},
+                "body": {"items": {"item": items}, "numOfRows": page_size, "pageNo": page_no, "totalCount": TOTAL},
+            }
+        }, ensure_ascii=False).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json;charset=UTF-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def stub_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubApi)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    _StubApi.failed_once.clear()
+    _StubApi.requests.clear()
+    yield f"http://127.0.0.1:{server.server_port}/facilities"
+    server.shutdown()
+
+
+@pytest.mark.anyio
+async def test_fetches_all_pages_with_retry(stub_url):
+    """모든 페이지를 받고, 503 응답은 재시도"""
+    async with httpx.AsyncClient() as client:
+        api = FacilityApiClient(client, stub_url, api_key="key", page_size=500, concurrency=3, backoff=0)
+        codes = [item["faci_cd"] async for page in api.iter_pages() for item in page]
+
+    assert len(codes) == TOTAL
+    assert len(set(codes)) == TOTAL
+    assert api.retries == 1
+    assert sorted(_StubApi.requests) == [1, 2, 2, 3, 4, 5]
+
+
+@pytest.mark.anyio
+async def test_result_code_error_is_not_retried():
+    """resultCode 오류는 IngestError"""
+    def handler(request):
+        return httpx.Response(200, json={"response": {"header": {"resultCode": "30", "resultMsg": "SERVICE KEY IS NOT REGISTERED"}}})
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        api = FacilityApiClient(client, "http://stub/facilities", api_key="bad", backoff=0)
+        with pytest.raises(IngestError):
+            await api.fetch_page(1)
+    assert api.retries == 0
+
+
+def test_parse_item_builds_staging_row():
+    """필드 매핑과 공공/민간 구분"""
+    row = parse_item({**_item(1), "faci_gb_nm": "민간", "faci_tel_no": " "})
+    assert row[:5] == ("F00001", "시설 1", "수영장", None, "11140")
+    assert row[6:8] == (37.5665, 126.978)
+    assert row[9] is None
+    assert row[-2] is False
+    assert len(row) == len(STAGING_COLUMNS)
+
+
+def test_upsert_leaves_opening_hours_alone():
+    """원천에 운영시간이 없으므로 적재는 opening_hours/비트맵을 쓰지 않음 (ORM 에서 함께 갱신한 값 유지)"""
+    for column in ("opening_hours", "open_hours_bitmap"):
+        assert column not in FIELD_MAP.values()
+        assert column not in STAGING_COLUMNS
+        assert column not in _UPSERT_SQL
+
+
+def test_content_hash_tracks_record_changes():
+    """값이 같으면 같은 해시, 어느 필드든 바뀌면 다른 해시"""
+    base = parse_item(_item(1))
+    assert parse_item(_item(1))[-1] == base[-1]
+    assert parse_item({**_item(1), "faci_tel_no": "02-123-4567"})[-1] != base[-1]
+    assert parse_item({**_item(1), "faci_lat": "37.5666"})[-1] != base[-1]
+    assert len(base[-1]) == 32
+
+
+def test_parse_item_keeps_missing_region_code():
+    """행정구역 코드가 없어도 좌표로 지정하므로 제외하지 않음"""
+    row = parse_item({**_item(1), "cpb_cd": ""})
+    assert row is not None
+    assert row[4] is None
+
+
+@pytest.mark.parametrize("override", [{"faci_lat": ""}, {"faci_lot": "abc"}, {"faci_lat": "0", "faci_lot": "0"}, {"faci_cd": ""}])
+def test_parse_item_rejects_incomplete(override):
+    """좌표/코드가 없는 레코드는 제외"""
+    assert parse_item({**_item(1), **override}) is None
+
+
+def test_changeset_round_trip():
+    """변경 내역 JSON 직렬화 왕복 (Redis 전파/파일 저장 형식)"""
+    changeset = FacilityChangeset(added=[1], removed=[3], regions={"11140"}, points=[(37.5, 127.0)])
+    restored = FacilityChangeset.from_dict(json.loads(json.dumps(changeset.to_dict())))
+    assert restored == changeset
+    assert restored
+    assert not FacilityChangeset(regions={"11140"})
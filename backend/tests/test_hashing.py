@@ -0,0 +1,86 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from passlib.context import CryptContext
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.core import security
+from app.core.hashing import HashingPoolBusy, PasswordHashPool
+from app.crud.user import user as user_crud
+from app.models.base import Base
+from app.models.user import User
+
+
+def _wait(event: threading.Event) -> str:
+    event.wait(5)
+    return "done"
+
+
+def test_admission_capped_below_threadpool():
+    """대기열 설정이 커도 허용 수는 스레드풀의 일부로 제한"""
+    assert PasswordHashPool(max_workers=2, queue_limit=32).admission_limit == 10
+    assert PasswordHashPool(max_workers=2, queue_limit=4).admission_limit == 6
+
+
+def test_rejects_with_retry_after_when_full():
+    """허용 수만큼 처리/대기 중이면 다음 요청은 기다리지 않고 503 + Retry-After"""
+    pool = PasswordHashPool(max_workers=1, queue_limit=1, retry_after=3)
+    pool._executor = ThreadPoolExecutor(max_workers=1)
+    release = threading.Event()
+    callers = [threading.Thread(target=pool.run, args=(_wait, release)) for _ in range(2)]
+    try:
+        for caller in callers:
+            caller.start()
+        deadline = time.monotonic() + 5
+        while pool.stats()["in_flight"] < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        with pytest.raises(HashingPoolBusy) as exc_info:
+            pool.run(_wait, release)
+        assert exc_info.value.status_code == 503
+        assert exc_info.value.headers == {"Retry-After": "3"}
+        assert pool.stats()["rejected"] == 1
+    finally:
+        release.set()
+        for caller in callers:
+            caller.join()
+        pool.shutdown()
+
+    # 자리가 나면 다시 받음
+    pool._executor = ThreadPoolExecutor(max_workers=1)
+    assert pool.run(_wait, release) == "done"
+    pool.shutdown()
+
+
+@pytest.fixture
+def thread_hash_pool(monkeypatch):
+    """bcrypt 를 프로세스 대신 스레드에서 실행 (spawn 비용 없이 실제 해시 경로 사용)"""
+    executor = ThreadPoolExecutor(max_workers=1)
+    monkeypatch.setattr(security.hash_pool, "_executor", executor)
+    yield
+    executor.shutdown()
+
+
+def test_authenticate_rehashes_outdated_hash(thread_hash_pool):
+    """해시 비용이 BCRYPT_ROUNDS 와 다르면 로그인 성공 시 새 해시로 저장"""
+    engine = create_engine("sqlite:///:memory:", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine, tables=[User.__table__])
+    db = sessionmaker(bind=engine)()
+    old_hash = CryptContext(schemes=["bcrypt"], bcrypt__rounds=4).hash("secret-pw")
+    db.add(User(email="old@example.com", username="old", display_name="Old", hashed_password=old_hash))
+    db.commit()
+
+    assert user_crud.authenticate(db, "old@example.com", "wrong-pw") is None
+    assert db.query(User).one().hashed_password == old_hash
+
+    user = user_crud.authenticate(db, "old@example.com", "secret-pw")
+    assert user is not None
+    stored = db.query(User).one().hashed_password
+    assert stored != old_hash
+    assert not security.pwd_context.needs_update(stored)
+    assert security.verify_password("secret-pw", stored)
+    db.close()
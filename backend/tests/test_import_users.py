@@ -0,0 +1,153 @@
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.commands import import_users as command
+from app.crud.user import user as user_crud
+from app.models.base import Base
+from app.models.user import User
+
+
+KNOWN_REGIONS = {"11", "11110"}
+
+
+@pytest.fixture
+def session_factory(monkeypatch):
+    """User 테이블만 있는 SQLite + 스레드 풀 / 가짜 해시 / 지역 코드 목록"""
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine, tables=[User.__table__])
+    factory = sessionmaker(bind=engine)
+    monkeypatch.setattr(command, "SessionLocal", factory)
+    monkeypatch.setattr(command, "ProcessPoolExecutor", ThreadPoolExecutor)
+    monkeypatch.setattr(
+        command, "hash_passwords", lambda passwords, executor, chunksize: [f"hashed:{p}" for p in passwords]
+    )
+    # region 테이블은 Geography 컬럼 때문에 SQLite 에 만들 수 없음
+    monkeypatch.setattr(
+        user_crud, "get_existing_region_codes", lambda db, codes: set(codes) & KNOWN_REGIONS
+    )
+    yield factory
+    engine.dispose()
+
+
+def _row(name: str, **extra) -> dict:
+    return {
+        "email": f"{name}@example.com",
+        "username": name,
+        "password": "secret-password",
+        "display_name": name.title(),
+        **extra,
+    }
+
+
+def _usernames(factory) -> list:
+    with factory() as db:
+        return sorted(db.scalars(select(User.username)))
+
+
+def test_csv_rows_parsed_with_list_fields(tmp_path, session_factory):
+    """CSV 는 2행부터 번호를 매기고 `|` 목록 컬럼과 빈 값을 정리"""
+    path = tmp_path / "users.csv"
+    path.write_text(
+        "email,username,password,display_name,region_code,interested_sports\n"
+        "kim@example.com,kim,pw,김,11, 축구 | 농구 \n"
+        "lee@example.com,lee,pw,이,,\n",
+        encoding="utf-8",
+    )
+
+    rows = list(command._read_rows(str(path)))
+    assert rows[0] == (2, {
+        "email": "kim@example.com", "username": "kim", "password": "pw",
+        "display_name": "김", "region_code": "11", "interested_sports": ["축구", "농구"],
+    })
+    assert rows[1] == (3, {"email": "lee@example.com", "username": "lee", "password": "pw", "display_name": "이"})
+
+    report = command.import_users(str(path))
+    assert (report.total, report.inserted, report.errors) == (2, 2, [])
+    with session_factory() as db:
+        kim = db.scalar(select(User).where(User.username == "kim"))
+        assert kim.interested_sports == ["축구", "농구"]
+        assert kim.hashed_password == "hashed:pw"
+
+
+def test_jsonl_skips_blank_lines(tmp_path, session_factory):
+    """JSONL 은 빈 줄을 건너뛰되 행 번호는 파일 기준"""
+    path = tmp_path / "users.jsonl"
+    path.write_text(
+        json.dumps(_row("kim")) + "\n\n" + json.dumps(_row("lee", region_code="11110")) + "\n",
+        encoding="utf-8",
+    )
+
+    assert [line_no for line_no, _ in command._read_rows(str(path))] == [1, 3]
+    report = command.import_users(str(path))
+    assert (report.total, report.inserted, report.errors) == (2, 2, [])
+    assert _usernames(session_factory) == ["kim", "lee"]
+
+
+def test_duplicates_and_invalid_rows_reported_per_line(tmp_path, session_factory):
+    """파일 내 중복, DB 중복, 스키마 오류, 없는 지역 코드는 해당 행만 오류로 보고"""
+    with session_factory() as db:
+        user_crud.bulk_create(db, [command.UserCreate(**_row("park"))], ["hashed"])
+
+    rows = [
+        _row("kim"),                                        # 1 정상
+        _row("kim2", email="kim@example.com"),              # 2 파일 내 중복 이메일
+        _row("kim", email="other@example.com"),             # 3 파일 내 중복 사용자명
+        _row("park2", email="park@example.com"),            # 4 DB 중복 이메일
+        _row("park", email="park3@example.com"),            # 5 DB 중복 사용자명
+        _row("bad", email="not-an-email"),                  # 6 스키마 오류
+        _row("choi", region_code="99"),                     # 7 없는 지역 코드
+        _row("jung", region_code="11"),                     # 8 정상
+    ]
+    path = tmp_path / "users.jsonl"
+    path.write_text("".join(json.dumps(row) + "\n" for row in rows), encoding="utf-8")
+
+    report = command.import_users(str(path), batch_size=3)
+
+    assert (report.total, report.inserted) == (8, 2)
+    reasons = dict(report.errors)
+    assert sorted(reasons) == [2, 3, 4, 5, 6, 7]
+    assert reasons[2] == "파일 내 중복 이메일"
+    assert reasons[3] == "파일 내 중복 사용자명"
+    assert reasons[4] == "이미 등록된 이메일입니다"
+    assert reasons[5] == "이미 사용 중인 사용자명입니다"
+    assert reasons[6].startswith("email:")
+    assert reasons[7] == "존재하지 않는 지역 코드입니다"
+    assert _usernames(session_factory) == ["jung", "kim", "park"]
+
+
+def test_dry_run_writes_nothing(tmp_path, session_factory):
+    """--dry-run 은 검증만 하고 적재하지 않음"""
+    path = tmp_path / "users.jsonl"
+    path.write_text(json.dumps(_row("kim")) + "\n", encoding="utf-8")
+
+    report = command.import_users(str(path), dry_run=True)
+    assert (report.total, report.inserted, report.errors) == (1, 0, [])
+    assert _usernames(session_factory) == []
+
+
+def test_integrity_error_isolated_to_offending_rows(tmp_path, session_factory, monkeypatch):
+    """사전 확인 뒤 충돌한 행만 실패로 보고하고 같은 배치의 나머지는 적재"""
+    rows = [_row(f"user{i}") for i in range(7)]
+    path = tmp_path / "users.jsonl"
+    path.write_text("".join(json.dumps(row) + "\n" for row in rows), encoding="utf-8")
+
+    # 검증과 적재 사이에 다른 경로로 같은 이메일이 등록된 상황
+    with session_factory() as db:
+        user_crud.bulk_create(db, [command.UserCreate(**_row("other", email="user4@example.com"))], ["hashed"])
+    monkeypatch.setattr(user_crud, "get_existing_emails", lambda db, emails: set())
+
+    report = command.import_users(str(path))
+
+    assert (report.total, report.inserted) == (7, 6)
+    assert [line_no for line_no, _ in report.errors] == [5]
+    assert report.errors[0][1].startswith("적재 실패:")
+    assert _usernames(session_factory) == sorted(["other"] + [f"user{i}" for i in range(7) if i != 4])
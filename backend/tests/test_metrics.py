@@ -0,0 +1,43 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.core.metrics import Histogram, MetricsMiddleware, MetricsRegistry, http_responses
+
+
+def test_histogram_renders_cumulative_buckets():
+    """버킷은 누적 개수로, +Inf/_count는 전체 관측 수로 출력"""
+    histogram = Histogram("latency_seconds", "test", ("route",), buckets=(0.1, 1.0))
+    for value in (0.05, 0.5, 5.0):
+        histogram.observe(value, "/a")
+
+    lines = list(histogram.render())
+    assert 'latency_seconds_bucket{route="/a",le="0.1"} 1' in lines
+    assert 'latency_seconds_bucket{route="/a",le="1.0"} 2' in lines
+    assert 'latency_seconds_bucket{route="/a",le="+Inf"} 3' in lines
+    assert 'latency_seconds_count{route="/a"} 3' in lines
+
+
+def test_registry_escapes_label_values():
+    """라벨 값의 따옴표/개행 이스케이프"""
+    registry = MetricsRegistry()
+    counter = registry.counter("hits_total", "test", ("path",))
+    counter.inc('a"b\nc')
+    assert 'hits_total{path="a\\"b\\nc"} 1.0' in registry.render()
+
+
+def test_middleware_labels_by_route_template():
+    """경로 파라미터 값 대신 라우트 템플릿을 라벨로 사용"""
+    app = FastAPI()
+    app.add_middleware(MetricsMiddleware)
+
+    @app.get("/items/{item_id}")
+    async def read_item(item_id: int):
+        return {"id": item_id}
+
+    client = TestClient(app)
+    client.get("/items/1")
+    client.get("/items/2")
+
+    rendered = "\n".join(http_responses.render())
+    assert 'route="/items/{item_id}",status="200"} 2.0' in rendered
+    assert "/items/1" not in rendered
@@ -0,0 +1,56 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.core.opening_hours import BITMAP_BYTES, SLOTS_PER_DAY, build_bitmap, is_open, week_slot
+
+
+def _slot(day: int, hhmm: str) -> int:
+    hour, minute = map(int, hhmm.split(":"))
+    return day * SLOTS_PER_DAY + (hour * 60 + minute) // 15
+
+
+@pytest.mark.parametrize("opening_hours", [
+    {"평일": "06:00-22:00", "토": "08:00~18:00", "일": "휴무"},
+    {"weekdays": {"open": "06:00", "close": "22:00"}, "sat": "08:00-18:00", "sunday": "closed"},
+    [{"day": "월-금", "open": "06:00", "close": "22:00"}, {"day": "토요일", "hours": "08:00-18:00"}],
+    "평일 06:00-22:00, 토 08시-18시",
+])
+def test_build_bitmap_formats(opening_hours):
+    """흔한 운영시간 표기를 같은 비트맵으로 해석"""
+    bitmap = build_bitmap(opening_hours)
+    assert len(bitmap) == BITMAP_BYTES
+    assert is_open(bitmap, _slot(0, "06:00")) and is_open(bitmap, _slot(4, "21:45"))
+    assert not is_open(bitmap, _slot(0, "05:45")) and not is_open(bitmap, _slot(2, "22:00"))
+    assert is_open(bitmap, _slot(5, "17:59")) and not is_open(bitmap, _slot(5, "18:00"))
+    assert not any(is_open(bitmap, _slot(6, f"{hour:02d}:00")) for hour in range(24))
+
+
+def test_specific_day_overrides_group_and_overnight_spills():
+    """개별 요일이 묶음보다 우선, 자정 넘김은 다음 날로 이어짐"""
+    bitmap = build_bitmap({"매일": "09:00-18:00", "화": "closed", "sun": "22:00-02:00"})
+    assert is_open(bitmap, _slot(0, "12:00"))
+    assert not is_open(bitmap, _slot(1, "12:00"))
+    assert is_open(bitmap, _slot(6, "23:30"))
+    assert is_open(bitmap, _slot(0, "01:45"))  # 일요일 밤 → 월요일 새벽
+    assert not is_open(bitmap, _slot(0, "02:00"))
+
+
+@pytest.mark.parametrize("opening_hours", [None, "문의", {}, {"비고": "전화 문의"}])
+def test_unknown_hours_are_none(opening_hours):
+    """해석할 수 없으면 None (open 필터에서 제외)"""
+    assert build_bitmap(opening_hours) is None
+
+
+def test_always_open():
+    """24시간 표기는 모든 칸 운영"""
+    assert build_bitmap("24시간") == b"\xff" * BITMAP_BYTES
+
+
+def test_week_slot_uses_korean_time():
+    """시각대가 있는 시각은 한국 시각으로 변환"""
+    saturday_evening = datetime(2026, 10, 17, 19, 30)
+    assert week_slot(saturday_evening) == _slot(5, "19:30")
+    utc = datetime(2026, 10, 17, 10, 30, tzinfo=timezone.utc)
+    assert week_slot(utc) == _slot(5, "19:30")
+    assert week_slot(datetime(2026, 10, 18, 23, 59, tzinfo=timezone(timedelta(hours=9)))) == _slot(6, "23:45")
@@ -0,0 +1,69 @@
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.core import activity
+from app.core.activity import ActiveUserCounter, HyperLogLog
+from app.crud.counters import platform_counter
+
+
+def test_hyperloglog_estimate_and_merge():
+    """추정 오차 수 % 이내, 합치면 합집합 크기"""
+    first, second = HyperLogLog(), HyperLogLog()
+    for value in range(20000):
+        first.add(value)
+    for value in range(10000, 30000):
+        second.add(value)
+    assert first.count() == pytest.approx(20000, rel=0.05)
+
+    first.merge(second)
+    assert first.count() == pytest.approx(30000, rel=0.05)
+
+    small = HyperLogLog()
+    for value in ["1", "2", "3", "3"]:
+        small.add(value)
+    assert small.count() == 3
+
+
+def test_active_users_sliding_window(monkeypatch):
+    """같은 버킷의 중복 기록은 걸러지고, 구간을 벗어난 버킷은 세지 않음"""
+    monkeypatch.setattr(activity, "get_redis", lambda: None)
+    clock = [1_000_000.0]
+    monkeypatch.setattr(activity.time, "time", lambda: clock[0])
+    counter = ActiveUserCounter(window=7200, bucket=3600)
+
+    for user_id in (1, 2, 2, 3):
+        counter.record(user_id)
+    assert counter.recorded == 3
+    assert counter.count() == 3
+
+    clock[0] += 3600
+    counter.record(3)
+    counter.record(4)
+    assert counter.count() == 4
+
+    clock[0] += 3600  # 첫 버킷이 구간에서 빠짐
+    assert counter.count() == 2
+
+
+@pytest.mark.anyio
+async def test_reconcile_corrects_only_drifted_counters(recording_session):
+    """실제 COUNT 와 다른 카운터만 교정"""
+    db = recording_session(
+        [("total_facilities", 10), ("total_regions", 17), ("total_proposals", 5)],
+        scalars=[True, 12, 17, 5],
+    )
+    drift = await platform_counter.reconcile(db)
+
+    assert drift == {"total_facilities": (10, 12)}
+    select_for_update, upsert = db.sql
+    assert select_for_update.endswith("FOR UPDATE")
+    assert upsert.startswith("INSERT INTO platformcounter")
+    assert "ON CONFLICT (name) DO UPDATE" in upsert
+
+
+@pytest.mark.anyio
+async def test_reconcile_skips_when_another_run_holds_lock(recording_session):
+    """다른 워커가 대조 중이면 아무것도 하지 않고 None (일치 {} 와 구분)"""
+    db = recording_session(scalars=[False])
+    assert await platform_counter.reconcile(db) is None
+    assert db.statements == []
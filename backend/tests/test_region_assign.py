@@ -0,0 +1,43 @@
+from types import SimpleNamespace
+
+import pytest
+
+from app.services.region_assign import assign_facility_regions
+
+
+def _row(id, old_code, new_code, updated, total=10):
+    return SimpleNamespace(
+        id=id, facility_code=f"F{id:05d}", old_code=old_code, new_code=new_code,
+        latitude=37.5, longitude=127.0, updated=updated, total=total,
+    )
+
+
+@pytest.mark.anyio
+async def test_assign_reports_mismatches_and_changeset(recording_session):
+    """한 문장의 공간 조인 결과로 불일치/경계 밖/갱신 건수와 변경 내역 집계"""
+    db = recording_session([
+        _row(1, "11140", "11680", True),
+        _row(2, "11140", None, False),
+        _row(3, "36110", "36110000", True),
+    ])
+    report = await assign_facility_regions(db, sample_size=2)
+
+    assert (report.total, report.mismatched, report.unlocated, report.updated) == (10, 2, 1, 2)
+    assert report.samples == [("F00001", "11140", "11680"), ("F00002", "11140", None)]
+    assert report.changeset.changed == [1, 3]
+    assert report.changeset.regions == {"11140", "11680", "36110", "36110000"}
+
+    [sql] = db.sql
+    assert "ST_Covers(r.geometry, f.location)" in sql
+    assert "ORDER BY r.level = 'sigungu' DESC" in sql
+    assert db.params == [{"dry_run": False}]
+
+
+@pytest.mark.anyio
+async def test_assign_without_mismatches_counts_total(recording_session):
+    """불일치가 없으면 활성 시설 수만 보고"""
+    db = recording_session([], scalars=[42])
+    report = await assign_facility_regions(db, dry_run=True)
+    assert (report.total, report.mismatched, report.updated) == (42, 0, 0)
+    assert not report.changeset
+    assert db.params[0] == {"dry_run": True}
@@ -0,0 +1,29 @@
+from app.core.config import settings
+from app.core.security import create_access_token, token_cache, verify_token
+
+
+def test_verify_token_caches_verified_tokens():
+    """같은 토큰의 반복 검증은 캐시에서 처리"""
+    token_cache.clear()
+    token = create_access_token(subject=1, claims={"ver": 0})
+
+    first = verify_token(token)
+    second = verify_token(token)
+
+    assert first is not None and first.user_id == 1
+    assert second is first
+    assert verify_token(token, token_type="refresh") is None
+
+
+def test_verify_token_fails_closed_on_secret_rotation():
+    """서명 키가 바뀌면 캐시된 토큰도 거부"""
+    token_cache.clear()
+    token = create_access_token(subject=1, claims={"ver": 0})
+    assert verify_token(token) is not None
+
+    original_key = settings.SECRET_KEY
+    settings.SECRET_KEY = original_key + "-rotated"
+    try:
+        assert verify_token(token) is None
+    finally:
+        settings.SECRET_KEY = original_key
@@ -0,0 +1,51 @@
+from types import SimpleNamespace
+
+import pytest
+
+from app.crud.statistics import _summarize, facility_statistic
+
+
+def _row(region_code, region_name, facility_type, is_public, facility_count):
+    return SimpleNamespace(
+        region_code=region_code, region_name=region_name, facility_type=facility_type,
+        is_public=is_public, facility_count=facility_count,
+    )
+
+
+def test_summarize_totals_and_top_regions():
+    """공공/민간 합계, 유형별 내림차순, 지역 순위"""
+    rows = [
+        _row("11", "서울특별시", "수영장", True, 30),
+        _row("11", "서울특별시", "체육관", False, 5),
+        _row("26", "부산광역시", "체육관", True, 50),
+    ]
+    summary = _summarize(rows, rows)
+
+    assert summary["total_facilities"] == 85
+    assert summary["public_facilities"] == 80
+    assert summary["private_facilities"] == 5
+    assert list(summary["by_type"].items()) == [("체육관", 55), ("수영장", 30)]
+    assert summary["by_region_top5"][0] == {"region_code": "26", "region_name": "부산광역시", "count": 50}
+
+
+@pytest.mark.anyio
+async def test_refresh_only_touches_changed_regions(recording_session):
+    """변경된 시군구와 그 상위 시도만 삭제/재집계"""
+    db = recording_session([("11140", "sigungu", "11")])
+    await facility_statistic.refresh(db, ["11140"])
+
+    _, delete_sigungu, insert_sigungu, delete_sido, insert_sido = db.sql
+    assert delete_sigungu.startswith("DELETE FROM facilitystatistic")
+    assert "facilitystatistic.region_code IN" in delete_sigungu
+    assert insert_sigungu.startswith("INSERT INTO facilitystatistic")
+    assert "sportsfacility.region_code IN" in insert_sigungu
+    assert "GROUP BY" in insert_sigungu
+    assert "region.parent_code" in insert_sido
+
+
+@pytest.mark.anyio
+async def test_refresh_unknown_region_is_noop(recording_session):
+    """알 수 없는 지역 코드는 집계를 건드리지 않음"""
+    db = recording_session([])
+    await facility_statistic.refresh(db, ["99999"])
+    assert len(db.statements) == 1
@@ -0,0 +1,77 @@
+import pytest
+
+from app.services.supply_demand import SupplyDemandAnalyzer, build_matrix
+
+
+REGIONS = [
+    ("11", "서울특별시", "sido", None, 9000000, 37.56, 126.97),
+    ("11110", "서울특별시 종로구", "sigungu", "11", 140000, 37.57, 126.98),
+    ("11140", "서울특별시 중구", "sigungu", "11", 120000, 37.56, 126.99),
+    ("36", "세종특별자치시", "sido", None, 380000, 36.48, 127.28),
+    ("26", "부산광역시", "sido", None, None, None, None),
+]
+SUPPLY = [("11140", "수영장", 5), ("11110", "수영장", 2), ("36", "수영장", 4), ("11140", "체육관", 3)]
+DEMAND = [
+    ("11", "수영장", 60.0), ("36", "수영장", 55.0), ("26", "수영장", 40.0),
+    ("11110", "수영장", 50.0), ("11140", "수영장", 68.5), ("11110", "체육관", 30.0),
+]
+
+
+def _records(matrix):
+    return {(row["region_code"], row["facility_type"]): row for row in matrix.to_dict("records")}
+
+
+def test_supply_rolls_up_to_demand_level():
+    """시/도 수요 행에는 하위 시/군/구 시설 합계, 시/도 직접 등록 시설도 포함"""
+    rows = _records(build_matrix(SUPPLY, DEMAND, REGIONS))
+    assert rows[("11", "수영장")]["supply_count"] == 7
+    assert rows[("36", "수영장")]["supply_count"] == 4
+    assert rows[("11110", "체육관")]["supply_count"] == 0
+    assert rows[("11140", "수영장")]["coordinates"] == [126.99, 37.56]
+    assert rows[("26", "수영장")]["coordinates"] == []
+
+
+def test_ratio_compares_per_capita_supply_with_demand_within_level():
+    """같은 레벨 전국 대비 인구당 공급 / 전국 대비 수요, 인구 미상은 None"""
+    rows = _records(build_matrix(SUPPLY, DEMAND, REGIONS))
+    national = (7 + 4) / (9000000 + 380000)
+    demand_mean = (60.0 + 55.0 + 40.0) / 3
+    expected = (7 / 9000000 / national) / (60.0 / demand_mean)
+    assert rows[("11", "수영장")]["supply_demand_ratio"] == pytest.approx(expected, abs=0.001)
+    assert rows[("26", "수영장")]["supply_demand_ratio"] is None
+    assert rows[("11110", "체육관")]["supply_demand_ratio"] == 0
+
+
+class _StubAnalyzer(SupplyDemandAnalyzer):
+    def __init__(self):
+        super().__init__()
+        self.version = (1,)
+        self.loads = 0
+        self.version_checks = 0
+
+    async def data_version(self, db):
+        self.version_checks += 1
+        return self.version
+
+    async def _load(self, db):
+        self.loads += 1
+        return build_matrix(SUPPLY, DEMAND, REGIONS)
+
+
+@pytest.mark.anyio
+async def test_matrix_served_from_memory_and_refreshed_per_version():
+    """요청은 DB 조회 없이 캐시된 행렬을 자르고, 버전 확인/재구성은 refresh 에서만"""
+    analyzer = _StubAnalyzer()
+    assert len(await analyzer.get(None)) == 6  # 백그라운드 로드 전 첫 요청은 직접 구성
+    seoul = await analyzer.get(None, region_code="11", facility_type="수영장")
+    assert [row["region_code"] for row in seoul] == ["11", "11110", "11140"]
+    assert (analyzer.loads, analyzer.version_checks) == (1, 1)
+
+    analyzer.version = (2,)
+    await analyzer.get(None, facility_type="체육관")
+    assert (analyzer.loads, analyzer.version_checks) == (1, 1)
+
+    assert await analyzer.refresh(None) is True
+    assert await analyzer.refresh(None) is False
+    assert analyzer.loads == 2
+    assert analyzer.stats()["builds"] == 2
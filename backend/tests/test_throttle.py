@@ -0,0 +1,39 @@
+import time
+
+from app.core.throttle import LoginThrottle, SlidingWindowLimiter
+
+
+def test_sliding_window_limits_and_recovers():
+    """한도 초과 시 Retry-After 반환, 윈도우가 지나면 다시 허용"""
+    limiter = SlidingWindowLimiter("test", limit=2, window=0.05)
+
+    assert limiter.hit("key") == 0
+    assert limiter.hit("key") == 0
+    assert limiter.hit("key") >= 1
+    assert limiter.hit("other") == 0
+
+    time.sleep(0.06)
+    assert limiter.hit("key") == 0
+    assert limiter.stats()["throttled"] == 1
+
+
+def test_login_throttle_account_reset_on_success():
+    """로그인 성공 시 계정 기록 초기화, 계정 키는 대소문자 구분 없음"""
+    throttle = LoginThrottle(per_account=2, per_ip=100, window=60)
+
+    assert throttle.hit("10.0.0.1", "User@Example.com") == 0
+    assert throttle.hit("10.0.0.2", "user@example.com") == 0
+    assert throttle.hit("10.0.0.3", "user@example.com") > 0
+
+    throttle.reset_account("user@example.com")
+    assert throttle.hit("10.0.0.4", "user@example.com") == 0
+
+
+def test_login_throttle_per_ip():
+    """같은 IP에서 여러 계정을 시도하면 IP 한도로 제한"""
+    throttle = LoginThrottle(per_account=100, per_ip=3, window=60)
+
+    for index in range(3):
+        assert throttle.hit("10.0.0.9", f"user{index}@example.com") == 0
+    assert throttle.hit("10.0.0.9", "user99@example.com") > 0
+    assert throttle.stats()["per_ip"]["throttled"] == 1
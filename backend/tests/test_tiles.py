@@ -0,0 +1,93 @@
+import os
+import time
+
+from app.services.tiles import TileCache, lonlat_to_tile, tiles_for_point
+
+
+def test_lonlat_to_tile_seoul():
+    """서울시청 좌표의 z10 타일"""
+    x, y = lonlat_to_tile(126.978, 37.5665, 10)
+    assert (int(x), int(y)) == (873, 396)
+
+
+def test_tiles_for_point_includes_buffer_neighbours():
+    """타일 경계 근처의 점은 버퍼가 걸치는 이웃 타일도 포함"""
+    tiles = set(tiles_for_point(37.5665, 126.978, 10))
+    assert (0, 0, 0) in tiles
+    assert (10, 873, 396) in tiles
+    assert all(z <= 10 for z, _, _ in tiles)
+
+    # z1 경계(경도 0) 바로 옆 점은 x=0, x=1 타일 모두에 그려진다
+    edge = {(x, y) for z, x, y in tiles_for_point(10.0, 0.0001, 1) if z == 1}
+    assert edge == {(0, 0), (1, 0)}
+
+
+def test_invalidate_points_removes_memory_and_disk(tmp_path):
+    """변경된 좌표의 타일만 메모리/디스크에서 제거"""
+    cache = TileCache(str(tmp_path), version=1, memory_tiles=100, ttl=60, max_zoom=10)
+    seoul, busan = (10, 873, 396), (10, 897, 405)
+    cache.store(seoul, b"seoul", cache.generation)
+    cache.store(busan, b"busan", cache.generation)
+    assert open(cache._path(seoul), "rb").read() == b"seoul"
+
+    cache.invalidate_points([(37.5665, 126.978)])
+
+    assert cache.get_memory(seoul) is None
+    assert cache.get_disk(seoul) is None
+    assert cache.get_memory(busan) == b"busan"
+
+
+def test_store_skips_tile_rendered_before_invalidation(tmp_path):
+    """렌더링 중 무효화가 일어나면 오래된 결과를 저장하지 않음"""
+    cache = TileCache(str(tmp_path), version=1, memory_tiles=100, ttl=60, max_zoom=10)
+    generation = cache.generation
+    cache.invalidate_points([(37.5665, 126.978)])
+    cache.store((10, 873, 396), b"stale", generation)
+    assert cache.get_memory((10, 873, 396)) is None
+    assert cache.get_disk((10, 873, 396)) is None
+
+
+def test_disk_hit_after_worker_restart(tmp_path):
+    """디스크 캐시는 새 인스턴스(워커 재시작)에서도 재사용, 버전이 다르면 무시"""
+    TileCache(str(tmp_path), 1, 100, 60, 10).store((3, 1, 2), b"tile", 0)
+    assert TileCache(str(tmp_path), 1, 100, 60, 10).get_disk((3, 1, 2)) == b"tile"
+    assert TileCache(str(tmp_path), 2, 100, 60, 10).get_disk((3, 1, 2)) is None
+
+
+def test_stale_disk_tile_not_served(tmp_path):
+    """ttl 이 지난 디스크 타일은 쓰지 않고 지움 (변경 알림이 누락된 경우 대비)"""
+    TileCache(str(tmp_path), 1, 100, 60, 10).store((3, 1, 2), b"old", 0)
+    cache = TileCache(str(tmp_path), 1, 100, 60, 10)
+    path = cache._path((3, 1, 2))
+    old = time.time() - 120
+    os.utime(path, (old, old))
+
+    assert cache.get_disk((3, 1, 2)) is None
+    assert not os.path.exists(path)
+    assert cache.stats()["disk_expired"] == 1
+
+
+def test_invalidate_from_fresh_cache_removes_worker_tile(tmp_path):
+    """적재 명령처럼 새로 만든 TileCache 에서 지워도 워커가 쓰던 디스크 타일이 지워짐"""
+    worker = TileCache(str(tmp_path), 1, 100, 60, 10)
+    seoul, busan = (10, 873, 396), (10, 897, 405)
+    worker.store(seoul, b"seoul", worker.generation)
+    worker.store(busan, b"busan", worker.generation)
+
+    TileCache(str(tmp_path), 1, 100, 60, 10).invalidate_points([(37.5665, 126.978)])
+
+    restarted = TileCache(str(tmp_path), 1, 100, 60, 10)
+    assert restarted.get_disk(seoul) is None
+    assert restarted.get_disk(busan) == b"busan"
+
+
+def test_unrelated_tiles_survive_invalidation(tmp_path):
+    """시설 변경은 해당 좌표 타일만 지우고 나머지 캐시 키는 그대로 유지"""
+    cache = TileCache(str(tmp_path), 1, 100, 60, 10)
+    busan = (10, 897, 405)
+    cache.store(busan, b"busan", cache.generation)
+    for _ in range(3):
+        cache.invalidate_points([(37.5665, 126.978)])
+
+    assert cache.get_memory(busan) == b"busan"
+    assert os.path.exists(cache._path(busan))